@@ -0,0 +1,76 @@
+from concurrent.futures import Future, ThreadPoolExecutor
+import numpy
+from environment import Environment
+
+
+class AsyncEnvironment:
+    def __init__(
+        self,
+        gameDimensions: list[int],
+        numberOfGames: int,
+        observationDtype: numpy.dtype = numpy.uint8,
+        seed: int | numpy.random.SeedSequence | None = None,
+    ) -> None:
+        self.gameDimensions: list[int] = gameDimensions
+        self.numberOfGames: int = numberOfGames
+        self.environment: Environment = Environment(
+            self.gameDimensions,
+            self.numberOfGames,
+            endedGameMode="reset",
+            observationDtype=observationDtype,
+            seed=seed,
+        )
+
+        # The learner reads one buffer while the worker thread steps into the other.
+        self.observationBuffers: list[numpy.ndarray] = [
+            numpy.zeros_like(self.environment.stateSpace),
+            numpy.zeros_like(self.environment.stateSpace),
+        ]
+        self.bufferIndex: int = 0
+        self.executor: ThreadPoolExecutor = ThreadPoolExecutor(max_workers=1)
+        self.pendingStep: Future | None = None
+
+    def reset(self) -> numpy.ndarray:
+        if self.pendingStep is not None:
+            self.stepWait()
+
+        self.environment.reset()
+        return self.environment.writeObservation(
+            self.observationBuffers[self.bufferIndex]
+        )
+
+    def stepAsync(self, moves: numpy.ndarray) -> None:
+        if self.pendingStep is not None:
+            raise Exception(
+                "Tried to start a step while the previous step has not been waited on!"
+            )
+
+        self.bufferIndex ^= 1
+        self.pendingStep = self.executor.submit(
+            self.environment.update,
+            numpy.array(moves),
+            out=self.observationBuffers[self.bufferIndex],
+        )
+
+    def stepWait(self) -> tuple[numpy.ndarray, numpy.ndarray, numpy.ndarray]:
+        if self.pendingStep is None:
+            raise Exception("Tried to wait on a step that was never started!")
+
+        gameEndMask, snakeHitFoodMask, _ = self.pendingStep.result()
+        self.pendingStep = None
+        return self.observationBuffers[self.bufferIndex], gameEndMask, snakeHitFoodMask
+
+    def step(
+        self, moves: numpy.ndarray
+    ) -> tuple[numpy.ndarray, numpy.ndarray, numpy.ndarray]:
+        self.stepAsync(moves)
+        return self.stepWait()
+
+    def close(self) -> None:
+        self.executor.shutdown(wait=True)
+
+    def __enter__(self) -> "AsyncEnvironment":
+        return self
+
+    def __exit__(self, *_) -> None:
+        self.close()
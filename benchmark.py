@@ -0,0 +1,156 @@
+import argparse
+import copy
+import json
+import sys
+import time
+import tracemalloc
+from typing import Callable
+import numpy
+from environment import Environment
+
+SNAKE_LENGTH_REGIMES = ("short", "long")
+
+
+def createEnvironment(
+    gameDimensions: list[int], numberOfGames: int, regime: str, seed: int
+) -> Environment:
+    environment: Environment = Environment(
+        gameDimensions, numberOfGames, endedGameMode="reset", seed=seed
+    )
+    if regime == "long":
+        environment.snake.placeLongSnakes(0.9)
+        environment.renderStateSpace()
+    return environment
+
+
+def timeCall(
+    function: Callable[[], object],
+    repeats: int,
+    setup: Callable[[], object] | None = None,
+) -> tuple[float, int]:
+    timings: list[float] = []
+    for _ in range(repeats):
+        if setup is not None:
+            setup()
+        start: float = time.perf_counter()
+        function()
+        timings.append(time.perf_counter() - start)
+
+    if setup is not None:
+        setup()
+    tracemalloc.start()
+    function()
+    _, peakMemory = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    return float(numpy.median(timings)), peakMemory
+
+
+def benchmarkCase(
+    gameDimensions: list[int],
+    numberOfGames: int,
+    regime: str,
+    repeats: int,
+    seed: int,
+) -> list[dict]:
+    environment: Environment = createEnvironment(
+        gameDimensions, numberOfGames, regime, seed
+    )
+    initialState: Environment = copy.deepcopy(environment)
+
+    def restoreState() -> None:
+        environment.__dict__.update(copy.deepcopy(initialState).__dict__)
+
+    randomGenerator: numpy.random.Generator = numpy.random.default_rng(seed)
+    moves: numpy.ndarray = randomGenerator.integers(4, size=numberOfGames)
+    snakeHitFoodMask: numpy.ndarray = numpy.ones((numberOfGames), dtype=bool)
+    nextSnakePositions: numpy.ndarray = environment.snake.generateNextSnakePosition(
+        moves
+    )
+
+    operations: dict[str, tuple[Callable[[], object], Callable[[], object] | None]] = {
+        "update": (lambda: environment.update(moves), restoreState),
+        "reset": (environment.reset, None),
+        "generateCoordinatesFromMask": (
+            lambda: environment.snake.generateCoordinatesFromMask(snakeHitFoodMask),
+            restoreState,
+        ),
+        "findSnakeHitSelf": (
+            lambda: environment.snake.findSnakeHitSelf(nextSnakePositions),
+            restoreState,
+        ),
+    }
+
+    results: list[dict] = []
+    for operation, (function, setup) in operations.items():
+        seconds, peakMemory = timeCall(function, repeats, setup)
+        results.append(
+            {
+                "operation": operation,
+                "gameDimensions": gameDimensions,
+                "numberOfGames": numberOfGames,
+                "regime": regime,
+                "repeats": repeats,
+                "medianSeconds": seconds,
+                "gamesPerSecond": numberOfGames / seconds if seconds > 0 else None,
+                "peakMemoryBytes": peakMemory,
+            }
+        )
+    return results
+
+
+def parseArguments(arguments: list[str]) -> argparse.Namespace:
+    parser: argparse.ArgumentParser = argparse.ArgumentParser(
+        description="Measure snake environment throughput and peak memory."
+    )
+    parser.add_argument(
+        "--boardSizes", type=int, nargs="+", default=[8, 16, 32, 64, 128]
+    )
+    parser.add_argument(
+        "--numberOfGames", type=int, nargs="+", default=[1, 64, 1024, 16384, 65536]
+    )
+    parser.add_argument(
+        "--regimes",
+        nargs="+",
+        choices=SNAKE_LENGTH_REGIMES,
+        default=SNAKE_LENGTH_REGIMES,
+    )
+    parser.add_argument("--repeats", type=int, default=10)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument(
+        "--maxCells",
+        type=int,
+        default=2**26,
+        help="Skip cases where numberOfGames x board cells exceeds this.",
+    )
+    parser.add_argument(
+        "--output", type=str, default=None, help="JSON lines file, stdout if unset."
+    )
+    return parser.parse_args(arguments)
+
+
+def main(arguments: list[str]) -> None:
+    parsedArguments: argparse.Namespace = parseArguments(arguments)
+    output = open(parsedArguments.output, "w") if parsedArguments.output else sys.stdout
+
+    for boardSize in parsedArguments.boardSizes:
+        for numberOfGames in parsedArguments.numberOfGames:
+            if numberOfGames * boardSize * boardSize > parsedArguments.maxCells:
+                continue
+            for regime in parsedArguments.regimes:
+                for result in benchmarkCase(
+                    [boardSize, boardSize],
+                    numberOfGames,
+                    regime,
+                    parsedArguments.repeats,
+                    parsedArguments.seed,
+                ):
+                    output.write(json.dumps(result) + "\n")
+                    output.flush()
+
+    if output is not sys.stdout:
+        output.close()
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
@@ -0,0 +1,311 @@
+import numpy
+from environment import Environment
+from snake import DIRECTIONS, generateAllPossibleCoordinates, generateWallCells
+
+# Body segments per byte of the direction ring, each stored as a 2 bit index into DIRECTIONS
+DIRECTIONS_PER_BYTE = 4
+
+# (row step + 1) * 3 + (column step + 1) to the index of that step in DIRECTIONS
+DIRECTION_LOOKUP = numpy.full((9), -1, dtype=numpy.int8)
+DIRECTION_LOOKUP[(DIRECTIONS[:, 0] + 1) * 3 + DIRECTIONS[:, 1] + 1] = numpy.arange(
+    len(DIRECTIONS)
+)
+
+
+def getPackedBits(
+    packedBits: numpy.ndarray, gameIndicies: numpy.ndarray, cellIndicies: numpy.ndarray
+) -> numpy.ndarray:
+    return (packedBits[gameIndicies, cellIndicies >> 3] >> (cellIndicies & 7)) & 1 == 1
+
+
+def setPackedBits(
+    packedBits: numpy.ndarray, gameIndicies: numpy.ndarray, cellIndicies: numpy.ndarray
+) -> None:
+    numpy.bitwise_or.at(
+        packedBits,
+        (gameIndicies, cellIndicies >> 3),
+        (1 << (cellIndicies & 7)).astype(numpy.uint8),
+    )
+
+
+def clearPackedBits(
+    packedBits: numpy.ndarray, gameIndicies: numpy.ndarray, cellIndicies: numpy.ndarray
+) -> None:
+    numpy.bitwise_and.at(
+        packedBits,
+        (gameIndicies, cellIndicies >> 3),
+        ~(1 << (cellIndicies & 7)).astype(numpy.uint8),
+    )
+
+
+def readPackedDirections(
+    packedDirections: numpy.ndarray,
+    gameIndicies: numpy.ndarray,
+    ringIndicies: numpy.ndarray,
+) -> numpy.ndarray:
+    return (
+        packedDirections[gameIndicies, ringIndicies >> 2] >> ((ringIndicies & 3) * 2)
+    ) & 3
+
+
+def writePackedDirections(
+    packedDirections: numpy.ndarray,
+    gameIndicies: numpy.ndarray,
+    ringIndicies: numpy.ndarray,
+    directions: numpy.ndarray,
+) -> None:
+    shifts: numpy.ndarray = (ringIndicies & 3) * 2
+    numpy.bitwise_and.at(
+        packedDirections,
+        (gameIndicies, ringIndicies >> 2),
+        ~(3 << shifts).astype(numpy.uint8),
+    )
+    numpy.bitwise_or.at(
+        packedDirections,
+        (gameIndicies, ringIndicies >> 2),
+        (numpy.asarray(directions, dtype=numpy.uint8) << shifts).astype(numpy.uint8),
+    )
+
+
+class CompactEnvironment:
+    def __init__(
+        self,
+        gameDimensions: list[int],
+        numberOfGames: int,
+        seed: int | numpy.random.SeedSequence | None = None,
+    ) -> None:
+        self.gameDimensions: list[int] = gameDimensions
+        self.numberOfGames: int = numberOfGames
+        self.numberOfCells: int = gameDimensions[1] * gameDimensions[0]
+        self.possibleCoordinates: numpy.ndarray = generateAllPossibleCoordinates(
+            self.gameDimensions
+        )
+        self.possibleCellIndicies: numpy.ndarray = (
+            self.possibleCoordinates[:, 0] * gameDimensions[0]
+            + self.possibleCoordinates[:, 1]
+        )
+
+        # The ring holds one direction per body segment behind the head, and a move
+        # pushes before the tail pops, so it needs room for every interior cell.
+        self.directionCapacity: int = (
+            -(-self.possibleCoordinates.shape[0] // DIRECTIONS_PER_BYTE)
+            * DIRECTIONS_PER_BYTE
+        )
+
+        self.randomGenerator: numpy.random.Generator = numpy.random.default_rng(seed)
+        self.reset()
+
+    def reset(self) -> None:
+        self.occupancyBits: numpy.ndarray = numpy.zeros(
+            (self.numberOfGames, -(-self.numberOfCells // 8)), dtype=numpy.uint8
+        )
+        self.bodyDirections: numpy.ndarray = numpy.zeros(
+            (self.numberOfGames, self.directionCapacity // DIRECTIONS_PER_BYTE),
+            dtype=numpy.uint8,
+        )
+        self.headLocation: numpy.ndarray = numpy.zeros(
+            (self.numberOfGames, 2), dtype=numpy.int16
+        )
+        self.tailLocation: numpy.ndarray = numpy.zeros(
+            (self.numberOfGames, 2), dtype=numpy.int16
+        )
+        self.foodLocation: numpy.ndarray = numpy.zeros(
+            (self.numberOfGames, 2), dtype=numpy.int16
+        )
+        self.directionReadIndex: numpy.ndarray = numpy.zeros(
+            (self.numberOfGames), dtype=numpy.int32
+        )
+        self.directionWriteIndex: numpy.ndarray = numpy.zeros(
+            (self.numberOfGames), dtype=numpy.int32
+        )
+        self.resetGames(numpy.arange(self.numberOfGames))
+
+    def resetGames(self, gameIndicies: numpy.ndarray) -> None:
+        # Same draws as Snake.generateCoordinatesOnReset, so a compact and a dense
+        # environment sharing a generator state stay in lockstep.
+        numberOfCoordinates: int = self.possibleCoordinates.shape[0]
+        foodCoordinates: numpy.ndarray = self.randomGenerator.integers(
+            numberOfCoordinates, size=gameIndicies.shape[0]
+        )
+        headCoordinates: numpy.ndarray = self.randomGenerator.integers(
+            numberOfCoordinates - 1, size=gameIndicies.shape[0]
+        )
+        headCoordinates += headCoordinates >= foodCoordinates
+
+        self.foodLocation[gameIndicies] = self.possibleCoordinates[foodCoordinates]
+        self.headLocation[gameIndicies] = self.possibleCoordinates[headCoordinates]
+        self.tailLocation[gameIndicies] = self.headLocation[gameIndicies]
+        self.directionReadIndex[gameIndicies] = 0
+        self.directionWriteIndex[gameIndicies] = 0
+
+        self.occupancyBits[gameIndicies] = 0
+        setPackedBits(
+            self.occupancyBits,
+            gameIndicies,
+            self.possibleCellIndicies[headCoordinates],
+        )
+
+    def getCellIndicies(self, locations: numpy.ndarray) -> numpy.ndarray:
+        return locations[:, 0].astype(numpy.int64) * self.gameDimensions[0] + locations[
+            :, 1
+        ].astype(numpy.int64)
+
+    def getSnakeLength(self) -> numpy.ndarray:
+        return (
+            self.directionWriteIndex - self.directionReadIndex
+        ) % self.directionCapacity + 1
+
+    def unpackOccupancy(self, gameIndicies: numpy.ndarray) -> numpy.ndarray:
+        return numpy.unpackbits(
+            self.occupancyBits[gameIndicies], axis=-1, bitorder="little"
+        )[:, : self.numberOfCells].astype(bool)
+
+    def update(self, moves: numpy.ndarray) -> tuple[numpy.ndarray, numpy.ndarray, bool]:
+        moves = numpy.asarray(moves)
+        indicies: numpy.ndarray = numpy.arange(self.numberOfGames)
+        nextSnakePosition: numpy.ndarray = self.headLocation + DIRECTIONS[moves]
+        nextCellIndicies: numpy.ndarray = self.getCellIndicies(nextSnakePosition)
+
+        snakeHitWallMask: numpy.ndarray = (
+            nextSnakePosition % [self.gameDimensions[1] - 1, self.gameDimensions[0] - 1]
+            == 0
+        ).any(-1)
+        gameEndMask: numpy.ndarray = snakeHitWallMask | getPackedBits(
+            self.occupancyBits, indicies, nextCellIndicies
+        )
+        snakeHitFoodMask: numpy.ndarray = (nextSnakePosition == self.foodLocation).all(
+            -1
+        )
+
+        writePackedDirections(
+            self.bodyDirections, indicies, self.directionWriteIndex, moves
+        )
+        self.directionWriteIndex += 1
+        self.directionWriteIndex %= self.directionCapacity
+
+        hitNothingIndicies: numpy.ndarray = numpy.where(~snakeHitFoodMask)[0]
+        clearPackedBits(
+            self.occupancyBits,
+            hitNothingIndicies,
+            self.getCellIndicies(self.tailLocation[hitNothingIndicies]),
+        )
+        tailDirections: numpy.ndarray = readPackedDirections(
+            self.bodyDirections,
+            hitNothingIndicies,
+            self.directionReadIndex[hitNothingIndicies],
+        )
+        self.tailLocation[hitNothingIndicies] += DIRECTIONS[tailDirections]
+        self.directionReadIndex[hitNothingIndicies] += 1
+        self.directionReadIndex %= self.directionCapacity
+
+        self.headLocation[:] = nextSnakePosition
+        setPackedBits(self.occupancyBits, indicies, nextCellIndicies)
+
+        self.generateFoodLocations(snakeHitFoodMask)
+        if gameEndMask.any():
+            self.resetGames(numpy.where(gameEndMask)[0])
+
+        return gameEndMask, snakeHitFoodMask, False
+
+    def generateFoodLocations(self, snakeHitFoodMask: numpy.ndarray) -> None:
+        gameIndicies: numpy.ndarray = numpy.where(snakeHitFoodMask)[0]
+        freeCoordinateMask: numpy.ndarray = ~self.unpackOccupancy(gameIndicies)[
+            :, self.possibleCellIndicies
+        ]
+
+        randomKeys: numpy.ndarray = self.randomGenerator.random(
+            freeCoordinateMask.shape, dtype=numpy.float32
+        )
+        randomKeys[~freeCoordinateMask] = -1
+        selectedCoordinates: numpy.ndarray = randomKeys.argmax(-1)
+
+        hasFreeCoordinate: numpy.ndarray = freeCoordinateMask.any(-1)
+        self.foodLocation[gameIndicies[hasFreeCoordinate]] = self.possibleCoordinates[
+            selectedCoordinates[hasFreeCoordinate]
+        ]
+
+    def getStateSpace(
+        self,
+        gameIndicies: numpy.ndarray | None = None,
+        out: numpy.ndarray | None = None,
+    ) -> numpy.ndarray:
+        if gameIndicies is None:
+            gameIndicies = numpy.arange(self.numberOfGames)
+        if out is None:
+            out = numpy.empty(
+                (gameIndicies.shape[0], self.gameDimensions[1], self.gameDimensions[0]),
+                dtype=numpy.uint8,
+            )
+
+        out[:] = 1
+        out[:, 1:-1, 1:-1] = 0
+        numpy.copyto(
+            out,
+            2,
+            where=self.unpackOccupancy(gameIndicies).reshape(out.shape),
+        )
+        out[
+            numpy.arange(gameIndicies.shape[0]),
+            self.foodLocation[gameIndicies, 0],
+            self.foodLocation[gameIndicies, 1],
+        ] = 3
+        return out
+
+    @classmethod
+    def fromEnvironment(
+        cls,
+        environment: Environment,
+        seed: int | numpy.random.SeedSequence | None = None,
+    ) -> "CompactEnvironment":
+        snake = environment.snake
+        if (
+            len(snake.mapTemplates) > 1
+            or snake.wrapAround.any()
+            or not numpy.array_equal(
+                snake.wallCells, generateWallCells(environment.gameDimensions)
+            )
+        ):
+            raise Exception("CompactEnvironment only supports rectangular maps!")
+
+        compactEnvironment: CompactEnvironment = cls(
+            environment.gameDimensions, snake.snakeBodyLocation.shape[0], seed
+        )
+        indicies: numpy.ndarray = numpy.arange(compactEnvironment.numberOfGames)
+        bodyCapacity: int = snake.snakeBodyLocation.shape[1]
+        snakeLength: numpy.ndarray = snake.getSnakeLength()
+
+        # Body segments from the head back to the tail, then the step taken into
+        # each segment from the one behind it, oldest first as the ring pops them.
+        bodyIndicies: numpy.ndarray = (
+            snake.snakeHeadIndex[:, None] + numpy.arange(snakeLength.max())[None, :]
+        ) % bodyCapacity
+        bodyLocations: numpy.ndarray = snake.snakeBodyLocation[
+            indicies[:, None], bodyIndicies
+        ].astype(numpy.int64)
+        bodySteps: numpy.ndarray = bodyLocations[:, :-1] - bodyLocations[:, 1:]
+        bodyDirections: numpy.ndarray = DIRECTION_LOOKUP[
+            (bodySteps[..., 0] + 1) * 3 + bodySteps[..., 1] + 1
+        ]
+
+        gameIndicies, ringIndicies = numpy.nonzero(
+            numpy.arange(bodySteps.shape[1])[None, :] < snakeLength[:, None] - 1
+        )
+        writePackedDirections(
+            compactEnvironment.bodyDirections,
+            gameIndicies,
+            ringIndicies,
+            bodyDirections[gameIndicies, snakeLength[gameIndicies] - 2 - ringIndicies],
+        )
+
+        compactEnvironment.directionReadIndex[:] = 0
+        compactEnvironment.directionWriteIndex[:] = snakeLength - 1
+        compactEnvironment.headLocation[:] = bodyLocations[:, 0]
+        compactEnvironment.tailLocation[:] = bodyLocations[indicies, snakeLength - 1]
+        compactEnvironment.foodLocation[:] = snake.foodLocation
+
+        compactEnvironment.occupancyBits[:] = numpy.packbits(
+            snake.occupancyGrid.reshape(compactEnvironment.numberOfGames, -1),
+            axis=-1,
+            bitorder="little",
+        )
+        return compactEnvironment
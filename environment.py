@@ -1,50 +1,391 @@
+import warnings
 import numpy
-from snake import Snake
+from profiler import NullPhaseProfiler, PhaseProfiler
+from snake import DIRECTIONS, RELATIVE_MOVES, MapTemplate, Snake
+from step_kernel import NUMBA_AVAILABLE, compiledStepGames
+
+# remove: ended games are dropped from the batch
+# reset: ended games are restarted in place and the batch size stays fixed
+# mask: ended games stay in the batch, marked inactive and skipped by update
+ENDED_GAME_MODES = ("remove", "reset", "mask")
+
+# numpy: one vectorised NumPy pass per phase of the step
+# numba: a compiled loop over games that fuses the step, NumPy is used without numba
+BACKENDS = ("numpy", "numba")
+
+# eager: stateSpace is drawn incrementally on every step
+# lazy: stateSpace is rendered from the snake state only when it is accessed
+RENDER_MODES = ("eager", "lazy")
+
+# allow: every move is stepped as given, reversing into the neck ends the game
+# straight: reversing into the neck is converted to continuing along the heading
+REVERSE_MOVE_MODES = ("allow", "straight")
+
+# absolute: moves are DIRECTIONS indicies
+# relative: moves are RELATIVE_TURNS indicies, turning left, straight or right
+ACTION_SPACES = ("absolute", "relative")
+
+# Empty, Wall, Snake, Food
+NUMBER_OF_CELL_TYPES = 4
+
+# Head row, head column, food row, food column, snake length
+NUMBER_OF_FEATURES = 5
+
+
+def generateWindowOffsets(windowSize: int) -> numpy.ndarray:
+    # Board offsets of every window cell per heading, with the heading as window up.
+    windowRange: numpy.ndarray = numpy.arange(windowSize) - windowSize // 2
+    windowOffsets: list[numpy.ndarray] = [
+        numpy.stack(numpy.meshgrid(windowRange, windowRange, indexing="ij"), -1)
+    ]
+    for _ in range(len(DIRECTIONS) - 1):
+        # A quarter turn clockwise maps a row and column offset (r, c) to (c, -r).
+        windowOffsets.append(
+            numpy.stack((windowOffsets[-1][..., 1], -windowOffsets[-1][..., 0]), -1)
+        )
+    return numpy.stack(windowOffsets)
 
 
 class Environment:
-    def __init__(self, gameDimensions: list[int], numberOfGames: int) -> None:
+    def __init__(
+        self,
+        gameDimensions: list[int],
+        numberOfGames: int,
+        endedGameMode: str = "remove",
+        observationDtype: numpy.dtype = numpy.uint8,
+        seed: int | numpy.random.SeedSequence | None = None,
+        profile: bool = False,
+        backend: str = "numpy",
+        renderMode: str = "eager",
+        mapTemplate: MapTemplate | list[MapTemplate] | None = None,
+        templateIndicies: numpy.ndarray | None = None,
+        reverseMoveMode: str = "allow",
+        actionSpace: str = "absolute",
+    ) -> None:
+        if endedGameMode not in ENDED_GAME_MODES:
+            raise Exception(
+                f"Unknown endedGameMode: {endedGameMode}, expected one of {ENDED_GAME_MODES}!"
+            )
+        if backend not in BACKENDS:
+            raise Exception(f"Unknown backend: {backend}, expected one of {BACKENDS}!")
+        if renderMode not in RENDER_MODES:
+            raise Exception(
+                f"Unknown renderMode: {renderMode}, expected one of {RENDER_MODES}!"
+            )
+        if reverseMoveMode not in REVERSE_MOVE_MODES:
+            raise Exception(
+                f"Unknown reverseMoveMode: {reverseMoveMode}, expected one of {REVERSE_MOVE_MODES}!"
+            )
+        if actionSpace not in ACTION_SPACES:
+            raise Exception(
+                f"Unknown actionSpace: {actionSpace}, expected one of {ACTION_SPACES}!"
+            )
+        if backend == "numba" and not NUMBA_AVAILABLE:
+            warnings.warn("numba is not installed, falling back to the numpy backend")
+            backend = "numpy"
+
         self.gameDimensions: list[int] = gameDimensions
         self.numberOfGames: int = numberOfGames
-        self.snake: Snake = Snake(self.gameDimensions, self.numberOfGames)
+        self.endedGameMode: str = endedGameMode
+        self.backend: str = backend
+        self.renderMode: str = renderMode
+        self.reverseMoveMode: str = reverseMoveMode
+        self.actionSpace: str = actionSpace
+        self.numberOfActions: int = (
+            len(DIRECTIONS) if actionSpace == "absolute" else RELATIVE_MOVES.shape[1]
+        )
+        self.observationDtype: numpy.dtype = numpy.dtype(observationDtype)
+        self.profiler: PhaseProfiler = (
+            PhaseProfiler() if profile else NullPhaseProfiler()
+        )
+        self.snake: Snake = Snake(
+            self.gameDimensions,
+            self.numberOfGames,
+            seed,
+            mapTemplate,
+            templateIndicies,
+        )
         self.reset()
 
     def reset(self) -> None:
         self.snake.resetGameState()
-        self.stateSpace: numpy.ndarray = numpy.ones(
+        self.stateSpace: numpy.ndarray = numpy.empty(
             (self.numberOfGames, self.gameDimensions[1], self.gameDimensions[0]),
-            dtype=int,
+            dtype=self.observationDtype,
         )
-        self.stateSpace[:, 1:-1, 1:-1] = 0
-        self.drawInitialSnake()
-        self.updateFoodLocation()
+        self.stateSpace[:] = self.snake.getWallGrid()
+        self.activeGames: numpy.ndarray = numpy.ones((self.numberOfGames), dtype=bool)
+        self.gameIndicies: numpy.ndarray = numpy.arange(self.numberOfGames)
+        self.stateSpaceIsStale: bool = self.renderMode == "lazy"
+        if self.renderMode == "eager":
+            self.drawInitialSnake()
+            self.updateFoodLocation()
+
+    @property
+    def stateSpace(self) -> numpy.ndarray:
+        if self.stateSpaceIsStale:
+            self.renderStateSpace()
+        return self.renderedStateSpace
+
+    @stateSpace.setter
+    def stateSpace(self, stateSpace: numpy.ndarray) -> None:
+        self.renderedStateSpace: numpy.ndarray = stateSpace
+        self.stateSpaceIsStale = False
+
+    def renderStateSpace(self) -> None:
+        self.renderedStateSpace[:] = self.snake.getWallGrid()
+        numpy.copyto(self.renderedStateSpace, 2, where=self.snake.occupancyGrid)
+        self.renderedStateSpace[
+            numpy.arange(self.renderedStateSpace.shape[0]),
+            self.snake.foodLocation[:, 0],
+            self.snake.foodLocation[:, 1],
+        ] = 3
+        self.stateSpaceIsStale = False
+
+    def getFeatureObservation(self) -> numpy.ndarray:
+        return numpy.concatenate(
+            (
+                self.snake.getSnakeHeadLocation(),
+                self.snake.foodLocation,
+                self.snake.getSnakeLength()[:, None],
+            ),
+            axis=-1,
+            dtype=numpy.int16,
+        )
+
+    def getLegalMoveMask(self, out: numpy.ndarray | None = None) -> numpy.ndarray:
+        legalMoveMask: numpy.ndarray = self.snake.getLegalMoveMask()
+        if self.reverseMoveMode == "straight":
+            # A reverse move is stepped as the straight one, so it is as legal.
+            indicies: numpy.ndarray = numpy.where(
+                self.snake.currentBodyEndIndex != self.snake.snakeHeadIndex
+            )[0]
+            snakeHeading: numpy.ndarray = self.snake.snakeHeading[indicies]
+            legalMoveMask[indicies, (snakeHeading + 2) % len(DIRECTIONS)] = (
+                legalMoveMask[indicies, snakeHeading]
+            )
+        if self.actionSpace == "relative":
+            legalMoveMask = legalMoveMask[
+                numpy.arange(legalMoveMask.shape[0])[:, None],
+                RELATIVE_MOVES[self.snake.snakeHeading],
+            ]
+        if out is None:
+            return legalMoveMask
+        numpy.copyto(out, legalMoveMask)
+        return out
+
+    def getEgocentricObservation(
+        self,
+        windowSize: int,
+        rotate: bool = False,
+        out: numpy.ndarray | None = None,
+    ) -> numpy.ndarray:
+        if windowSize % 2 == 0:
+            raise Exception(f"windowSize must be odd, got: {windowSize}!")
+
+        stateSpace: numpy.ndarray = numpy.ascontiguousarray(self.stateSpace)
+        numberOfGames, numberOfRows, numberOfColumns = stateSpace.shape
+        windowOffsets: numpy.ndarray = generateWindowOffsets(windowSize)
+        if rotate:
+            windowOffsets = windowOffsets[self.snake.snakeHeading]
+        else:
+            windowOffsets = windowOffsets[:1]
+
+        snakeHeadLocation: numpy.ndarray = self.snake.getSnakeHeadLocation()
+        windowRows: numpy.ndarray = (
+            snakeHeadLocation[:, 0, None, None] + windowOffsets[..., 0]
+        )
+        windowColumns: numpy.ndarray = (
+            snakeHeadLocation[:, 1, None, None] + windowOffsets[..., 1]
+        )
+        templateIndicies: numpy.ndarray = self.snake.templateIndicies
+        wrapAround: numpy.ndarray = self.snake.wrapAround[templateIndicies]
+        if wrapAround.any():
+            templateShapes: numpy.ndarray = self.snake.templateShapes[templateIndicies]
+            windowRows = numpy.where(
+                wrapAround[:, None, None],
+                windowRows % templateShapes[:, 0, None, None],
+                windowRows,
+            )
+            windowColumns = numpy.where(
+                wrapAround[:, None, None],
+                windowColumns % templateShapes[:, 1, None, None],
+                windowColumns,
+            )
+        outsideBoard: numpy.ndarray = (
+            (windowRows < 0)
+            | (windowRows >= numberOfRows)
+            | (windowColumns < 0)
+            | (windowColumns >= numberOfColumns)
+        )
+
+        # One gather from the flat boards, cells past the edge read as wall.
+        flatIndicies: numpy.ndarray = (
+            numpy.arange(numberOfGames)[:, None, None] * numberOfRows
+            + numpy.clip(windowRows, 0, numberOfRows - 1)
+        ) * numberOfColumns + numpy.clip(windowColumns, 0, numberOfColumns - 1)
+
+        if out is None:
+            out = numpy.empty(flatIndicies.shape, dtype=stateSpace.dtype)
+        numpy.take(stateSpace.reshape(-1), flatIndicies, out=out)
+        numpy.copyto(out, 1, where=outsideBoard)
+        return out
+
+    def resetGames(self, gameIndicies: numpy.ndarray) -> None:
+        self.snake.resetGameState(gameIndicies)
+        self.activeGames[gameIndicies] = True
+        if self.renderMode == "lazy":
+            self.stateSpaceIsStale = True
+            return
+
+        self.stateSpace[gameIndicies] = self.snake.getWallGrid(gameIndicies)
+
+        snakeHeadLocation: numpy.ndarray = self.snake.getSnakeHeadLocation()
+        self.stateSpace[
+            gameIndicies,
+            snakeHeadLocation[gameIndicies, 0],
+            snakeHeadLocation[gameIndicies, 1],
+        ] = 2
+        self.stateSpace[
+            gameIndicies,
+            self.snake.foodLocation[gameIndicies, 0],
+            self.snake.foodLocation[gameIndicies, 1],
+        ] = 3
 
     def drawInitialSnake(self) -> None:
         indicies: numpy.ndarray = numpy.arange(self.stateSpace.shape[0])
+        snakeHeadLocation: numpy.ndarray = self.snake.getSnakeHeadLocation()
         self.stateSpace[
             indicies,
-            self.snake.snakeBodyLocation[indicies, 0, 0],
-            self.snake.snakeBodyLocation[indicies, 0, 1],
+            snakeHeadLocation[:, 0],
+            snakeHeadLocation[:, 1],
         ] = 2
 
-    def update(self, moves: list[int]) -> tuple[numpy.ndarray, numpy.ndarray, bool]:
+    def writeObservation(self, out: numpy.ndarray) -> numpy.ndarray:
+        if out.ndim == 4:
+            for cellType in range(NUMBER_OF_CELL_TYPES):
+                numpy.equal(self.stateSpace, cellType, out=out[:, cellType])
+        elif numpy.issubdtype(out.dtype, numpy.floating):
+            numpy.multiply(self.stateSpace, 1 / (NUMBER_OF_CELL_TYPES - 1), out=out)
+        else:
+            numpy.copyto(out, self.stateSpace)
+        return out
+
+    def stepGames(self, moves: list[int]) -> tuple[numpy.ndarray, numpy.ndarray]:
+        phaseStart: float = self.profiler.start()
         nextSnakePositions: numpy.ndarray = self.snake.generateNextSnakePosition(moves)
+        activeGameMask: numpy.ndarray | None = None
+        if self.endedGameMode == "mask":
+            activeGameMask = self.activeGames
+            nextSnakePositions[~activeGameMask, 0] = self.snake.getSnakeHeadLocation()[
+                ~activeGameMask
+            ]
+        phaseStart = self.profiler.record("generateNextSnakePosition", phaseStart)
+
         gameEndMask, snakeHitFoodMask = self.snake.generateMasks(nextSnakePositions)
+        if activeGameMask is not None:
+            gameEndMask &= activeGameMask
+            snakeHitFoodMask &= activeGameMask
+        phaseStart = self.profiler.record("generateMasks", phaseStart)
 
-        self.removeFromStateSpace(snakeHitFoodMask)
+        if self.renderMode == "eager" and activeGameMask is not None:
+            self.removeFromStateSpace(snakeHitFoodMask | ~activeGameMask)
+        elif self.renderMode == "eager":
+            self.removeFromStateSpace(snakeHitFoodMask)
+        phaseStart = self.profiler.record("removeFromStateSpace", phaseStart)
 
-        self.snake.updateSnakeBodyCoordinates(nextSnakePositions, snakeHitFoodMask)
+        self.snake.updateSnakeBodyCoordinates(
+            nextSnakePositions, snakeHitFoodMask, activeGameMask
+        )
+        phaseStart = self.profiler.record("updateSnakeBodyCoordinates", phaseStart)
+
+        if self.renderMode == "eager":
+            self.updateStateSpace()
+        self.profiler.record("updateStateSpace", phaseStart)
+        return gameEndMask, snakeHitFoodMask
+
+    def stepGamesCompiled(
+        self, moves: list[int]
+    ) -> tuple[numpy.ndarray, numpy.ndarray]:
+        numberOfGames: int = self.activeGames.shape[0]
+        gameEndMask: numpy.ndarray = numpy.empty((numberOfGames), dtype=bool)
+        snakeHitFoodMask: numpy.ndarray = numpy.empty((numberOfGames), dtype=bool)
+        compiledStepGames(
+            self.snake.snakeBodyLocation,
+            self.snake.snakeHeadIndex,
+            self.snake.currentBodyEndIndex,
+            self.snake.occupancyGrid,
+            self.snake.foodLocation,
+            self.renderedStateSpace,
+            self.renderMode == "eager",
+            numpy.asarray(moves, dtype=numpy.int64),
+            self.activeGames,
+            self.snake.templateIndicies,
+            self.snake.nextCellTable,
+            self.snake.wallCells,
+            gameEndMask,
+            snakeHitFoodMask,
+        )
+        return gameEndMask, snakeHitFoodMask
+
+    def update(
+        self,
+        moves: list[int],
+        out: numpy.ndarray | None = None,
+        finalOut: numpy.ndarray | None = None,
+    ) -> tuple[numpy.ndarray, numpy.ndarray, bool]:
+        phaseStart: float = self.profiler.start()
+        if self.actionSpace == "relative":
+            moves = self.snake.convertRelativeMoves(moves)
+        if self.reverseMoveMode == "straight":
+            moves = self.snake.convertReverseMoves(moves)
+        phaseStart = self.profiler.record("convertMoves", phaseStart)
+
+        if self.backend == "numba":
+            gameEndMask, snakeHitFoodMask = self.stepGamesCompiled(moves)
+            phaseStart = self.profiler.record("stepGamesCompiled", phaseStart)
+        else:
+            gameEndMask, snakeHitFoodMask = self.stepGames(moves)
+            phaseStart = self.profiler.start()
+
+        self.snake.updateSnakeHeading(
+            moves, self.activeGames if self.endedGameMode == "mask" else None
+        )
+        phaseStart = self.profiler.record("updateSnakeHeading", phaseStart)
 
         if snakeHitFoodMask.any():
             self.snake.generateCoordinatesFromMask(snakeHitFoodMask)
-            self.updateFoodLocation(snakeHitFoodMask)
-        self.updateStateSpace()
+            if self.renderMode == "eager":
+                self.updateFoodLocation(snakeHitFoodMask)
+        phaseStart = self.profiler.record("generateCoordinatesFromMask", phaseStart)
+
+        # Boards of ended games are kept before they are reset or removed.
+        if finalOut is not None and gameEndMask.any():
+            endedGameIndicies: numpy.ndarray = numpy.where(gameEndMask)[0]
+            finalOut[endedGameIndicies] = self.stateSpace[endedGameIndicies]
+        if self.endedGameMode == "remove" and 0 < gameEndMask.sum() < len(gameEndMask):
+            self.removeEndedGames(gameEndMask)
+        elif self.endedGameMode == "reset" and gameEndMask.any():
+            self.resetGames(numpy.where(gameEndMask)[0])
+        elif self.endedGameMode == "mask":
+            self.activeGames &= ~gameEndMask
+        self.stateSpaceIsStale = self.renderMode == "lazy"
+        phaseStart = self.profiler.record("handleEndedGames", phaseStart)
+
+        if out is not None:
+            self.writeObservation(out)
+            self.profiler.record("writeObservation", phaseStart)
+
+        self.profiler.count("foodRespawns", snakeHitFoodMask)
+        self.profiler.count("terminations", gameEndMask)
+
+        if self.endedGameMode == "reset":
+            return gameEndMask, snakeHitFoodMask, False
 
-        if gameEndMask.all():
-            return gameEndMask, snakeHitFoodMask, True
+        if self.endedGameMode == "mask":
+            return gameEndMask, snakeHitFoodMask, not self.activeGames.any()
 
-        self.removeEndedGames(gameEndMask)
-        return gameEndMask, snakeHitFoodMask, False
+        return gameEndMask, snakeHitFoodMask, bool(gameEndMask.all())
 
     def updateFoodLocation(self, snakeHitFoodMask: numpy.ndarray | None = None) -> None:
         if type(snakeHitFoodMask) == numpy.ndarray:
@@ -76,14 +417,23 @@ class Environment:
 
     def updateStateSpace(self) -> None:
         indiciesForSnake: numpy.ndarray = numpy.arange(self.stateSpace.shape[0])
+        snakeHeadLocation: numpy.ndarray = self.snake.getSnakeHeadLocation()
         self.stateSpace[
             indiciesForSnake,
-            self.snake.snakeBodyLocation[indiciesForSnake, 0, 0],
-            self.snake.snakeBodyLocation[indiciesForSnake, 0, 1],
+            snakeHeadLocation[:, 0],
+            snakeHeadLocation[:, 1],
         ] = 2
 
     def removeEndedGames(self, gameEndMask: numpy.ndarray) -> None:
-        self.stateSpace = self.stateSpace[~gameEndMask]
+        stateSpaceIsStale: bool = self.stateSpaceIsStale
+        self.stateSpace = self.renderedStateSpace[~gameEndMask]
+        self.stateSpaceIsStale = stateSpaceIsStale
+        self.activeGames = self.activeGames[~gameEndMask]
+        self.gameIndicies = self.gameIndicies[~gameEndMask]
         self.snake.snakeBodyLocation = self.snake.snakeBodyLocation[~gameEndMask]
+        self.snake.snakeHeadIndex = self.snake.snakeHeadIndex[~gameEndMask]
+        self.snake.snakeHeading = self.snake.snakeHeading[~gameEndMask]
+        self.snake.templateIndicies = self.snake.templateIndicies[~gameEndMask]
+        self.snake.occupancyGrid = self.snake.occupancyGrid[~gameEndMask]
         self.snake.foodLocation = self.snake.foodLocation[~gameEndMask]
         self.snake.currentBodyEndIndex = self.snake.currentBodyEndIndex[~gameEndMask]
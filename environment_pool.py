@@ -0,0 +1,184 @@
+import multiprocessing
+from multiprocessing import shared_memory
+from multiprocessing.connection import Connection
+import numpy
+from environment import Environment
+
+
+def createSharedArray(
+    shape: tuple[int, ...], dtype: numpy.dtype
+) -> tuple[shared_memory.SharedMemory, numpy.ndarray]:
+    sharedMemory: shared_memory.SharedMemory = shared_memory.SharedMemory(
+        create=True, size=max(int(numpy.prod(shape)) * numpy.dtype(dtype).itemsize, 1)
+    )
+    sharedArray: numpy.ndarray = numpy.ndarray(
+        shape, dtype=dtype, buffer=sharedMemory.buf
+    )
+    return sharedMemory, sharedArray
+
+
+def attachSharedArray(
+    name: str, shape: tuple[int, ...], dtype: numpy.dtype
+) -> tuple[shared_memory.SharedMemory, numpy.ndarray]:
+    sharedMemory: shared_memory.SharedMemory = shared_memory.SharedMemory(name=name)
+    sharedArray: numpy.ndarray = numpy.ndarray(
+        shape, dtype=dtype, buffer=sharedMemory.buf
+    )
+    return sharedMemory, sharedArray
+
+
+def runEnvironmentWorker(
+    connection: Connection,
+    gameDimensions: list[int],
+    shardStart: int,
+    shardStop: int,
+    sharedArrayLayout: dict[str, tuple[str, tuple[int, ...], numpy.dtype]],
+    seedSequence: numpy.random.SeedSequence,
+) -> None:
+    sharedMemories: list[shared_memory.SharedMemory] = []
+    sharedArrays: dict[str, numpy.ndarray] = {}
+    for arrayName, (memoryName, shape, dtype) in sharedArrayLayout.items():
+        sharedMemory, sharedArray = attachSharedArray(memoryName, shape, dtype)
+        sharedMemories.append(sharedMemory)
+        sharedArrays[arrayName] = sharedArray[shardStart:shardStop]
+
+    environment: Environment = Environment(
+        gameDimensions,
+        shardStop - shardStart,
+        endedGameMode="reset",
+        observationDtype=sharedArrays["observation"].dtype,
+        seed=seedSequence,
+    )
+    environment.writeObservation(sharedArrays["observation"])
+    connection.send(True)
+
+    while True:
+        command: str = connection.recv()
+        if command == "step":
+            gameEndMask, snakeHitFoodMask, _ = environment.update(
+                sharedArrays["moves"], out=sharedArrays["observation"]
+            )
+            sharedArrays["gameEndMask"][:] = gameEndMask
+            sharedArrays["snakeHitFoodMask"][:] = snakeHitFoodMask
+        elif command == "reset":
+            environment.reset()
+            environment.writeObservation(sharedArrays["observation"])
+        elif command == "close":
+            break
+        connection.send(True)
+
+    del sharedArray, sharedArrays
+    for sharedMemory in sharedMemories:
+        sharedMemory.close()
+    connection.send(True)
+
+
+class EnvironmentPool:
+    def __init__(
+        self,
+        gameDimensions: list[int],
+        numberOfGames: int,
+        numberOfWorkers: int,
+        observationDtype: numpy.dtype = numpy.uint8,
+        seed: int | numpy.random.SeedSequence | None = None,
+    ) -> None:
+        if not 0 < numberOfWorkers <= numberOfGames:
+            raise Exception(
+                f"Cannot split {numberOfGames} games across {numberOfWorkers} workers!"
+            )
+
+        self.gameDimensions: list[int] = gameDimensions
+        self.numberOfGames: int = numberOfGames
+        self.numberOfWorkers: int = numberOfWorkers
+
+        arrayShapes: dict[str, tuple[tuple[int, ...], numpy.dtype]] = {
+            "observation": (
+                (self.numberOfGames, self.gameDimensions[1], self.gameDimensions[0]),
+                numpy.dtype(observationDtype),
+            ),
+            "moves": ((self.numberOfGames,), numpy.dtype(numpy.int8)),
+            "gameEndMask": ((self.numberOfGames,), numpy.dtype(bool)),
+            "snakeHitFoodMask": ((self.numberOfGames,), numpy.dtype(bool)),
+        }
+        self.sharedArrayNames: list[str] = list(arrayShapes)
+        self.sharedMemories: list[shared_memory.SharedMemory] = []
+        sharedArrayLayout: dict[str, tuple[str, tuple[int, ...], numpy.dtype]] = {}
+        for arrayName, (shape, dtype) in arrayShapes.items():
+            sharedMemory, sharedArray = createSharedArray(shape, dtype)
+            self.sharedMemories.append(sharedMemory)
+            setattr(self, arrayName, sharedArray)
+            sharedArrayLayout[arrayName] = (sharedMemory.name, shape, dtype)
+
+        self.shardBounds: numpy.ndarray = numpy.linspace(
+            0, self.numberOfGames, self.numberOfWorkers + 1
+        ).astype(int)
+        # One independent stream per shard, so results only depend on the seed
+        # and the number of workers, not on process start order.
+        if not isinstance(seed, numpy.random.SeedSequence):
+            seed = numpy.random.SeedSequence(seed)
+        workerSeedSequences: list[numpy.random.SeedSequence] = seed.spawn(
+            self.numberOfWorkers
+        )
+
+        self.connections: list[Connection] = []
+        self.workers: list[multiprocessing.Process] = []
+        for workerIndex in range(self.numberOfWorkers):
+            parentConnection, workerConnection = multiprocessing.Pipe()
+            worker: multiprocessing.Process = multiprocessing.Process(
+                target=runEnvironmentWorker,
+                args=(
+                    workerConnection,
+                    self.gameDimensions,
+                    self.shardBounds[workerIndex],
+                    self.shardBounds[workerIndex + 1],
+                    sharedArrayLayout,
+                    workerSeedSequences[workerIndex],
+                ),
+                daemon=True,
+            )
+            worker.start()
+            self.connections.append(parentConnection)
+            self.workers.append(worker)
+
+        self.waitForWorkers()
+
+    def waitForWorkers(self) -> None:
+        for connection in self.connections:
+            connection.recv()
+
+    def sendCommand(self, command: str) -> None:
+        for connection in self.connections:
+            connection.send(command)
+        self.waitForWorkers()
+
+    def reset(self) -> numpy.ndarray:
+        self.sendCommand("reset")
+        return self.observation
+
+    def step(
+        self, moves: numpy.ndarray
+    ) -> tuple[numpy.ndarray, numpy.ndarray, numpy.ndarray]:
+        self.moves[:] = moves
+        self.sendCommand("step")
+        return self.observation, self.gameEndMask, self.snakeHitFoodMask
+
+    def close(self) -> None:
+        if not self.workers:
+            return
+
+        self.sendCommand("close")
+        for worker in self.workers:
+            worker.join()
+        self.workers = []
+
+        for arrayName in self.sharedArrayNames:
+            delattr(self, arrayName)
+        for sharedMemory in self.sharedMemories:
+            sharedMemory.close()
+            sharedMemory.unlink()
+
+    def __enter__(self) -> "EnvironmentPool":
+        return self
+
+    def __exit__(self, *_) -> None:
+        self.close()
@@ -0,0 +1,395 @@
+import json
+import os
+import warnings
+import numpy
+from environment import Environment
+from snake import MapTemplate
+
+# One logged step: the action taken, event flags and the food location after the step
+STEP_DTYPE = numpy.dtype(
+    [("action", numpy.int8), ("flags", numpy.uint8), ("foodLocation", numpy.int16, 2)]
+)
+HIT_FOOD_FLAG = 1
+TERMINATED_FLAG = 2
+TRUNCATED_FLAG = 4
+
+# One stored episode: where its steps start in the log, the state it began from
+# and the map it was played on
+INDEX_DTYPE = numpy.dtype(
+    [
+        ("stepOffset", numpy.int64),
+        ("length", numpy.int32),
+        ("initialHeadLocation", numpy.int16, 2),
+        ("initialFoodLocation", numpy.int16, 2),
+        ("templateIndex", numpy.int16),
+    ]
+)
+
+
+class EpisodeStore:
+    def __init__(
+        self,
+        directory: str,
+        gameDimensions: list[int] | None = None,
+        chunkSize: int = 2**22,
+        indexCapacity: int = 2**12,
+    ) -> None:
+        self.directory: str = directory
+        self.chunks: dict[int, numpy.ndarray] = {}
+        metadataPath: str = os.path.join(directory, "metadata.json")
+        self.indexPath: str = os.path.join(directory, "index.npy")
+
+        # The index file is preallocated and grown by doubling, only the episodes
+        # counted in the metadata are valid.
+        if os.path.exists(metadataPath):
+            with open(metadataPath) as metadataFile:
+                metadata: dict = json.load(metadataFile)
+            self.gameDimensions: list[int] = metadata["gameDimensions"]
+            self.chunkSize: int = metadata["chunkSize"]
+            self.indexBuffer: numpy.ndarray = numpy.load(self.indexPath, mmap_mode="r+")
+            self.numberOfEpisodes: int = metadata.get(
+                "numberOfEpisodes", self.indexBuffer.shape[0]
+            )
+        else:
+            if gameDimensions is None:
+                raise Exception(
+                    f"No episode store in {directory}, gameDimensions are needed to create one!"
+                )
+            os.makedirs(directory, exist_ok=True)
+            self.gameDimensions: list[int] = list(gameDimensions)
+            self.chunkSize: int = chunkSize
+            self.indexBuffer: numpy.ndarray = numpy.lib.format.open_memmap(
+                self.indexPath, mode="w+", dtype=INDEX_DTYPE, shape=(indexCapacity,)
+            )
+            self.numberOfEpisodes: int = 0
+
+        self.numberOfSteps: int = (
+            int(self.index["stepOffset"][-1] + self.index["length"][-1])
+            if self.numberOfEpisodes > 0
+            else 0
+        )
+
+    @property
+    def index(self) -> numpy.ndarray:
+        return self.indexBuffer[: self.numberOfEpisodes]
+
+    def growIndex(self, numberOfEpisodes: int) -> None:
+        indexCapacity: int = max(2 * self.indexBuffer.shape[0], numberOfEpisodes)
+        grownIndexPath: str = os.path.join(self.directory, "index.grow.npy")
+        grownIndex: numpy.ndarray = numpy.lib.format.open_memmap(
+            grownIndexPath, mode="w+", dtype=INDEX_DTYPE, shape=(indexCapacity,)
+        )
+        grownIndex[: self.numberOfEpisodes] = self.index
+        grownIndex.flush()
+        os.replace(grownIndexPath, self.indexPath)
+        self.indexBuffer = grownIndex
+
+    def getChunk(self, chunkIndex: int) -> numpy.ndarray:
+        if chunkIndex not in self.chunks:
+            chunkPath: str = os.path.join(self.directory, f"steps_{chunkIndex}.npy")
+            if os.path.exists(chunkPath):
+                self.chunks[chunkIndex] = numpy.load(chunkPath, mmap_mode="r+")
+            else:
+                self.chunks[chunkIndex] = numpy.lib.format.open_memmap(
+                    chunkPath, mode="w+", dtype=STEP_DTYPE, shape=(self.chunkSize,)
+                )
+        return self.chunks[chunkIndex]
+
+    def writeSteps(self, stepOffset: int, steps: numpy.ndarray) -> None:
+        while steps.shape[0] > 0:
+            chunkIndex, chunkOffset = divmod(stepOffset, self.chunkSize)
+            numberOfSteps: int = min(steps.shape[0], self.chunkSize - chunkOffset)
+            self.getChunk(chunkIndex)[chunkOffset : chunkOffset + numberOfSteps] = (
+                steps[:numberOfSteps]
+            )
+            stepOffset += numberOfSteps
+            steps = steps[numberOfSteps:]
+
+    def readSteps(self, stepOffset: int, numberOfSteps: int) -> numpy.ndarray:
+        chunkIndex, chunkOffset = divmod(stepOffset, self.chunkSize)
+        if chunkOffset + numberOfSteps <= self.chunkSize:
+            return self.getChunk(chunkIndex)[chunkOffset : chunkOffset + numberOfSteps]
+
+        steps: numpy.ndarray = numpy.empty((numberOfSteps), dtype=STEP_DTYPE)
+        position: int = 0
+        while position < numberOfSteps:
+            chunkIndex, chunkOffset = divmod(stepOffset + position, self.chunkSize)
+            chunkSteps: int = min(
+                numberOfSteps - position, self.chunkSize - chunkOffset
+            )
+            steps[position : position + chunkSteps] = self.getChunk(chunkIndex)[
+                chunkOffset : chunkOffset + chunkSteps
+            ]
+            position += chunkSteps
+        return steps
+
+    def appendEpisodes(
+        self,
+        initialHeadLocations: numpy.ndarray,
+        initialFoodLocations: numpy.ndarray,
+        actions: numpy.ndarray,
+        foodLocations: numpy.ndarray,
+        snakeHitFood: numpy.ndarray,
+        terminated: numpy.ndarray,
+        episodeLengths: numpy.ndarray,
+        templateIndicies: numpy.ndarray | None = None,
+        truncated: numpy.ndarray | None = None,
+    ) -> numpy.ndarray:
+        # Step arrays are (episodes, padded length, ...), the padding past each
+        # episode length is dropped and the rest is written as one contiguous run.
+        stepMask: numpy.ndarray = (
+            numpy.arange(actions.shape[1])[None, :] < episodeLengths[:, None]
+        )
+        steps: numpy.ndarray = numpy.empty(
+            (int(episodeLengths.sum())), dtype=STEP_DTYPE
+        )
+        steps["action"] = actions[stepMask]
+        flags: numpy.ndarray = (
+            snakeHitFood[stepMask] * HIT_FOOD_FLAG
+            + terminated[stepMask] * TERMINATED_FLAG
+        )
+        if truncated is not None:
+            flags += truncated[stepMask] * TRUNCATED_FLAG
+        steps["flags"] = flags
+        steps["foodLocation"] = foodLocations[stepMask]
+        self.writeSteps(self.numberOfSteps, steps)
+
+        numberOfEpisodes: int = self.numberOfEpisodes + episodeLengths.shape[0]
+        if numberOfEpisodes > self.indexBuffer.shape[0]:
+            self.growIndex(numberOfEpisodes)
+        episodes: numpy.ndarray = self.indexBuffer[
+            self.numberOfEpisodes : numberOfEpisodes
+        ]
+        episodes["stepOffset"] = self.numberOfSteps + numpy.concatenate(
+            ([0], numpy.cumsum(episodeLengths)[:-1])
+        )
+        episodes["length"] = episodeLengths
+        episodes["initialHeadLocation"] = initialHeadLocations
+        episodes["initialFoodLocation"] = initialFoodLocations
+        episodes["templateIndex"] = 0 if templateIndicies is None else templateIndicies
+
+        episodeIndicies: numpy.ndarray = numpy.arange(
+            self.numberOfEpisodes, numberOfEpisodes
+        )
+        self.numberOfSteps += steps.shape[0]
+        self.numberOfEpisodes = numberOfEpisodes
+        return episodeIndicies
+
+    def readStep(self, episodeIndex: int, timestep: int) -> numpy.void:
+        episode: numpy.void = self.index[episodeIndex]
+        if not 0 <= timestep < episode["length"]:
+            raise Exception(
+                f"Timestep {timestep} is outside episode {episodeIndex} of length {episode['length']}!"
+            )
+        return self.readSteps(int(episode["stepOffset"]) + timestep, 1)[0]
+
+    def readEpisode(self, episodeIndex: int) -> numpy.ndarray:
+        episode: numpy.void = self.index[episodeIndex]
+        return self.readSteps(int(episode["stepOffset"]), int(episode["length"]))
+
+    def replayEpisodes(
+        self,
+        episodeIndicies: numpy.ndarray,
+        mapTemplate: MapTemplate | list[MapTemplate] | None = None,
+        actionSpace: str = "absolute",
+        reverseMoveMode: str = "allow",
+    ) -> tuple[numpy.ndarray, numpy.ndarray]:
+        episodes: numpy.ndarray = self.index[episodeIndicies]
+        numberOfEpisodes: int = episodes.shape[0]
+        episodeLengths: numpy.ndarray = episodes["length"]
+        maxEpisodeLength: int = int(episodeLengths.max())
+
+        actions: numpy.ndarray = numpy.zeros(
+            (numberOfEpisodes, maxEpisodeLength), dtype=numpy.int8
+        )
+        foodLocations: numpy.ndarray = numpy.zeros(
+            (numberOfEpisodes, maxEpisodeLength, 2), dtype=numpy.int16
+        )
+        for position, episodeIndex in enumerate(episodeIndicies):
+            steps: numpy.ndarray = self.readEpisode(episodeIndex)
+            actions[position, : steps.shape[0]] = steps["action"]
+            foodLocations[position, : steps.shape[0]] = steps["foodLocation"]
+
+        # Every episode is a game of one masked batch, finished episodes are
+        # deactivated and the logged food overrides the random respawn.
+        environment: Environment = Environment(
+            self.gameDimensions,
+            numberOfEpisodes,
+            endedGameMode="mask",
+            renderMode="lazy",
+            mapTemplate=mapTemplate,
+            templateIndicies=episodes["templateIndex"],
+            reverseMoveMode=reverseMoveMode,
+            actionSpace=actionSpace,
+        )
+        snake = environment.snake
+        snake.snakeHeadIndex[:] = 0
+        snake.currentBodyEndIndex[:] = 0
+        snake.snakeBodyLocation[:, 0] = episodes["initialHeadLocation"]
+        snake.foodLocation[:] = episodes["initialFoodLocation"]
+        snake.rebuildOccupancyGrid()
+        environment.stateSpaceIsStale = True
+
+        frames: numpy.ndarray = numpy.empty(
+            (numberOfEpisodes, maxEpisodeLength + 1, *environment.stateSpace.shape[1:]),
+            dtype=environment.observationDtype,
+        )
+        frames[:, 0] = environment.stateSpace
+        for timestep in range(maxEpisodeLength):
+            environment.activeGames = timestep < episodeLengths
+            environment.update(actions[:, timestep])
+            snake.foodLocation[environment.activeGames] = foodLocations[
+                environment.activeGames, timestep
+            ]
+            environment.stateSpaceIsStale = True
+            frames[:, timestep + 1] = environment.stateSpace
+        return frames, episodeLengths
+
+    def flush(self) -> None:
+        for chunk in self.chunks.values():
+            chunk.flush()
+        self.indexBuffer.flush()
+        with open(os.path.join(self.directory, "metadata.json"), "w") as metadataFile:
+            json.dump(
+                {
+                    "gameDimensions": self.gameDimensions,
+                    "chunkSize": self.chunkSize,
+                    "numberOfEpisodes": self.numberOfEpisodes,
+                },
+                metadataFile,
+            )
+
+
+class EpisodeRecorder:
+    def __init__(
+        self,
+        episodeStore: EpisodeStore,
+        environment: Environment,
+        maxEpisodeLength: int,
+    ) -> None:
+        if environment.endedGameMode != "reset":
+            raise Exception(
+                f"EpisodeRecorder needs an environment in reset mode, got: {environment.endedGameMode}!"
+            )
+
+        self.episodeStore: EpisodeStore = episodeStore
+        self.environment: Environment = environment
+        self.maxEpisodeLength: int = maxEpisodeLength
+        numberOfGames: int = environment.numberOfGames
+
+        self.actions: numpy.ndarray = numpy.zeros(
+            (numberOfGames, maxEpisodeLength), dtype=numpy.int8
+        )
+        self.foodLocations: numpy.ndarray = numpy.zeros(
+            (numberOfGames, maxEpisodeLength, 2), dtype=numpy.int16
+        )
+        self.snakeHitFood: numpy.ndarray = numpy.zeros(
+            (numberOfGames, maxEpisodeLength), dtype=bool
+        )
+        self.terminated: numpy.ndarray = numpy.zeros(
+            (numberOfGames, maxEpisodeLength), dtype=bool
+        )
+        self.truncated: numpy.ndarray = numpy.zeros(
+            (numberOfGames, maxEpisodeLength), dtype=bool
+        )
+        # Games whose episode outgrew maxEpisodeLength, stored truncated and not
+        # recorded again until the episode ends.
+        self.skippedGames: numpy.ndarray = numpy.zeros((numberOfGames), dtype=bool)
+        self.episodeLengths: numpy.ndarray = numpy.zeros((numberOfGames), dtype=int)
+        self.initialHeadLocations: numpy.ndarray = (
+            environment.snake.getSnakeHeadLocation().copy()
+        )
+        self.initialFoodLocations: numpy.ndarray = environment.snake.foodLocation.copy()
+
+    def record(
+        self,
+        actions: numpy.ndarray,
+        gameEndMask: numpy.ndarray,
+        snakeHitFoodMask: numpy.ndarray,
+        truncated: numpy.ndarray | None = None,
+        foodLocations: numpy.ndarray | None = None,
+    ) -> numpy.ndarray:
+        # Called after Environment.update, so ended games have already been reset and
+        # the snake state holds the start of their next episode. Games passed as
+        # truncated must be reset by the caller before this call, with the food
+        # locations from before that reset passed along. An episode that fills its
+        # buffer is stored truncated and the rest of it is dropped with a warning.
+        episodeEndMask: numpy.ndarray = (
+            gameEndMask if truncated is None else gameEndMask | truncated
+        )
+        notResetMask: numpy.ndarray = episodeEndMask & (
+            self.environment.snake.getSnakeLength() > 1
+        )
+        if notResetMask.any():
+            raise Exception(
+                f"Games {numpy.where(notResetMask)[0]} ended but were not reset before recording!"
+            )
+        truncatedMask: numpy.ndarray = episodeEndMask & ~gameEndMask
+        indicies: numpy.ndarray = numpy.where(~self.skippedGames)[0]
+        episodeLengths: numpy.ndarray = self.episodeLengths[indicies]
+        self.actions[indicies, episodeLengths] = numpy.asarray(actions)[indicies]
+        if foodLocations is None:
+            foodLocations = self.environment.snake.foodLocation
+        self.foodLocations[indicies, episodeLengths] = foodLocations[indicies]
+        # A game ending on a collision ate nothing, so its food is the one from
+        # before the step rather than the food of the reset game.
+        terminatedIndicies: numpy.ndarray = indicies[gameEndMask[indicies]]
+        if terminatedIndicies.shape[0] > 0:
+            terminatedLengths: numpy.ndarray = self.episodeLengths[terminatedIndicies]
+            self.foodLocations[terminatedIndicies, terminatedLengths] = numpy.where(
+                (terminatedLengths > 0)[:, None],
+                self.foodLocations[terminatedIndicies, terminatedLengths - 1],
+                self.initialFoodLocations[terminatedIndicies],
+            )
+        self.snakeHitFood[indicies, episodeLengths] = snakeHitFoodMask[indicies]
+        self.terminated[indicies, episodeLengths] = gameEndMask[indicies]
+        self.truncated[indicies, episodeLengths] = truncatedMask[indicies]
+        self.episodeLengths[indicies] += 1
+
+        bufferFullMask: numpy.ndarray = (
+            (self.episodeLengths >= self.maxEpisodeLength)
+            & ~self.skippedGames
+            & ~episodeEndMask
+        )
+        self.truncated[bufferFullMask, -1] = True
+        if bufferFullMask.any():
+            warnings.warn(
+                f"Episodes of games {numpy.where(bufferFullMask)[0]} outgrew maxEpisodeLength {self.maxEpisodeLength}, their remaining steps are not recorded"
+            )
+        storeMask: numpy.ndarray = ~self.skippedGames & (
+            episodeEndMask | bufferFullMask
+        )
+        restartMask: numpy.ndarray = self.skippedGames & episodeEndMask
+
+        episodeIndicies: numpy.ndarray = numpy.zeros((0), dtype=int)
+        if storeMask.any():
+            episodeIndicies = self.storeEpisodes(numpy.where(storeMask)[0])
+        if restartMask.any():
+            self.restartEpisodes(numpy.where(restartMask)[0])
+        self.skippedGames &= ~restartMask
+        self.skippedGames |= bufferFullMask
+        return episodeIndicies
+
+    def storeEpisodes(self, gameIndicies: numpy.ndarray) -> numpy.ndarray:
+        episodeIndicies: numpy.ndarray = self.episodeStore.appendEpisodes(
+            self.initialHeadLocations[gameIndicies],
+            self.initialFoodLocations[gameIndicies],
+            self.actions[gameIndicies],
+            self.foodLocations[gameIndicies],
+            self.snakeHitFood[gameIndicies],
+            self.terminated[gameIndicies],
+            self.episodeLengths[gameIndicies],
+            self.environment.snake.templateIndicies[gameIndicies],
+            self.truncated[gameIndicies],
+        )
+        self.restartEpisodes(gameIndicies)
+        return episodeIndicies
+
+    def restartEpisodes(self, gameIndicies: numpy.ndarray) -> None:
+        self.initialHeadLocations[gameIndicies] = (
+            self.environment.snake.getSnakeHeadLocation()[gameIndicies]
+        )
+        self.initialFoodLocations[gameIndicies] = self.environment.snake.foodLocation[
+            gameIndicies
+        ]
+        self.episodeLengths[gameIndicies] = 0
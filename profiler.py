@@ -0,0 +1,51 @@
+import time
+import numpy
+
+
+class PhaseProfiler:
+    def __init__(self) -> None:
+        self.reset()
+
+    def reset(self) -> None:
+        self.phaseSeconds: dict[str, float] = {}
+        self.phaseCalls: dict[str, int] = {}
+        self.eventCounts: dict[str, int] = {}
+
+    def start(self) -> float:
+        return time.perf_counter()
+
+    def record(self, phase: str, phaseStart: float) -> float:
+        phaseEnd: float = time.perf_counter()
+        self.phaseSeconds[phase] = (
+            self.phaseSeconds.get(phase, 0.0) + phaseEnd - phaseStart
+        )
+        self.phaseCalls[phase] = self.phaseCalls.get(phase, 0) + 1
+        return phaseEnd
+
+    def count(self, event: str, eventMask: numpy.ndarray) -> None:
+        self.eventCounts[event] = self.eventCounts.get(event, 0) + int(
+            numpy.count_nonzero(eventMask)
+        )
+
+    def getStatistics(self) -> dict[str, dict]:
+        return {
+            "phases": {
+                phase: {
+                    "seconds": self.phaseSeconds[phase],
+                    "calls": self.phaseCalls[phase],
+                }
+                for phase in self.phaseSeconds
+            },
+            "events": dict(self.eventCounts),
+        }
+
+
+class NullPhaseProfiler(PhaseProfiler):
+    def start(self) -> float:
+        return 0.0
+
+    def record(self, phase: str, phaseStart: float) -> float:
+        return 0.0
+
+    def count(self, event: str, eventMask: numpy.ndarray) -> None:
+        pass
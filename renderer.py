@@ -0,0 +1,105 @@
+import numpy
+from environment import Environment
+
+# Wall, Body, Head, Food, then Body Age when requested
+NUMBER_OF_CHANNELS = 4
+
+# Empty, Wall, Body, Food, Head
+CELL_COLORS = numpy.array(
+    [
+        [0, 0, 0],
+        [128, 128, 128],
+        [0, 160, 0],
+        [220, 0, 0],
+        [0, 255, 0],
+    ],
+    dtype=numpy.uint8,
+)
+
+# Cell types follow the stateSpace values, with the head split out from the body
+HEAD_CELL_TYPE = 4
+
+
+def generateCellTypes(environment: Environment) -> numpy.ndarray:
+    snake = environment.snake
+    indicies: numpy.ndarray = numpy.arange(snake.occupancyGrid.shape[0])
+    snakeHeadLocation: numpy.ndarray = snake.getSnakeHeadLocation()
+
+    cellTypes: numpy.ndarray = numpy.empty(snake.occupancyGrid.shape, dtype=numpy.uint8)
+    cellTypes[:] = snake.getWallGrid()
+    cellTypes[snake.occupancyGrid] = 2
+    cellTypes[indicies, snake.foodLocation[:, 0], snake.foodLocation[:, 1]] = 3
+    cellTypes[indicies, snakeHeadLocation[:, 0], snakeHeadLocation[:, 1]] = (
+        HEAD_CELL_TYPE
+    )
+    return cellTypes
+
+
+def writeChannelObservation(
+    environment: Environment, out: numpy.ndarray, bodyAge: bool = False
+) -> numpy.ndarray:
+    numberOfChannels: int = NUMBER_OF_CHANNELS + int(bodyAge)
+    if out.ndim != 4 or out.shape[1] != numberOfChannels:
+        raise Exception(
+            f"Expected out with {numberOfChannels} channels on axis 1, got shape: {out.shape}!"
+        )
+
+    snake = environment.snake
+    indicies: numpy.ndarray = numpy.arange(snake.occupancyGrid.shape[0])
+    snakeHeadLocation: numpy.ndarray = snake.getSnakeHeadLocation()
+
+    out[:] = 0
+    out[:, 0] = snake.getWallGrid()
+    out[:, 1] = snake.occupancyGrid
+    out[indicies, 1, snakeHeadLocation[:, 0], snakeHeadLocation[:, 1]] = 0
+    out[indicies, 2, snakeHeadLocation[:, 0], snakeHeadLocation[:, 1]] = 1
+    out[indicies, 3, snake.foodLocation[:, 0], snake.foodLocation[:, 1]] = 1
+
+    if bodyAge:
+        # Segments are numbered from 1 at the head to the snake length at the tail,
+        # float outputs are divided by the length so the tail is always 1.
+        bodyCapacity: int = snake.snakeBodyLocation.shape[1]
+        snakeLength: numpy.ndarray = snake.getSnakeLength()
+        bodyOffsets: numpy.ndarray = (
+            numpy.arange(bodyCapacity)[None, :] - snake.snakeHeadIndex[:, None]
+        ) % bodyCapacity
+        gameIndicies, bodyIndicies = numpy.nonzero(bodyOffsets < snakeLength[:, None])
+        segmentAges: numpy.ndarray = bodyOffsets[gameIndicies, bodyIndicies] + 1
+        if numpy.issubdtype(out.dtype, numpy.floating):
+            segmentAges = segmentAges / snakeLength[gameIndicies]
+        else:
+            segmentAges = numpy.minimum(segmentAges, numpy.iinfo(out.dtype).max)
+
+        out[
+            gameIndicies,
+            NUMBER_OF_CHANNELS,
+            snake.snakeBodyLocation[gameIndicies, bodyIndicies, 0],
+            snake.snakeBodyLocation[gameIndicies, bodyIndicies, 1],
+        ] = segmentAges
+    return out
+
+
+def writeImageObservation(
+    environment: Environment, out: numpy.ndarray, scale: int = 1
+) -> numpy.ndarray:
+    cellTypes: numpy.ndarray = generateCellTypes(environment)
+    numberOfGames, numberOfRows, numberOfColumns = cellTypes.shape
+    imageShape: tuple[int, ...] = (
+        numberOfGames,
+        3,
+        numberOfRows * scale,
+        numberOfColumns * scale,
+    )
+    if out.shape != imageShape or not out.flags["C_CONTIGUOUS"]:
+        raise Exception(
+            f"Expected a contiguous out of shape {imageShape}, got: {out.shape}!"
+        )
+
+    # Colour every cell once, then broadcast each cell over a scale x scale block.
+    cellColors: numpy.ndarray = CELL_COLORS[cellTypes].transpose(0, 3, 1, 2)
+    if numpy.issubdtype(out.dtype, numpy.floating):
+        cellColors = cellColors / 255
+    out.reshape(numberOfGames, 3, numberOfRows, scale, numberOfColumns, scale)[:] = (
+        cellColors[:, :, :, None, :, None]
+    )
+    return out
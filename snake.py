@@ -11,6 +11,14 @@ DIRECTIONS = numpy.array(
     dtype=numpy.int8,
 )
 
+# Left, Straight, Right as quarter turns clockwise from the heading
+RELATIVE_TURNS = numpy.array([-1, 0, 1], dtype=numpy.int8)
+
+# DIRECTIONS index for every heading and relative action
+RELATIVE_MOVES = (
+    (numpy.arange(len(DIRECTIONS))[:, None] + RELATIVE_TURNS[None, :]) % len(DIRECTIONS)
+).astype(numpy.int8)
+
 
 def generateAllPossibleCoordinates(dimensions: list[int]):
     xCoordinates: numpy.ndarray = numpy.linspace(
@@ -24,20 +32,218 @@ def generateAllPossibleCoordinates(dimensions: list[int]):
         numpy.meshgrid(yCoordinates, xCoordinates)
     ).T.reshape(-1, 2)
 
-    return possibleCoordinates
+    return possibleCoordinates.astype(int)
+
+
+def generateCellCoordinates(dimensions: list[int]) -> numpy.ndarray:
+    rows, columns = numpy.divmod(
+        numpy.arange(dimensions[1] * dimensions[0]), dimensions[0]
+    )
+    return numpy.stack((rows, columns), -1).astype(numpy.int16)
+
+
+def generateNextCellTable(dimensions: list[int]) -> numpy.ndarray:
+    # Flat index of the cell reached by each move from each cell. Moves off the
+    # board wrap around, which only wall cells can do on a bordered board.
+    cellCoordinates: numpy.ndarray = generateCellCoordinates(dimensions).astype(int)
+    nextCoordinates: numpy.ndarray = (
+        cellCoordinates[:, None] + DIRECTIONS[None, :]
+    ) % [dimensions[1], dimensions[0]]
+    return (nextCoordinates[..., 0] * dimensions[0] + nextCoordinates[..., 1]).astype(
+        numpy.int32
+    )
+
+
+def generateSerpentinePath(dimensions: list[int]) -> numpy.ndarray:
+    # Row by row through the inside of a bordered board, alternating direction.
+    rows: numpy.ndarray = numpy.arange(1, dimensions[1] - 1)
+    columns: numpy.ndarray = numpy.arange(1, dimensions[0] - 1)
+    path: list[numpy.ndarray] = []
+    for rowIndex, row in enumerate(rows):
+        rowColumns: numpy.ndarray = columns if rowIndex % 2 == 0 else columns[::-1]
+        path.append(numpy.stack((numpy.full_like(rowColumns, row), rowColumns), -1))
+    return numpy.concatenate(path)
+
+
+def generateWallCells(dimensions: list[int]) -> numpy.ndarray:
+    wallCells: numpy.ndarray = numpy.ones((dimensions[1], dimensions[0]), dtype=bool)
+    wallCells[1:-1, 1:-1] = False
+    return wallCells.reshape(-1)
+
+
+class MapTemplate:
+    def __init__(self, wallGrid: numpy.ndarray, wrapAround: bool = False) -> None:
+        self.wallGrid: numpy.ndarray = numpy.asarray(wallGrid, dtype=bool)
+        self.wrapAround: bool = wrapAround
+        self.gameDimensions: list[int] = [
+            self.wallGrid.shape[1],
+            self.wallGrid.shape[0],
+        ]
+
+        borderCells: numpy.ndarray = numpy.concatenate(
+            (
+                self.wallGrid[[0, -1]].reshape(-1),
+                self.wallGrid[:, [0, -1]].reshape(-1),
+            )
+        )
+        if not wrapAround and not borderCells.all():
+            raise Exception(
+                "A map without wrapAround needs walls on every border cell!"
+            )
+
+        # Shared by every game on the map, so obstacles cost nothing per step.
+        self.wallCells: numpy.ndarray = self.wallGrid.reshape(-1)
+        self.cellCoordinates: numpy.ndarray = generateCellCoordinates(
+            self.gameDimensions
+        )
+        self.nextCellTable: numpy.ndarray = generateNextCellTable(self.gameDimensions)
+        self.possibleCoordinates: numpy.ndarray = self.cellCoordinates[
+            ~self.wallCells
+        ].astype(int)
+        if self.possibleCoordinates.shape[0] < 2:
+            raise Exception(
+                f"A map needs at least 2 free cells, got: {self.possibleCoordinates.shape[0]}!"
+            )
+
+    @classmethod
+    def rectangle(cls, gameDimensions: list[int]) -> "MapTemplate":
+        return cls(generateWallCells(gameDimensions).reshape(gameDimensions[1], -1))
+
+    @classmethod
+    def torus(cls, gameDimensions: list[int]) -> "MapTemplate":
+        return cls(
+            numpy.zeros((gameDimensions[1], gameDimensions[0]), dtype=bool),
+            wrapAround=True,
+        )
 
 
 class Snake:
-    def __init__(self, gameDimensions: list[int], numberOfGames: int) -> None:
+    def __init__(
+        self,
+        gameDimensions: list[int],
+        numberOfGames: int,
+        seed: int | numpy.random.SeedSequence | None = None,
+        mapTemplate: MapTemplate | list[MapTemplate] | None = None,
+        templateIndicies: numpy.ndarray | None = None,
+    ) -> None:
+        if mapTemplate is None:
+            mapTemplate = MapTemplate.rectangle(gameDimensions)
+        self.mapTemplates: list[MapTemplate] = (
+            [mapTemplate] if isinstance(mapTemplate, MapTemplate) else list(mapTemplate)
+        )
+        for template in self.mapTemplates:
+            if (
+                template.gameDimensions[0] > gameDimensions[0]
+                or template.gameDimensions[1] > gameDimensions[1]
+            ):
+                raise Exception(
+                    f"Map of dimensions {template.gameDimensions} does not fit in gameDimensions: {gameDimensions}!"
+                )
+
+        if templateIndicies is None:
+            templateIndicies = numpy.zeros((numberOfGames), dtype=int)
+        self.initialTemplateIndicies: numpy.ndarray = numpy.array(
+            templateIndicies, dtype=int
+        )
+        if self.initialTemplateIndicies.shape != (numberOfGames,) or not (
+            0 <= self.initialTemplateIndicies.min()
+            and self.initialTemplateIndicies.max() < len(self.mapTemplates)
+        ):
+            raise Exception(
+                f"templateIndicies must hold one index below {len(self.mapTemplates)} per game, got: {templateIndicies}!"
+            )
+
         self.gameDimensions: list[int] = gameDimensions
         self.numberOfGames: int = numberOfGames
-        self.possibleCoordinates: numpy.ndarray = generateAllPossibleCoordinates(
-            self.gameDimensions
-        )
+        self.numberOfCells: int = gameDimensions[1] * gameDimensions[0]
+        self.generateMapTables()
 
+        self.seed(seed)
         self.resetGameState()
 
-    def resetGameState(self) -> None:
+    def generateMapTables(self) -> None:
+        # Every template is padded with walls to gameDimensions and given its own
+        # block of flat cells, so one next cell table and one wall lookup serve
+        # all games and a game only needs the offset of its block.
+        numberOfTemplates: int = len(self.mapTemplates)
+        paddedCellIndicies: numpy.ndarray = numpy.arange(self.numberOfCells).reshape(
+            self.gameDimensions[1], self.gameDimensions[0]
+        )
+        maxPossibleCoordinates: int = max(
+            template.possibleCoordinates.shape[0] for template in self.mapTemplates
+        )
+
+        self.wallGrids: numpy.ndarray = numpy.ones(
+            (numberOfTemplates, self.gameDimensions[1], self.gameDimensions[0]),
+            dtype=bool,
+        )
+        self.templateShapes: numpy.ndarray = numpy.zeros(
+            (numberOfTemplates, 2), dtype=int
+        )
+        self.wrapAround: numpy.ndarray = numpy.zeros((numberOfTemplates), dtype=bool)
+        self.possibleCoordinates: numpy.ndarray = numpy.zeros(
+            (numberOfTemplates, maxPossibleCoordinates, 2), dtype=int
+        )
+        self.possibleCoordinateCounts: numpy.ndarray = numpy.zeros(
+            (numberOfTemplates), dtype=int
+        )
+        nextCellTable: numpy.ndarray = numpy.repeat(
+            numpy.tile(paddedCellIndicies.reshape(1, -1, 1), (numberOfTemplates, 1, 1)),
+            len(DIRECTIONS),
+            axis=-1,
+        )
+
+        for templateIndex, template in enumerate(self.mapTemplates):
+            numberOfRows, numberOfColumns = template.wallGrid.shape
+            templateCellIndicies: numpy.ndarray = paddedCellIndicies[
+                :numberOfRows, :numberOfColumns
+            ].reshape(-1)
+            numberOfPossibleCoordinates: int = template.possibleCoordinates.shape[0]
+
+            self.wallGrids[templateIndex, :numberOfRows, :numberOfColumns] = (
+                template.wallGrid
+            )
+            self.templateShapes[templateIndex] = template.wallGrid.shape
+            self.wrapAround[templateIndex] = template.wrapAround
+            self.possibleCoordinates[templateIndex, :numberOfPossibleCoordinates] = (
+                template.possibleCoordinates
+            )
+            self.possibleCoordinateCounts[templateIndex] = numberOfPossibleCoordinates
+            nextCellTable[templateIndex, templateCellIndicies] = templateCellIndicies[
+                template.nextCellTable
+            ]
+
+        self.nextCellTable: numpy.ndarray = (
+            (
+                nextCellTable
+                + numpy.arange(numberOfTemplates)[:, None, None] * self.numberOfCells
+            )
+            .reshape(-1, len(DIRECTIONS))
+            .astype(numpy.int32)
+        )
+        self.possibleCellIndicies: numpy.ndarray = self.getCellIndicies(
+            self.possibleCoordinates
+        ).astype(numpy.int32)
+        self.wallCells: numpy.ndarray = self.wallGrids.reshape(-1)
+        self.cellCoordinates: numpy.ndarray = numpy.tile(
+            generateCellCoordinates(self.gameDimensions), (numberOfTemplates, 1)
+        )
+
+    def getWallGrid(self, gameIndicies: numpy.ndarray | None = None) -> numpy.ndarray:
+        if gameIndicies is None:
+            return self.wallGrids[self.templateIndicies]
+        return self.wallGrids[self.templateIndicies[gameIndicies]]
+
+    def seed(self, seed: int | numpy.random.SeedSequence | None = None) -> None:
+        self.randomGenerator: numpy.random.Generator = numpy.random.default_rng(seed)
+
+    def resetGameState(self, gameIndicies: numpy.ndarray | None = None) -> None:
+        if gameIndicies is not None:
+            self.generateRandomLocations(resetGame=True, gameIndicies=gameIndicies)
+            return
+
+        self.templateIndicies: numpy.ndarray = self.initialTemplateIndicies.copy()
+
         self.snakeBodyLocation: numpy.ndarray = numpy.zeros(
             (
                 self.numberOfGames,
@@ -55,12 +261,30 @@ class Snake:
             dtype=numpy.int16,
         )
 
+        self.occupancyGrid: numpy.ndarray = numpy.zeros(
+            (
+                self.numberOfGames,
+                self.gameDimensions[1],
+                self.gameDimensions[0],
+            ),
+            dtype=bool,
+        )
+
+        self.snakeHeadIndex: numpy.ndarray = numpy.zeros(
+            (self.numberOfGames), dtype=int
+        )
         self.currentBodyEndIndex = numpy.zeros((self.numberOfGames), dtype=int)
+        self.snakeHeading: numpy.ndarray = numpy.zeros(
+            (self.numberOfGames), dtype=numpy.int8
+        )
 
         self.generateRandomLocations(resetGame=True)
 
     def generateRandomLocations(
-        self, resetGame: bool = False, snakeHitFoodMask: numpy.ndarray | None = None
+        self,
+        resetGame: bool = False,
+        snakeHitFoodMask: numpy.ndarray | None = None,
+        gameIndicies: numpy.ndarray | None = None,
     ) -> None:
         if resetGame:
             if snakeHitFoodMask is not None:
@@ -68,7 +292,7 @@ class Snake:
                     f"Trying to use resetGame logic for random location generation, when snakeHitFoodMask is of Type: {type(snakeHitFoodMask)}!"
                 )
 
-            self.generateCoordinatesOnReset()
+            self.generateCoordinatesOnReset(gameIndicies)
 
         else:
             if snakeHitFoodMask is None:
@@ -79,84 +303,230 @@ class Snake:
             self.generateCoordinatesFromMask(snakeHitFoodMask)
 
     def generateCoordinatesFromMask(self, snakeHitFoodMask: numpy.ndarray):
-        for gameIndex in numpy.where(snakeHitFoodMask)[0]:
-            freeCoordinateMask: numpy.ndarray = (
-                ~(
-                    self.possibleCoordinates[:, None]
-                    == self.snakeBodyLocation[gameIndex, :]
-                )
-                .all(-1)
-                .any(-1)
-            )
-
-            freeCoordinateIndicies: numpy.ndarray = numpy.where(freeCoordinateMask)[0]
-            selectedCoordiante: numpy.ndarray = numpy.random.choice(
-                freeCoordinateIndicies
-            )
-            self.foodLocation[gameIndex] = self.possibleCoordinates[selectedCoordiante]
-
-    def generateCoordinatesOnReset(self):
-        for gameIndex in range(self.numberOfGames):
-            chosenCoordinates: numpy.ndarray = numpy.random.choice(
-                (self.gameDimensions[0] - 2) * (self.gameDimensions[1] - 2),
-                size=2,
-                replace=False,
+        gameIndicies: numpy.ndarray = numpy.where(snakeHitFoodMask)[0]
+        if len(self.mapTemplates) == 1:
+            templateIndicies: numpy.ndarray = numpy.zeros(
+                gameIndicies.shape[0], dtype=int
             )
-            self.foodLocation[gameIndex] = self.possibleCoordinates[
-                chosenCoordinates[0]
-            ]
-            self.snakeBodyLocation[gameIndex, 0] = self.possibleCoordinates[
-                chosenCoordinates[1]
+            freeCoordinateMask: numpy.ndarray = ~self.occupancyGrid[
+                gameIndicies[:, None],
+                self.possibleCoordinates[0, None, :, 0],
+                self.possibleCoordinates[0, None, :, 1],
             ]
+        else:
+            # One int32 gather of flat cells per game, past the free cell count of
+            # a map the padding is masked out.
+            templateIndicies: numpy.ndarray = self.templateIndicies[gameIndicies]
+            freeCoordinateMask: numpy.ndarray = ~self.occupancyGrid.reshape(
+                self.occupancyGrid.shape[0], -1
+            )[gameIndicies[:, None], self.possibleCellIndicies[templateIndicies]]
+            freeCoordinateMask &= (
+                numpy.arange(freeCoordinateMask.shape[1])[None, :]
+                < self.possibleCoordinateCounts[templateIndicies, None]
+            )
 
-    def findSnakeHitSelf(self, nextSnakePosition: numpy.ndarray) -> numpy.ndarray:
-        firstElementExpanded: numpy.ndarray = nextSnakePosition[:, 0].reshape(
-            self.snakeBodyLocation.shape[0], 1, self.snakeBodyLocation.shape[2]
+        # Random keys on free cells and -1 elsewhere, so the argmax is a uniform
+        # draw over the free cells of every game at once.
+        randomKeys: numpy.ndarray = self.randomGenerator.random(
+            freeCoordinateMask.shape, dtype=numpy.float32
+        )
+        randomKeys[~freeCoordinateMask] = -1
+        selectedCoordinates: numpy.ndarray = randomKeys.argmax(-1)
+
+        hasFreeCoordinate: numpy.ndarray = freeCoordinateMask.any(-1)
+        self.foodLocation[gameIndicies[hasFreeCoordinate]] = self.possibleCoordinates[
+            templateIndicies[hasFreeCoordinate], selectedCoordinates[hasFreeCoordinate]
+        ]
+
+    def generateCoordinatesOnReset(self, gameIndicies: numpy.ndarray | None = None):
+        if gameIndicies is None:
+            gameIndicies = numpy.arange(self.snakeBodyLocation.shape[0])
+
+        # Draw the head from all cells but one and skip over the food cell, which
+        # gives two distinct cells per game without a per-game choice call.
+        templateIndicies: numpy.ndarray = self.templateIndicies[gameIndicies]
+        numberOfCoordinates: numpy.ndarray = self.possibleCoordinateCounts[
+            templateIndicies
+        ]
+        foodCoordinates: numpy.ndarray = self.randomGenerator.integers(
+            numberOfCoordinates, size=gameIndicies.shape[0]
         )
-        bodyComparison: numpy.ndarray = (
-            firstElementExpanded == self.snakeBodyLocation[:, 1:]
+        headCoordinates: numpy.ndarray = self.randomGenerator.integers(
+            numberOfCoordinates - 1, size=gameIndicies.shape[0]
         )
-        snakeHitSelf: numpy.ndarray = bodyComparison.all(-1).any(-1)
+        headCoordinates += headCoordinates >= foodCoordinates
+
+        self.snakeHeadIndex[gameIndicies] = 0
+        self.currentBodyEndIndex[gameIndicies] = 0
+        self.snakeHeading[gameIndicies] = 0
+        self.foodLocation[gameIndicies] = self.possibleCoordinates[
+            templateIndicies, foodCoordinates
+        ]
+        self.snakeBodyLocation[gameIndicies, 0] = self.possibleCoordinates[
+            templateIndicies, headCoordinates
+        ]
+
+        self.occupancyGrid[gameIndicies] = False
+        self.occupancyGrid[
+            gameIndicies,
+            self.snakeBodyLocation[gameIndicies, 0, 0],
+            self.snakeBodyLocation[gameIndicies, 0, 1],
+        ] = True
+
+    def getSnakeHeadLocation(self) -> numpy.ndarray:
+        indicies: numpy.ndarray = numpy.arange(self.snakeBodyLocation.shape[0])
+        return self.snakeBodyLocation[indicies, self.snakeHeadIndex]
+
+    def getSnakeLength(self) -> numpy.ndarray:
+        return (
+            self.currentBodyEndIndex - self.snakeHeadIndex
+        ) % self.snakeBodyLocation.shape[1] + 1
+
+    def placeLongSnakes(self, lengthFraction: float) -> None:
+        path: numpy.ndarray = generateSerpentinePath(self.gameDimensions)
+        if self.getWallGrid()[:, path[:, 0], path[:, 1]].any():
+            raise Exception("Long snakes can only be placed on rectangular maps!")
+        snakeLength: int = max(1, min(int(len(path) * lengthFraction), len(path) - 1))
+
+        self.snakeHeadIndex[:] = 0
+        self.currentBodyEndIndex[:] = snakeLength - 1
+        self.snakeBodyLocation[:, :snakeLength] = path[:snakeLength][::-1]
+        self.foodLocation[:] = path[snakeLength]
+        self.rebuildOccupancyGrid()
+
+    def rebuildOccupancyGrid(self) -> None:
+        bodyCapacity: int = self.snakeBodyLocation.shape[1]
+        bodyOffsets: numpy.ndarray = (
+            numpy.arange(bodyCapacity)[None, :] - self.snakeHeadIndex[:, None]
+        ) % bodyCapacity
+        gameIndicies, bodyIndicies = numpy.nonzero(
+            bodyOffsets < self.getSnakeLength()[:, None]
+        )
+
+        self.occupancyGrid[:] = False
+        self.occupancyGrid[
+            gameIndicies,
+            self.snakeBodyLocation[gameIndicies, bodyIndicies, 0],
+            self.snakeBodyLocation[gameIndicies, bodyIndicies, 1],
+        ] = True
+
+    def getCellIndicies(self, locations: numpy.ndarray) -> numpy.ndarray:
+        return (
+            locations[..., 0].astype(numpy.int32) * self.gameDimensions[0]
+            + locations[..., 1]
+        )
+
+    def getMapCellIndicies(self, locations: numpy.ndarray) -> numpy.ndarray:
+        cellIndicies: numpy.ndarray = self.getCellIndicies(locations)
+        if len(self.mapTemplates) == 1:
+            return cellIndicies
+        return cellIndicies + self.templateIndicies * self.numberOfCells
+
+    def findSnakeHitSelf(self, nextSnakePosition: numpy.ndarray) -> numpy.ndarray:
+        snakeHitSelf: numpy.ndarray = self.occupancyGrid[
+            numpy.arange(self.occupancyGrid.shape[0]),
+            nextSnakePosition[:, 0, 0],
+            nextSnakePosition[:, 0, 1],
+        ]
         return snakeHitSelf
 
     def generateNextSnakePosition(self, moveDirection: list[int]) -> numpy.ndarray:
-        nextSnakePosition: numpy.ndarray = (
-            self.snakeBodyLocation[:, 0] + DIRECTIONS[moveDirection]
-        ).reshape(self.numberOfGames, 1, 2)
+        nextCellIndicies: numpy.ndarray = self.nextCellTable[
+            self.getMapCellIndicies(self.getSnakeHeadLocation()),
+            moveDirection,
+        ]
+        nextSnakePosition: numpy.ndarray = self.cellCoordinates[
+            nextCellIndicies
+        ].reshape(-1, 1, 2)
         return nextSnakePosition
 
+    def getLegalMoveMask(self) -> numpy.ndarray:
+        # A move is legal when the cell it enters is neither wall nor snake, the
+        # tail included as it is still occupied when the move is checked.
+        nextCellIndicies: numpy.ndarray = self.nextCellTable[
+            self.getMapCellIndicies(self.getSnakeHeadLocation())
+        ]
+        legalMoveMask: numpy.ndarray = ~self.wallCells[nextCellIndicies]
+        legalMoveMask &= ~self.occupancyGrid.reshape(self.occupancyGrid.shape[0], -1)[
+            numpy.arange(self.occupancyGrid.shape[0])[:, None],
+            nextCellIndicies % self.numberOfCells,
+        ]
+        return legalMoveMask
+
+    def convertRelativeMoves(self, relativeMoves: list[int]) -> numpy.ndarray:
+        return RELATIVE_MOVES[self.snakeHeading, relativeMoves]
+
+    def convertReverseMoves(self, moveDirection: list[int]) -> numpy.ndarray:
+        # Moving back into the neck continues along the heading instead, a snake
+        # of length 1 has no neck and may turn around.
+        moveDirection = numpy.array(moveDirection)
+        reverseMoveMask: numpy.ndarray = (
+            moveDirection == (self.snakeHeading + 2) % len(DIRECTIONS)
+        ) & (self.currentBodyEndIndex != self.snakeHeadIndex)
+        moveDirection[reverseMoveMask] = self.snakeHeading[reverseMoveMask]
+        return moveDirection
+
+    def updateSnakeHeading(
+        self,
+        moveDirection: list[int],
+        activeGameMask: numpy.ndarray | None = None,
+    ) -> None:
+        if activeGameMask is None:
+            self.snakeHeading[:] = moveDirection
+        else:
+            self.snakeHeading[activeGameMask] = numpy.asarray(moveDirection)[
+                activeGameMask
+            ]
+
     def updateSnakeBodyCoordinates(
         self,
         nextSnakePosition: numpy.ndarray,
         snakeHitFoodMask: numpy.ndarray,
+        activeGameMask: numpy.ndarray | None = None,
     ) -> None:
+        if activeGameMask is None:
+            snakeHitNothingMask: numpy.ndarray = ~snakeHitFoodMask
+            indicies: numpy.ndarray = numpy.arange(self.snakeBodyLocation.shape[0])
+        else:
+            snakeHitNothingMask: numpy.ndarray = ~snakeHitFoodMask & activeGameMask
+            indicies: numpy.ndarray = numpy.where(activeGameMask)[0]
 
-        hitNothingMaskedIndicies: numpy.ndarray = numpy.where(~snakeHitFoodMask)[0]
+        hitNothingMaskedIndicies: numpy.ndarray = numpy.where(snakeHitNothingMask)[0]
         maskedCurrentBodyEndIndicies: numpy.ndarray = self.currentBodyEndIndex[
-            ~snakeHitFoodMask
+            snakeHitNothingMask
         ]
 
-        self.snakeBodyLocation[
-            hitNothingMaskedIndicies, maskedCurrentBodyEndIndicies
-        ] = [0, 0]
+        self.occupancyGrid[
+            hitNothingMaskedIndicies,
+            self.snakeBodyLocation[
+                hitNothingMaskedIndicies, maskedCurrentBodyEndIndicies, 0
+            ],
+            self.snakeBodyLocation[
+                hitNothingMaskedIndicies, maskedCurrentBodyEndIndicies, 1
+            ],
+        ] = False
 
-        self.currentBodyEndIndex += snakeHitFoodMask
-        self.snakeBodyLocation = numpy.hstack(
-            (nextSnakePosition, self.snakeBodyLocation[:, :-1, :])
+        bodyCapacity: int = self.snakeBodyLocation.shape[1]
+        self.currentBodyEndIndex -= snakeHitNothingMask
+        self.currentBodyEndIndex %= bodyCapacity
+
+        self.snakeHeadIndex[indicies] -= 1
+        self.snakeHeadIndex %= bodyCapacity
+        self.snakeBodyLocation[indicies, self.snakeHeadIndex[indicies]] = (
+            nextSnakePosition[indicies, 0]
         )
+        self.occupancyGrid[
+            indicies,
+            nextSnakePosition[indicies, 0, 0],
+            nextSnakePosition[indicies, 0, 1],
+        ] = True
 
     def generateMasks(
         self, nextSnakePosition: numpy.ndarray
     ) -> tuple[numpy.ndarray, numpy.ndarray]:
-        updatedGameDimensions: list[int] = [
-            self.gameDimensions[0] - 1,
-            self.gameDimensions[1] - 1,
+        snakeHitWallMask: numpy.ndarray = self.wallCells[
+            self.getMapCellIndicies(nextSnakePosition[:, 0])
         ]
-        snakeHitWallEquality: numpy.ndarray = (
-            nextSnakePosition[:, 0] % updatedGameDimensions == 0
-        )
-
-        snakeHitWallMask: numpy.ndarray = snakeHitWallEquality.any(-1)
 
         snakeHitSelfMask: numpy.ndarray = self.findSnakeHitSelf(nextSnakePosition)
 
@@ -0,0 +1,73 @@
+import numpy
+
+try:
+    import numba
+except ImportError:
+    numba = None
+
+NUMBA_AVAILABLE: bool = numba is not None
+
+
+def stepGames(
+    snakeBodyLocation: numpy.ndarray,
+    snakeHeadIndex: numpy.ndarray,
+    currentBodyEndIndex: numpy.ndarray,
+    occupancyGrid: numpy.ndarray,
+    foodLocation: numpy.ndarray,
+    stateSpace: numpy.ndarray,
+    renderStateSpace: bool,
+    moves: numpy.ndarray,
+    activeGames: numpy.ndarray,
+    templateIndicies: numpy.ndarray,
+    nextCellTable: numpy.ndarray,
+    wallCells: numpy.ndarray,
+    gameEndMask: numpy.ndarray,
+    snakeHitFoodMask: numpy.ndarray,
+) -> None:
+    bodyCapacity: int = snakeBodyLocation.shape[1]
+    numberOfColumns: int = stateSpace.shape[2]
+    numberOfCells: int = stateSpace.shape[1] * numberOfColumns
+
+    for gameIndex in range(snakeBodyLocation.shape[0]):
+        gameEndMask[gameIndex] = False
+        snakeHitFoodMask[gameIndex] = False
+        if not activeGames[gameIndex]:
+            continue
+
+        headIndex: int = snakeHeadIndex[gameIndex]
+        nextCellIndex: int = nextCellTable[
+            templateIndicies[gameIndex] * numberOfCells
+            + snakeBodyLocation[gameIndex, headIndex, 0] * numberOfColumns
+            + snakeBodyLocation[gameIndex, headIndex, 1],
+            moves[gameIndex],
+        ]
+        nextRow: int = (nextCellIndex % numberOfCells) // numberOfColumns
+        nextColumn: int = nextCellIndex % numberOfColumns
+
+        gameEndMask[gameIndex] = (
+            wallCells[nextCellIndex] or occupancyGrid[gameIndex, nextRow, nextColumn]
+        )
+        snakeHitFoodMask[gameIndex] = (
+            nextRow == foodLocation[gameIndex, 0]
+            and nextColumn == foodLocation[gameIndex, 1]
+        )
+
+        if not snakeHitFoodMask[gameIndex]:
+            bodyEndIndex: int = currentBodyEndIndex[gameIndex]
+            bodyEndRow: int = snakeBodyLocation[gameIndex, bodyEndIndex, 0]
+            bodyEndColumn: int = snakeBodyLocation[gameIndex, bodyEndIndex, 1]
+            if renderStateSpace:
+                stateSpace[gameIndex, bodyEndRow, bodyEndColumn] = 0
+            occupancyGrid[gameIndex, bodyEndRow, bodyEndColumn] = False
+            currentBodyEndIndex[gameIndex] = (bodyEndIndex - 1) % bodyCapacity
+
+        headIndex = (headIndex - 1) % bodyCapacity
+        snakeHeadIndex[gameIndex] = headIndex
+        snakeBodyLocation[gameIndex, headIndex, 0] = nextRow
+        snakeBodyLocation[gameIndex, headIndex, 1] = nextColumn
+        occupancyGrid[gameIndex, nextRow, nextColumn] = True
+        if renderStateSpace:
+            stateSpace[gameIndex, nextRow, nextColumn] = 2
+
+
+compiledStepGames = numba.njit(cache=True)(stepGames) if NUMBA_AVAILABLE else None
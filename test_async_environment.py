@@ -0,0 +1,67 @@
+import unittest
+import numpy
+from async_environment import AsyncEnvironment
+
+
+def equalNumpyArrays(array_1: numpy.ndarray, array_2: numpy.ndarray) -> bool:
+    equalInPlace: numpy.ndarray = array_1 == array_2
+    equal: bool = bool(equalInPlace.all())
+    return equal
+
+
+class TestAsyncEnvironment(unittest.TestCase):
+    def setUp(self) -> None:
+        self.gameDimensions: list[int] = [6, 6]
+        self.numberOfGames: int = 3
+
+    def test_step_swapsBuffers(self) -> None:
+        with AsyncEnvironment(
+            self.gameDimensions, self.numberOfGames
+        ) as asyncEnvironment:
+            observation_1: numpy.ndarray = asyncEnvironment.reset()
+            observation_1_copy: numpy.ndarray = observation_1.copy()
+
+            asyncEnvironment.stepAsync(numpy.array([0, 1, 2]))
+            observation_2, gameEndMask, snakeHitFoodMask = asyncEnvironment.stepWait()
+
+            self.assertTrue(
+                observation_1 is not observation_2,
+                "Consecutive observations share a buffer",
+            )
+            self.assertTrue(
+                equalNumpyArrays(observation_1, observation_1_copy),
+                f"Observation 1 changed while stepping: {observation_1}",
+            )
+            self.assertTrue(
+                equalNumpyArrays(
+                    observation_2, asyncEnvironment.environment.stateSpace
+                ),
+                f"Observation 2: {observation_2}",
+            )
+            self.assertTrue(
+                gameEndMask.shape == (3,) and snakeHitFoodMask.shape == (3,),
+                f"Game End Mask: {gameEndMask}\nSnake Hit Food Mask: {snakeHitFoodMask}",
+            )
+
+            observation_3, _, _ = asyncEnvironment.step(numpy.array([0, 1, 2]))
+
+            self.assertTrue(
+                observation_3 is observation_1,
+                "Observation buffers are not reused every other step",
+            )
+
+    def test_step_exceptions(self) -> None:
+        with AsyncEnvironment(
+            self.gameDimensions, self.numberOfGames
+        ) as asyncEnvironment:
+            with self.assertRaises(Exception):
+                asyncEnvironment.stepWait()
+
+            asyncEnvironment.stepAsync(numpy.array([0, 1, 2]))
+            with self.assertRaises(Exception):
+                asyncEnvironment.stepAsync(numpy.array([0, 1, 2]))
+            asyncEnvironment.stepWait()
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,139 @@
+import copy
+import unittest
+import numpy
+from compact_environment import (
+    CompactEnvironment,
+    readPackedDirections,
+    writePackedDirections,
+)
+from environment import Environment
+
+
+def equalNumpyArrays(array_1: numpy.ndarray, array_2: numpy.ndarray) -> bool:
+    equalInPlace: numpy.ndarray = array_1 == array_2
+    equal: bool = bool(equalInPlace.all())
+    return equal
+
+
+class TestCompactEnvironment(unittest.TestCase):
+    def setUp(self) -> None:
+        self.gameDimensions: list[int] = [7, 6]
+        self.numberOfGames: int = 128
+
+    def test_reset(self) -> None:
+        compactEnvironment: CompactEnvironment = CompactEnvironment(
+            self.gameDimensions, self.numberOfGames, seed=0
+        )
+        stateSpace: numpy.ndarray = compactEnvironment.getStateSpace()
+
+        self.assertTrue(
+            stateSpace.shape == (self.numberOfGames, 6, 7),
+            f"State space shape: {stateSpace.shape}",
+        )
+        self.assertTrue(
+            equalNumpyArrays((stateSpace == 2).sum(axis=(1, 2)), 1)
+            and equalNumpyArrays((stateSpace == 3).sum(axis=(1, 2)), 1),
+            f"State space: {stateSpace}",
+        )
+        self.assertTrue(
+            equalNumpyArrays(compactEnvironment.getSnakeLength(), 1),
+            f"Snake length: {compactEnvironment.getSnakeLength()}",
+        )
+
+    def test_packedDirections(self) -> None:
+        packedDirections: numpy.ndarray = numpy.zeros((2, 2), dtype=numpy.uint8)
+        gameIndicies: numpy.ndarray = numpy.array([0, 0, 0, 1, 1])
+        ringIndicies: numpy.ndarray = numpy.array([0, 1, 5, 3, 4])
+        directions: numpy.ndarray = numpy.array([3, 1, 2, 2, 3])
+
+        writePackedDirections(packedDirections, gameIndicies, ringIndicies, directions)
+        writePackedDirections(
+            packedDirections, numpy.array([0]), numpy.array([1]), numpy.array([0])
+        )
+        directions[1] = 0
+
+        self.assertTrue(
+            equalNumpyArrays(
+                readPackedDirections(packedDirections, gameIndicies, ringIndicies),
+                directions,
+            ),
+            f"Packed directions: {packedDirections}",
+        )
+
+    def test_fromEnvironment(self) -> None:
+        environment: Environment = Environment(
+            self.gameDimensions, self.numberOfGames, endedGameMode="reset", seed=1
+        )
+        environment.snake.placeLongSnakes(0.7)
+        environment.renderStateSpace()
+
+        compactEnvironment: CompactEnvironment = CompactEnvironment.fromEnvironment(
+            environment
+        )
+
+        self.assertTrue(
+            equalNumpyArrays(
+                compactEnvironment.getStateSpace(), environment.stateSpace
+            ),
+            "Decoded state space differs from the dense environment",
+        )
+        self.assertTrue(
+            equalNumpyArrays(
+                compactEnvironment.getSnakeLength(), environment.snake.getSnakeLength()
+            ),
+            f"Snake length: {compactEnvironment.getSnakeLength()}",
+        )
+        self.assertTrue(
+            equalNumpyArrays(
+                compactEnvironment.getStateSpace(numpy.array([3, 5])),
+                environment.stateSpace[[3, 5]],
+            ),
+            "Decoded subset differs from the dense environment",
+        )
+
+    def test_update_matchesEnvironment(self) -> None:
+        randomGenerator: numpy.random.Generator = numpy.random.default_rng(0)
+
+        for lengthFraction in (None, 0.7):
+            environment: Environment = Environment(
+                self.gameDimensions, self.numberOfGames, endedGameMode="reset", seed=2
+            )
+            if lengthFraction is not None:
+                environment.snake.placeLongSnakes(lengthFraction)
+                environment.renderStateSpace()
+            compactEnvironment: CompactEnvironment = CompactEnvironment.fromEnvironment(
+                environment
+            )
+            compactEnvironment.randomGenerator = copy.deepcopy(
+                environment.snake.randomGenerator
+            )
+
+            for _ in range(100):
+                moves: numpy.ndarray = randomGenerator.integers(
+                    4, size=self.numberOfGames
+                )
+                gameEndMask_1, snakeHitFoodMask_1, _ = environment.update(moves)
+                gameEndMask_2, snakeHitFoodMask_2, _ = compactEnvironment.update(moves)
+
+                self.assertTrue(
+                    equalNumpyArrays(gameEndMask_1, gameEndMask_2)
+                    and equalNumpyArrays(snakeHitFoodMask_1, snakeHitFoodMask_2),
+                    f"Game End Mask 1: {gameEndMask_1}\nGame End Mask 2: {gameEndMask_2}",
+                )
+                self.assertTrue(
+                    equalNumpyArrays(
+                        compactEnvironment.getStateSpace(), environment.stateSpace
+                    ),
+                    "Decoded state space differs from the dense environment",
+                )
+                self.assertTrue(
+                    equalNumpyArrays(
+                        compactEnvironment.getSnakeLength(),
+                        environment.snake.getSnakeLength(),
+                    ),
+                    f"Snake length: {compactEnvironment.getSnakeLength()}",
+                )
+
+
+if __name__ == "__main__":
+    unittest.main()
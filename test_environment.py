@@ -1,6 +1,7 @@
 import unittest
 import numpy
 from environment import Environment
+from snake import MapTemplate
 
 
 def equalNumpyArrays(array_1: numpy.ndarray, array_2: numpy.ndarray) -> bool:
@@ -150,6 +151,9 @@ class TestEnvironment(unittest.TestCase):
         environment_2.stateSpace[2, 3, 2] = 2
         environment_2.stateSpace[2, 2, 2] = 2
 
+        environment_1.snake.rebuildOccupancyGrid()
+        environment_2.snake.rebuildOccupancyGrid()
+
         (
             environment_1_gameEndMask,
             environment_1_snakeHitFoodMask,
@@ -293,6 +297,578 @@ class TestEnvironment(unittest.TestCase):
             f"Environment 1 State Space Value at New Food Location at 1: {environment_1.stateSpace[1, environment_1.snake.foodLocation[1, 0], environment_1.snake.foodLocation[1, 1]]}\nEnvironment 1 New Food Location at 1: {environment_1.snake.foodLocation[1]}",
         )
 
+    def test_update_resetMode(self) -> None:
+        environment_2: Environment = Environment(
+            self.gameDimensions_2, self.numberOfGames_2, endedGameMode="reset"
+        )
+
+        environment_2.snake.snakeBodyLocation[:, 0] = [[1, 1], [2, 2], [4, 4]]
+        environment_2.snake.foodLocation[:] = [[3, 3], [3, 3], [1, 1]]
+        environment_2.snake.rebuildOccupancyGrid()
+        environment_2.stateSpace[:, 1:-1, 1:-1] = 0
+        environment_2.drawInitialSnake()
+        environment_2.updateFoodLocation()
+
+        (
+            environment_2_gameEndMask,
+            environment_2_snakeHitFoodMask,
+            environment_2_allGamesEnded,
+        ) = environment_2.update([0, 1, 0])
+
+        self.assertTrue(
+            equalNumpyArrays(
+                environment_2_gameEndMask, numpy.array([True, False, False])
+            ),
+            f"Environment 2 Game End Mask: {environment_2_gameEndMask}",
+        )
+        self.assertTrue(
+            environment_2_allGamesEnded == False,
+            f"Environment 2 All Games Ended value: {environment_2_allGamesEnded}",
+        )
+        self.assertTrue(
+            equalNumpyArrays(environment_2.stateSpace.shape, numpy.array([3, 6, 6])),
+            f"Environment 2 State space shape: {environment_2.stateSpace.shape}",
+        )
+        self.assertTrue(
+            equalNumpyArrays(
+                environment_2.snake.getSnakeLength(), numpy.array([1, 1, 1])
+            ),
+            f"Environment 2 snake length: {environment_2.snake.getSnakeLength()}",
+        )
+        self.assertTrue(
+            equalNumpyArrays(environment_2.stateSpace[0, 0, 1], numpy.array(1)),
+            f"Environment 2 State Space value at (0, 0, 1): {environment_2.stateSpace[0, 0, 1]}",
+        )
+        self.assertTrue(
+            equalNumpyArrays((environment_2.stateSpace[0] == 2).sum(), numpy.array(1)),
+            f"Environment 2 State Space of reset game: {environment_2.stateSpace[0]}",
+        )
+        self.assertTrue(
+            equalNumpyArrays((environment_2.stateSpace[0] == 3).sum(), numpy.array(1)),
+            f"Environment 2 State Space of reset game: {environment_2.stateSpace[0]}",
+        )
+
+    def test_update_afterRemovingGames(self) -> None:
+        environment_2: Environment = Environment(
+            self.gameDimensions_2, self.numberOfGames_2
+        )
+
+        environment_2.snake.snakeBodyLocation[:, 0] = [[1, 1], [2, 2], [3, 3]]
+        environment_2.snake.foodLocation[:] = [[4, 4], [4, 4], [1, 1]]
+        environment_2.snake.rebuildOccupancyGrid()
+
+        environment_2.update([0, 1, 1])
+        environment_2_gameEndMask, _, _ = environment_2.update([1, 1])
+
+        self.assertTrue(
+            equalNumpyArrays(environment_2_gameEndMask, numpy.array([False, True])),
+            f"Environment 2 Game End Mask: {environment_2_gameEndMask}",
+        )
+
+    def test_update_maskMode(self) -> None:
+        environment_2: Environment = Environment(
+            self.gameDimensions_2, self.numberOfGames_2, endedGameMode="mask"
+        )
+
+        environment_2.snake.snakeBodyLocation[:, 0] = [[1, 1], [2, 2], [4, 4]]
+        environment_2.snake.foodLocation[:] = [[3, 3], [3, 3], [1, 1]]
+        environment_2.snake.rebuildOccupancyGrid()
+        environment_2.stateSpace[:, 1:-1, 1:-1] = 0
+        environment_2.drawInitialSnake()
+        environment_2.updateFoodLocation()
+
+        environment_2.update([0, 1, 0])
+        environment_2_stateSpace: numpy.ndarray = environment_2.stateSpace[0].copy()
+
+        (
+            environment_2_gameEndMask,
+            environment_2_snakeHitFoodMask,
+            environment_2_allGamesEnded,
+        ) = environment_2.update([2, 2, 3])
+
+        self.assertTrue(
+            equalNumpyArrays(
+                environment_2_gameEndMask, numpy.array([False, False, False])
+            ),
+            f"Environment 2 Game End Mask: {environment_2_gameEndMask}",
+        )
+        self.assertTrue(
+            equalNumpyArrays(
+                environment_2_snakeHitFoodMask, numpy.array([False, True, False])
+            ),
+            f"Environment 2 Snake Hit Food Mask: {environment_2_snakeHitFoodMask}",
+        )
+        self.assertTrue(
+            environment_2_allGamesEnded == False,
+            f"Environment 2 All Games Ended value: {environment_2_allGamesEnded}",
+        )
+        self.assertTrue(
+            equalNumpyArrays(
+                environment_2.activeGames, numpy.array([False, True, True])
+            ),
+            f"Environment 2 active games: {environment_2.activeGames}",
+        )
+        self.assertTrue(
+            equalNumpyArrays(environment_2.stateSpace[0], environment_2_stateSpace),
+            f"Environment 2 State Space of ended game: {environment_2.stateSpace[0]}",
+        )
+        self.assertTrue(
+            equalNumpyArrays(
+                environment_2.snake.getSnakeLength(), numpy.array([1, 2, 1])
+            ),
+            f"Environment 2 snake length: {environment_2.snake.getSnakeLength()}",
+        )
+
+        environment_2.update([0, 1, 0])
+        environment_2_gameEndMask, _, _ = environment_2.update([0, 1, 0])
+
+        self.assertTrue(
+            equalNumpyArrays(
+                environment_2_gameEndMask, numpy.array([False, True, False])
+            ),
+            f"Environment 2 Game End Mask: {environment_2_gameEndMask}",
+        )
+
+        environment_2_gameEndMask, _, environment_2_allGamesEnded = (
+            environment_2.update([0, 1, 0])
+        )
+
+        self.assertTrue(
+            equalNumpyArrays(
+                environment_2_gameEndMask, numpy.array([False, False, True])
+            ),
+            f"Environment 2 Game End Mask: {environment_2_gameEndMask}",
+        )
+        self.assertTrue(
+            environment_2_allGamesEnded == True,
+            f"Environment 2 All Games Ended value: {environment_2_allGamesEnded}",
+        )
+
+    def test_writeObservation(self) -> None:
+        environment_1: Environment = Environment(
+            self.gameDimensions_1, self.numberOfGames_1
+        )
+
+        environment_1_denseObservation: numpy.ndarray = numpy.zeros(
+            (2, 4, 5), dtype=numpy.uint8
+        )
+        environment_1_floatObservation: numpy.ndarray = numpy.zeros(
+            (2, 4, 5), dtype=numpy.float32
+        )
+        environment_1_oneHotObservation: numpy.ndarray = numpy.zeros(
+            (2, 4, 4, 5), dtype=numpy.float32
+        )
+
+        environment_1.writeObservation(environment_1_denseObservation)
+        environment_1.writeObservation(environment_1_floatObservation)
+        environment_1.writeObservation(environment_1_oneHotObservation)
+
+        self.assertTrue(
+            environment_1.stateSpace.dtype == numpy.uint8,
+            f"Environment 1 State Space dtype: {environment_1.stateSpace.dtype}",
+        )
+        self.assertTrue(
+            equalNumpyArrays(environment_1_denseObservation, environment_1.stateSpace),
+            f"Environment 1 dense observation: {environment_1_denseObservation}",
+        )
+        self.assertTrue(
+            numpy.allclose(
+                environment_1_floatObservation, environment_1.stateSpace / 3
+            ),
+            f"Environment 1 float observation: {environment_1_floatObservation}",
+        )
+        self.assertTrue(
+            equalNumpyArrays(
+                environment_1_oneHotObservation.argmax(1), environment_1.stateSpace
+            ),
+            f"Environment 1 one hot observation: {environment_1_oneHotObservation}",
+        )
+        self.assertTrue(
+            equalNumpyArrays(
+                environment_1_oneHotObservation.sum(1), numpy.ones((2, 4, 5))
+            ),
+            f"Environment 1 one hot observation: {environment_1_oneHotObservation}",
+        )
+
+    def test_update_out(self) -> None:
+        environment_2: Environment = Environment(
+            self.gameDimensions_2,
+            self.numberOfGames_2,
+            endedGameMode="reset",
+            observationDtype=numpy.int16,
+        )
+
+        environment_2_observation: numpy.ndarray = numpy.zeros(
+            (3, 6, 6), dtype=numpy.int16
+        )
+        environment_2.update([0, 1, 2], out=environment_2_observation)
+
+        self.assertTrue(
+            environment_2.stateSpace.dtype == numpy.int16,
+            f"Environment 2 State Space dtype: {environment_2.stateSpace.dtype}",
+        )
+        self.assertTrue(
+            equalNumpyArrays(environment_2_observation, environment_2.stateSpace),
+            f"Environment 2 observation: {environment_2_observation}",
+        )
+
+    def test_update_profile(self) -> None:
+        environment_2: Environment = Environment(
+            self.gameDimensions_2,
+            self.numberOfGames_2,
+            endedGameMode="reset",
+            profile=True,
+        )
+
+        environment_2.snake.snakeBodyLocation[:, 0] = [[1, 1], [2, 2], [4, 4]]
+        environment_2.snake.foodLocation[:] = [[3, 3], [2, 3], [1, 1]]
+        environment_2.snake.rebuildOccupancyGrid()
+
+        environment_2.update([0, 1, 0])
+        environment_2.update([1, 1, 1])
+
+        environment_2_statistics: dict[str, dict] = (
+            environment_2.profiler.getStatistics()
+        )
+
+        self.assertTrue(
+            environment_2_statistics["phases"]["generateMasks"]["calls"] == 2
+            and environment_2_statistics["phases"]["convertMoves"]["calls"] == 2
+            and environment_2_statistics["phases"]["updateSnakeHeading"]["calls"] == 2,
+            f"Environment 2 profile: {environment_2_statistics}",
+        )
+        self.assertTrue(
+            "writeObservation" not in environment_2_statistics["phases"],
+            f"Environment 2 profile: {environment_2_statistics}",
+        )
+        self.assertTrue(
+            environment_2_statistics["events"]["terminations"] >= 1,
+            f"Environment 2 profile: {environment_2_statistics}",
+        )
+        self.assertTrue(
+            environment_2_statistics["events"]["foodRespawns"] >= 1,
+            f"Environment 2 profile: {environment_2_statistics}",
+        )
+
+        environment_2.profiler.reset()
+
+        self.assertTrue(
+            environment_2.profiler.getStatistics() == {"phases": {}, "events": {}},
+            f"Environment 2 profile: {environment_2.profiler.getStatistics()}",
+        )
+
+    def test_update_lazyRenderMode(self) -> None:
+        for endedGameMode in ("remove", "reset", "mask"):
+            randomGenerator: numpy.random.Generator = numpy.random.default_rng(0)
+            environment_1: Environment = Environment(
+                [7, 6], 32, endedGameMode=endedGameMode, seed=3
+            )
+            environment_2: Environment = Environment(
+                [7, 6], 32, endedGameMode=endedGameMode, seed=3, renderMode="lazy"
+            )
+
+            for step in range(40):
+                moves: numpy.ndarray = randomGenerator.integers(
+                    4, size=environment_1.activeGames.shape[0]
+                )
+                environment_1.update(moves)
+                _, _, allGamesEnded = environment_2.update(moves)
+
+                self.assertTrue(
+                    environment_2.stateSpaceIsStale,
+                    f"State space rendered eagerly in {endedGameMode} mode",
+                )
+                if step % 3 == 0 or allGamesEnded:
+                    self.assertTrue(
+                        equalNumpyArrays(
+                            environment_1.stateSpace, environment_2.stateSpace
+                        ),
+                        f"State spaces differ in {endedGameMode} mode",
+                    )
+                    self.assertFalse(
+                        environment_2.stateSpaceIsStale,
+                        f"State space still stale in {endedGameMode} mode",
+                    )
+                if allGamesEnded:
+                    break
+
+    def test_getFeatureObservation(self) -> None:
+        environment_2: Environment = Environment(
+            self.gameDimensions_2, self.numberOfGames_2, renderMode="lazy"
+        )
+
+        environment_2.snake.snakeBodyLocation[:, 0] = [[1, 1], [2, 2], [4, 4]]
+        environment_2.snake.foodLocation[:] = [[3, 3], [2, 3], [1, 1]]
+        environment_2.snake.rebuildOccupancyGrid()
+
+        environment_2.update([2, 1, 0])
+        featureObservation: numpy.ndarray = environment_2.getFeatureObservation()
+
+        self.assertTrue(
+            equalNumpyArrays(featureObservation[0], numpy.array([2, 1, 3, 3, 1]))
+            and equalNumpyArrays(
+                featureObservation[1, [0, 1, 4]], numpy.array([2, 3, 2])
+            ),
+            f"Feature observation: {featureObservation}",
+        )
+        self.assertTrue(
+            featureObservation.dtype == numpy.int16,
+            f"Feature observation dtype: {featureObservation.dtype}",
+        )
+
+    def test_getEgocentricObservation(self) -> None:
+        environment_2: Environment = Environment(
+            self.gameDimensions_2, self.numberOfGames_2
+        )
+
+        environment_2.snake.snakeHeadIndex[:] = 35
+        environment_2.snake.currentBodyEndIndex[:] = 0
+        environment_2.snake.snakeBodyLocation[:, 35] = [[1, 1], [2, 3], [4, 4]]
+        environment_2.snake.snakeBodyLocation[:, 0] = [[2, 1], [2, 2], [4, 3]]
+        environment_2.snake.snakeHeading[:] = [0, 1, 1]
+        environment_2.snake.foodLocation[:] = [[1, 2], [1, 3], [3, 4]]
+        environment_2.snake.rebuildOccupancyGrid()
+        environment_2.stateSpace[:, 1:-1, 1:-1] = 0
+        environment_2.stateSpace[environment_2.snake.occupancyGrid] = 2
+        environment_2.updateFoodLocation()
+
+        window: numpy.ndarray = environment_2.getEgocentricObservation(3)
+        rotatedWindow: numpy.ndarray = environment_2.getEgocentricObservation(
+            3, rotate=True
+        )
+
+        self.assertTrue(
+            equalNumpyArrays(window[0], numpy.array([[1, 1, 1], [1, 2, 3], [1, 2, 0]])),
+            f"Window of game 0: {window[0]}",
+        )
+        self.assertTrue(
+            equalNumpyArrays(
+                rotatedWindow[1], numpy.array([[0, 0, 0], [3, 2, 0], [0, 2, 0]])
+            ),
+            f"Rotated window of game 1: {rotatedWindow[1]}",
+        )
+
+        environment_1: Environment = Environment(
+            [9, 7], 16, endedGameMode="reset", seed=4
+        )
+        randomGenerator: numpy.random.Generator = numpy.random.default_rng(4)
+        for _ in range(20):
+            environment_1.update(randomGenerator.integers(4, size=16))
+            out: numpy.ndarray = numpy.empty((16, 5, 5), dtype=numpy.uint8)
+            environment_1.getEgocentricObservation(5, rotate=True, out=out)
+
+            paddedStateSpace: numpy.ndarray = numpy.pad(
+                environment_1.stateSpace, ((0, 0), (2, 2), (2, 2)), constant_values=1
+            )
+            snakeHeadLocation: numpy.ndarray = (
+                environment_1.snake.getSnakeHeadLocation()
+            )
+            for gameIndex in range(16):
+                row, column = snakeHeadLocation[gameIndex]
+                expectedWindow: numpy.ndarray = numpy.rot90(
+                    paddedStateSpace[gameIndex, row : row + 5, column : column + 5],
+                    environment_1.snake.snakeHeading[gameIndex],
+                )
+                self.assertTrue(
+                    equalNumpyArrays(out[gameIndex], expectedWindow),
+                    f"Window: {out[gameIndex]}\nExpected window: {expectedWindow}",
+                )
+
+        with self.assertRaises(Exception):
+            environment_1.getEgocentricObservation(4)
+
+    def test_update_mapTemplate(self) -> None:
+        wallGrid: numpy.ndarray = MapTemplate.rectangle([9, 7]).wallGrid
+        wallGrid[3, 2:7] = True
+        mapTemplates: list[MapTemplate] = [
+            MapTemplate(wallGrid),
+            MapTemplate.torus([9, 7]),
+        ]
+
+        for mapTemplate in mapTemplates:
+            randomGenerator: numpy.random.Generator = numpy.random.default_rng(5)
+            environment_1: Environment = Environment(
+                [9, 7], 32, endedGameMode="reset", seed=5, mapTemplate=mapTemplate
+            )
+            environment_2: Environment = Environment(
+                [9, 7],
+                32,
+                endedGameMode="reset",
+                seed=5,
+                renderMode="lazy",
+                mapTemplate=mapTemplate,
+            )
+
+            for _ in range(30):
+                moves: numpy.ndarray = randomGenerator.integers(4, size=32)
+                environment_1.update(moves)
+                environment_2.update(moves)
+
+                self.assertTrue(
+                    equalNumpyArrays(
+                        environment_1.stateSpace == 1,
+                        numpy.broadcast_to(mapTemplate.wallGrid, (32, 7, 9)),
+                    ),
+                    f"Walls: {environment_1.stateSpace == 1}",
+                )
+                self.assertTrue(
+                    equalNumpyArrays(
+                        environment_1.stateSpace, environment_2.stateSpace
+                    ),
+                    "Eager and lazy state spaces differ",
+                )
+
+        self.assertTrue(
+            (environment_1.getEgocentricObservation(11) != 1).all(),
+            "Torus windows should wrap instead of reading walls",
+        )
+
+    def test_update_mixedMapTemplates(self) -> None:
+        mapTemplates: list[MapTemplate] = [
+            MapTemplate.rectangle([6, 5]),
+            MapTemplate.torus([5, 4]),
+            MapTemplate.rectangle([9, 7]),
+        ]
+        templateIndicies: numpy.ndarray = numpy.arange(48) % 3
+        environments: list[Environment] = [
+            Environment(
+                [9, 7],
+                48,
+                endedGameMode="reset",
+                seed=6,
+                backend=backend,
+                renderMode=renderMode,
+                mapTemplate=mapTemplates,
+                templateIndicies=templateIndicies,
+            )
+            for backend, renderMode in (
+                ("numpy", "eager"),
+                ("numpy", "lazy"),
+                ("numba", "eager"),
+                ("numba", "lazy"),
+            )
+        ]
+        randomGenerator: numpy.random.Generator = numpy.random.default_rng(6)
+        wallGrid: numpy.ndarray = environments[0].snake.getWallGrid()
+        templateShapes: numpy.ndarray = environments[0].snake.templateShapes[
+            templateIndicies
+        ]
+
+        for _ in range(50):
+            moves: numpy.ndarray = randomGenerator.integers(4, size=48)
+            updateResults: list[tuple] = [
+                environment.update(moves) for environment in environments
+            ]
+
+            for environment, updateResult in zip(environments[1:], updateResults[1:]):
+                self.assertTrue(
+                    equalNumpyArrays(updateResult[0], updateResults[0][0])
+                    and equalNumpyArrays(updateResult[1], updateResults[0][1]),
+                    f"Game End Mask: {updateResult[0]}\nExpected: {updateResults[0][0]}",
+                )
+                self.assertTrue(
+                    equalNumpyArrays(
+                        environment.stateSpace, environments[0].stateSpace
+                    ),
+                    f"State spaces differ for {environment.backend}, {environment.renderMode}",
+                )
+
+            snakeHeadLocation: numpy.ndarray = environments[
+                0
+            ].snake.getSnakeHeadLocation()
+            self.assertTrue(
+                (snakeHeadLocation < templateShapes).all(),
+                f"Snake heads left their maps: {snakeHeadLocation}",
+            )
+            self.assertTrue(
+                equalNumpyArrays(environments[0].stateSpace == 1, wallGrid),
+                f"Walls: {environments[0].stateSpace == 1}",
+            )
+
+        self.assertTrue(
+            (environments[0].getEgocentricObservation(7)[1::3] != 1).all(),
+            "Torus windows should wrap inside their own map",
+        )
+
+    def test_update_reverseMoveMode(self) -> None:
+        randomGenerator: numpy.random.Generator = numpy.random.default_rng(7)
+        environment_1: Environment = Environment(
+            [8, 8], 64, endedGameMode="reset", seed=7
+        )
+        environment_2: Environment = Environment(
+            [8, 8], 64, endedGameMode="reset", seed=7, reverseMoveMode="straight"
+        )
+
+        for _ in range(100):
+            legalMoveMask: numpy.ndarray = environment_2.getLegalMoveMask()
+            moves: numpy.ndarray = randomGenerator.integers(4, size=64)
+            convertedMoves: numpy.ndarray = environment_2.snake.convertReverseMoves(
+                moves
+            )
+            gameEndMask_1, _, _ = environment_1.update(convertedMoves)
+            gameEndMask_2, _, _ = environment_2.update(moves)
+
+            self.assertTrue(
+                equalNumpyArrays(gameEndMask_1, gameEndMask_2)
+                and equalNumpyArrays(
+                    environment_1.stateSpace, environment_2.stateSpace
+                ),
+                "Reverse moves should step as continuing straight",
+            )
+            self.assertTrue(
+                equalNumpyArrays(
+                    gameEndMask_2, ~legalMoveMask[numpy.arange(64), moves]
+                ),
+                f"Game End Mask: {gameEndMask_2}\nLegal Move Mask: {legalMoveMask}",
+            )
+
+        with self.assertRaises(Exception):
+            Environment([8, 8], 64, reverseMoveMode="ignore")
+
+    def test_update_relativeActionSpace(self) -> None:
+        randomGenerator: numpy.random.Generator = numpy.random.default_rng(8)
+        environment_1: Environment = Environment(
+            [8, 8], 64, endedGameMode="reset", seed=8
+        )
+        environment_2: Environment = Environment(
+            [8, 8], 64, endedGameMode="reset", seed=8, actionSpace="relative"
+        )
+
+        for _ in range(100):
+            legalMoveMask: numpy.ndarray = environment_2.getLegalMoveMask()
+            moves: numpy.ndarray = randomGenerator.integers(3, size=64)
+            absoluteMoves: numpy.ndarray = environment_2.snake.convertRelativeMoves(
+                moves
+            )
+            gameEndMask_1, _, _ = environment_1.update(absoluteMoves)
+            gameEndMask_2, _, _ = environment_2.update(moves)
+
+            self.assertTrue(
+                equalNumpyArrays(gameEndMask_1, gameEndMask_2)
+                and equalNumpyArrays(
+                    environment_1.stateSpace, environment_2.stateSpace
+                ),
+                "Relative moves should step as their absolute moves",
+            )
+            self.assertTrue(
+                legalMoveMask.shape == (64, 3)
+                and equalNumpyArrays(
+                    gameEndMask_2, ~legalMoveMask[numpy.arange(64), moves]
+                ),
+                f"Game End Mask: {gameEndMask_2}\nLegal Move Mask: {legalMoveMask}",
+            )
+
+        with self.assertRaises(Exception):
+            Environment([8, 8], 64, actionSpace="egocentric")
+
+    def test_init_unknownRenderMode(self) -> None:
+        with self.assertRaises(Exception):
+            Environment(self.gameDimensions_2, self.numberOfGames_2, renderMode="never")
+
+    def test_init_unknownEndedGameMode(self) -> None:
+        with self.assertRaises(Exception):
+            Environment(self.gameDimensions_1, self.numberOfGames_1, "pause")
+
     def test_updateFoodLocation_Array(self) -> None:
         environment_1: Environment = Environment(
             self.gameDimensions_1, self.numberOfGames_1
@@ -502,6 +1078,15 @@ class TestEnvironment(unittest.TestCase):
         environment_1.removeEndedGames(environment_1_gameEndMask)
         environment_2.removeEndedGames(environment_2_gameEndMask)
 
+        self.assertTrue(
+            equalNumpyArrays(environment_1.gameIndicies, numpy.array([0])),
+            f"Environment 1 game indicies: {environment_1.gameIndicies}",
+        )
+        self.assertTrue(
+            equalNumpyArrays(environment_2.gameIndicies, numpy.array([1, 2])),
+            f"Environment 2 game indicies: {environment_2.gameIndicies}",
+        )
+
         self.assertTrue(
             equalNumpyArrays(
                 environment_1.stateSpace.shape, environment_1_stateSpace_shape
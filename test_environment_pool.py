@@ -0,0 +1,91 @@
+import unittest
+import numpy
+from environment_pool import EnvironmentPool
+
+
+def equalNumpyArrays(array_1: numpy.ndarray, array_2: numpy.ndarray) -> bool:
+    equalInPlace: numpy.ndarray = array_1 == array_2
+    equal: bool = bool(equalInPlace.all())
+    return equal
+
+
+class TestEnvironmentPool(unittest.TestCase):
+    def setUp(self) -> None:
+        self.gameDimensions: list[int] = [6, 5]
+        self.numberOfGames: int = 5
+        self.numberOfWorkers: int = 2
+
+    def test_init_exceptions(self) -> None:
+        with self.assertRaises(Exception):
+            EnvironmentPool(self.gameDimensions, self.numberOfGames, 0)
+
+        with self.assertRaises(Exception):
+            EnvironmentPool(self.gameDimensions, self.numberOfGames, 6)
+
+    def test_reset(self) -> None:
+        with EnvironmentPool(
+            self.gameDimensions, self.numberOfGames, self.numberOfWorkers
+        ) as environmentPool:
+            observation: numpy.ndarray = environmentPool.reset()
+
+            self.assertTrue(
+                observation.shape == (5, 5, 6),
+                f"Observation shape: {observation.shape}",
+            )
+            self.assertTrue(
+                equalNumpyArrays(environmentPool.shardBounds, numpy.array([0, 2, 5])),
+                f"Shard bounds: {environmentPool.shardBounds}",
+            )
+            self.assertTrue(
+                equalNumpyArrays((observation == 2).sum(axis=(1, 2)), numpy.ones(5)),
+                f"Observation: {observation}",
+            )
+            self.assertTrue(
+                equalNumpyArrays((observation == 3).sum(axis=(1, 2)), numpy.ones(5)),
+                f"Observation: {observation}",
+            )
+
+    def test_seed(self) -> None:
+        with EnvironmentPool(
+            self.gameDimensions, self.numberOfGames, self.numberOfWorkers, seed=5
+        ) as environmentPool_1, EnvironmentPool(
+            self.gameDimensions, self.numberOfGames, self.numberOfWorkers, seed=5
+        ) as environmentPool_2:
+            moves: numpy.ndarray = numpy.ones((self.numberOfGames), dtype=numpy.int8)
+            for _ in range(10):
+                observation_1, _, _ = environmentPool_1.step(moves)
+                observation_2, _, _ = environmentPool_2.step(moves)
+
+                self.assertTrue(
+                    equalNumpyArrays(observation_1, observation_2),
+                    f"Observation 1: {observation_1}\nObservation 2: {observation_2}",
+                )
+
+    def test_step(self) -> None:
+        with EnvironmentPool(
+            self.gameDimensions, self.numberOfGames, self.numberOfWorkers
+        ) as environmentPool:
+            observation: numpy.ndarray = environmentPool.reset()
+
+            for _ in range(20):
+                observation, gameEndMask, snakeHitFoodMask = environmentPool.step(
+                    numpy.zeros((self.numberOfGames), dtype=numpy.int8)
+                )
+
+                self.assertTrue(
+                    observation.shape == (5, 5, 6),
+                    f"Observation shape: {observation.shape}",
+                )
+                self.assertTrue(
+                    gameEndMask.shape == (5,) and snakeHitFoodMask.shape == (5,),
+                    f"Game End Mask: {gameEndMask}\nSnake Hit Food Mask: {snakeHitFoodMask}",
+                )
+
+            self.assertTrue(
+                equalNumpyArrays((observation == 3).sum(axis=(1, 2)), numpy.ones(5)),
+                f"Observation: {observation}",
+            )
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,336 @@
+import tempfile
+import unittest
+import warnings
+import numpy
+from environment import Environment
+from episode_store import (
+    HIT_FOOD_FLAG,
+    TERMINATED_FLAG,
+    TRUNCATED_FLAG,
+    EpisodeRecorder,
+    EpisodeStore,
+)
+from vector_environment import VectorEnvironment
+
+
+def equalNumpyArrays(array_1: numpy.ndarray, array_2: numpy.ndarray) -> bool:
+    equalInPlace: numpy.ndarray = array_1 == array_2
+    equal: bool = bool(equalInPlace.all())
+    return equal
+
+
+class TestEpisodeStore(unittest.TestCase):
+    def setUp(self) -> None:
+        self.gameDimensions: list[int] = [6, 5]
+        self.numberOfGames: int = 8
+        self.temporaryDirectory = tempfile.TemporaryDirectory()
+        self.directory: str = self.temporaryDirectory.name
+
+    def tearDown(self) -> None:
+        self.temporaryDirectory.cleanup()
+
+    def recordEpisodes(
+        self, episodeStore: EpisodeStore, numberOfSteps: int
+    ) -> list[numpy.ndarray]:
+        environment: Environment = Environment(
+            self.gameDimensions, self.numberOfGames, endedGameMode="reset", seed=0
+        )
+        episodeRecorder: EpisodeRecorder = EpisodeRecorder(
+            episodeStore, environment, 64
+        )
+        randomGenerator: numpy.random.Generator = numpy.random.default_rng(0)
+        finalBoards: numpy.ndarray = numpy.zeros_like(environment.stateSpace)
+
+        gameFrames: list[list[numpy.ndarray]] = [
+            [environment.stateSpace[gameIndex].copy()]
+            for gameIndex in range(self.numberOfGames)
+        ]
+        episodeFrames: list[numpy.ndarray] = []
+        for _ in range(numberOfSteps):
+            actions: numpy.ndarray = randomGenerator.integers(
+                4, size=self.numberOfGames
+            )
+            gameEndMask, snakeHitFoodMask, _ = environment.update(
+                actions, finalOut=finalBoards
+            )
+            episodeRecorder.record(actions, gameEndMask, snakeHitFoodMask)
+
+            for gameIndex in range(self.numberOfGames):
+                if gameEndMask[gameIndex]:
+                    gameFrames[gameIndex].append(finalBoards[gameIndex].copy())
+                    episodeFrames.append(numpy.stack(gameFrames[gameIndex]))
+                    gameFrames[gameIndex] = []
+                gameFrames[gameIndex].append(environment.stateSpace[gameIndex].copy())
+        return episodeFrames
+
+    def test_replayEpisodes(self) -> None:
+        episodeStore: EpisodeStore = EpisodeStore(
+            self.directory, self.gameDimensions, chunkSize=16
+        )
+        episodeFrames: list[numpy.ndarray] = self.recordEpisodes(episodeStore, 40)
+        episodeIndicies: numpy.ndarray = numpy.arange(episodeStore.numberOfEpisodes)
+
+        frames, episodeLengths = episodeStore.replayEpisodes(episodeIndicies)
+
+        self.assertTrue(
+            episodeStore.numberOfEpisodes == len(episodeFrames)
+            and episodeStore.numberOfSteps > 16,
+            f"Episodes: {episodeStore.numberOfEpisodes}, steps: {episodeStore.numberOfSteps}",
+        )
+        for episodeIndex in episodeIndicies:
+            self.assertTrue(
+                equalNumpyArrays(
+                    frames[episodeIndex, : episodeLengths[episodeIndex] + 1],
+                    episodeFrames[episodeIndex],
+                ),
+                f"Replayed frames of episode {episodeIndex} differ",
+            )
+
+    def test_readStep(self) -> None:
+        episodeStore: EpisodeStore = EpisodeStore(
+            self.directory, self.gameDimensions, chunkSize=4
+        )
+        episodeStore.appendEpisodes(
+            numpy.array([[1, 1], [2, 2]]),
+            numpy.array([[3, 3], [1, 4]]),
+            numpy.array([[1, 1, 2, 0, 0], [3, 2, 1, 0, 3]]),
+            numpy.tile(numpy.array([[[3, 3]], [[1, 4]]]), (1, 5, 1)),
+            numpy.array([[False, True, False, False, False], [False] * 5]),
+            numpy.array([[False, False, True, False, False], [False] * 4 + [True]]),
+            numpy.array([3, 5]),
+        )
+        episodeStore.flush()
+        episodeStore = EpisodeStore(self.directory)
+
+        step = episodeStore.readStep(1, 3)
+
+        self.assertTrue(
+            episodeStore.numberOfSteps == 8
+            and step["action"] == 0
+            and step["flags"] == 0
+            and equalNumpyArrays(step["foodLocation"], numpy.array([1, 4])),
+            f"Step: {step}",
+        )
+        self.assertTrue(
+            equalNumpyArrays(
+                episodeStore.readEpisode(0)["flags"],
+                numpy.array([0, HIT_FOOD_FLAG, TERMINATED_FLAG]),
+            ),
+            f"Episode 0: {episodeStore.readEpisode(0)}",
+        )
+        self.assertTrue(
+            equalNumpyArrays(
+                episodeStore.readEpisode(1)["action"], numpy.array([3, 2, 1, 0, 3])
+            ),
+            f"Episode 1: {episodeStore.readEpisode(1)}",
+        )
+
+        with self.assertRaises(Exception):
+            episodeStore.readStep(0, 3)
+
+    def test_appendEpisodes_growIndex(self) -> None:
+        episodeStore: EpisodeStore = EpisodeStore(
+            self.directory, self.gameDimensions, indexCapacity=2
+        )
+        for episodeLength in range(1, 6):
+            episodeStore.appendEpisodes(
+                numpy.array([[1, 1]]),
+                numpy.array([[3, 3]]),
+                numpy.full((1, episodeLength), episodeLength % 4),
+                numpy.full((1, episodeLength, 2), 3),
+                numpy.zeros((1, episodeLength), dtype=bool),
+                numpy.arange(episodeLength)[None, :] == episodeLength - 1,
+                numpy.array([episodeLength]),
+            )
+        episodeStore.flush()
+        episodeStore = EpisodeStore(self.directory)
+
+        self.assertTrue(
+            isinstance(episodeStore.indexBuffer, numpy.memmap)
+            and equalNumpyArrays(episodeStore.index["length"], numpy.arange(1, 6))
+            and equalNumpyArrays(
+                episodeStore.index["stepOffset"], numpy.array([0, 1, 3, 6, 10])
+            ),
+            f"Index: {episodeStore.index}",
+        )
+        self.assertTrue(
+            episodeStore.numberOfSteps == 15
+            and equalNumpyArrays(
+                episodeStore.readEpisode(4)["action"], numpy.full((5), 1)
+            ),
+            f"Episode 4: {episodeStore.readEpisode(4)}",
+        )
+
+    def test_record_truncateLongEpisodes(self) -> None:
+        episodeStore: EpisodeStore = EpisodeStore(self.directory, self.gameDimensions)
+        environment: Environment = Environment(
+            self.gameDimensions, self.numberOfGames, endedGameMode="reset", seed=3
+        )
+        episodeRecorder: EpisodeRecorder = EpisodeRecorder(episodeStore, environment, 4)
+        randomGenerator: numpy.random.Generator = numpy.random.default_rng(3)
+        finalBoards: numpy.ndarray = numpy.zeros_like(environment.stateSpace)
+
+        # Frames before every recorded step, mirroring which episodes get stored.
+        gameFrames: list[list[numpy.ndarray]] = [[] for _ in range(self.numberOfGames)]
+        skippedGames: list[bool] = [False] * self.numberOfGames
+        episodeFrames: list[numpy.ndarray] = []
+        for _ in range(40):
+            for gameIndex in range(self.numberOfGames):
+                if not skippedGames[gameIndex]:
+                    gameFrames[gameIndex].append(
+                        environment.stateSpace[gameIndex].copy()
+                    )
+            actions: numpy.ndarray = randomGenerator.integers(
+                4, size=self.numberOfGames
+            )
+            gameEndMask, snakeHitFoodMask, _ = environment.update(
+                actions, finalOut=finalBoards
+            )
+            with warnings.catch_warnings(record=True) as caughtWarnings:
+                warnings.simplefilter("always")
+                episodeRecorder.record(actions, gameEndMask, snakeHitFoodMask)
+
+            bufferFull: bool = any(
+                not skippedGames[gameIndex]
+                and not gameEndMask[gameIndex]
+                and len(gameFrames[gameIndex]) == 4
+                for gameIndex in range(self.numberOfGames)
+            )
+            self.assertTrue(
+                len(caughtWarnings) == int(bufferFull),
+                f"Warnings: {[str(warning.message) for warning in caughtWarnings]}",
+            )
+
+            for gameIndex in range(self.numberOfGames):
+                if skippedGames[gameIndex]:
+                    skippedGames[gameIndex] = not gameEndMask[gameIndex]
+                elif gameEndMask[gameIndex] or len(gameFrames[gameIndex]) == 4:
+                    gameFrames[gameIndex].append(
+                        finalBoards[gameIndex].copy()
+                        if gameEndMask[gameIndex]
+                        else environment.stateSpace[gameIndex].copy()
+                    )
+                    episodeFrames.append(numpy.stack(gameFrames[gameIndex]))
+                    gameFrames[gameIndex] = []
+                    skippedGames[gameIndex] = not gameEndMask[gameIndex]
+
+        frames, episodeLengths = episodeStore.replayEpisodes(
+            numpy.arange(episodeStore.numberOfEpisodes)
+        )
+        lastFlags: numpy.ndarray = numpy.array(
+            [
+                episodeStore.readEpisode(episodeIndex)["flags"][-1]
+                for episodeIndex in range(episodeStore.numberOfEpisodes)
+            ]
+        )
+
+        self.assertTrue(
+            episodeStore.numberOfEpisodes == len(episodeFrames)
+            and (lastFlags & TRUNCATED_FLAG).any(),
+            f"Episodes: {episodeStore.numberOfEpisodes}, last flags: {lastFlags}",
+        )
+        self.assertTrue(
+            equalNumpyArrays(
+                (lastFlags & TRUNCATED_FLAG) > 0,
+                (lastFlags & TERMINATED_FLAG) == 0,
+            )
+            and (episodeLengths[(lastFlags & TRUNCATED_FLAG) > 0] == 4).all(),
+            f"Episode lengths: {episodeLengths}, last flags: {lastFlags}",
+        )
+        for episodeIndex, expectedFrames in enumerate(episodeFrames):
+            self.assertTrue(
+                equalNumpyArrays(
+                    frames[episodeIndex, : episodeLengths[episodeIndex] + 1],
+                    expectedFrames,
+                ),
+                f"Replayed frames of episode {episodeIndex} differ",
+            )
+
+    def test_record_vectorEnvironmentTruncation(self) -> None:
+        episodeStore: EpisodeStore = EpisodeStore(self.directory, self.gameDimensions)
+        vectorEnvironment: VectorEnvironment = VectorEnvironment(
+            self.gameDimensions, self.numberOfGames, maxEpisodeLength=5, seed=0
+        )
+        observation, _ = vectorEnvironment.reset()
+        episodeRecorder: EpisodeRecorder = EpisodeRecorder(
+            episodeStore, vectorEnvironment.environment, 64
+        )
+        randomGenerator: numpy.random.Generator = numpy.random.default_rng(0)
+
+        gameFrames: list[list[numpy.ndarray]] = [
+            [observation[gameIndex].copy()] for gameIndex in range(self.numberOfGames)
+        ]
+        episodeFrames: list[numpy.ndarray] = []
+        for _ in range(60):
+            actions: numpy.ndarray = randomGenerator.integers(
+                4, size=self.numberOfGames
+            )
+            observation, _, terminated, truncated, info = vectorEnvironment.step(
+                actions
+            )
+            episodeRecorder.record(
+                actions,
+                terminated,
+                info["snakeHitFood"],
+                truncated,
+                info["foodLocation"],
+            )
+
+            for gameIndex in range(self.numberOfGames):
+                if info["finalObservationMask"][gameIndex]:
+                    gameFrames[gameIndex].append(
+                        info["finalObservation"][gameIndex].copy()
+                    )
+                    episodeFrames.append(numpy.stack(gameFrames[gameIndex]))
+                    gameFrames[gameIndex] = []
+                gameFrames[gameIndex].append(observation[gameIndex].copy())
+
+        frames, episodeLengths = episodeStore.replayEpisodes(
+            numpy.arange(episodeStore.numberOfEpisodes)
+        )
+        truncatedEpisodes: numpy.ndarray = numpy.array(
+            [
+                episodeStore.readEpisode(episodeIndex)["flags"][-1] & TRUNCATED_FLAG
+                for episodeIndex in range(episodeStore.numberOfEpisodes)
+            ]
+        )
+
+        self.assertTrue(
+            episodeStore.numberOfEpisodes == len(episodeFrames)
+            and truncatedEpisodes.sum() > 0
+            and (episodeLengths[truncatedEpisodes > 0] == 5).all(),
+            f"Episodes: {episodeStore.numberOfEpisodes}, lengths: {episodeLengths}",
+        )
+        for episodeIndex, expectedFrames in enumerate(episodeFrames):
+            self.assertTrue(
+                equalNumpyArrays(
+                    frames[episodeIndex, : episodeLengths[episodeIndex] + 1],
+                    expectedFrames,
+                ),
+                f"Replayed frames of episode {episodeIndex} differ",
+            )
+
+    def test_record_truncatedGamesNotReset(self) -> None:
+        episodeStore: EpisodeStore = EpisodeStore(self.directory, self.gameDimensions)
+        environment: Environment = Environment(
+            self.gameDimensions, self.numberOfGames, endedGameMode="reset", seed=4
+        )
+        environment.snake.placeLongSnakes(0.3)
+        environment.renderStateSpace()
+        episodeRecorder: EpisodeRecorder = EpisodeRecorder(
+            episodeStore, environment, 16
+        )
+        actions: numpy.ndarray = numpy.argmax(environment.getLegalMoveMask(), axis=1)
+
+        gameEndMask, snakeHitFoodMask, _ = environment.update(actions)
+
+        with self.assertRaises(Exception):
+            episodeRecorder.record(actions, gameEndMask, snakeHitFoodMask, ~gameEndMask)
+
+    def test_init_missingStore(self) -> None:
+        with self.assertRaises(Exception):
+            EpisodeStore(self.directory)
+
+
+if __name__ == "__main__":
+    unittest.main()
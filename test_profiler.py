@@ -0,0 +1,66 @@
+import unittest
+import numpy
+from profiler import NullPhaseProfiler, PhaseProfiler
+
+
+class TestPhaseProfiler(unittest.TestCase):
+    def test_record(self) -> None:
+        profiler: PhaseProfiler = PhaseProfiler()
+
+        phaseStart: float = profiler.start()
+        phaseStart = profiler.record("first", phaseStart)
+        phaseStart = profiler.record("second", phaseStart)
+        profiler.record("first", phaseStart)
+
+        statistics: dict[str, dict] = profiler.getStatistics()
+
+        self.assertTrue(
+            list(statistics["phases"]) == ["first", "second"],
+            f"Phases: {statistics['phases']}",
+        )
+        self.assertTrue(
+            statistics["phases"]["first"]["calls"] == 2,
+            f"First phase: {statistics['phases']['first']}",
+        )
+        self.assertTrue(
+            statistics["phases"]["second"]["seconds"] >= 0,
+            f"Second phase: {statistics['phases']['second']}",
+        )
+
+    def test_count(self) -> None:
+        profiler: PhaseProfiler = PhaseProfiler()
+
+        profiler.count("terminations", numpy.array([True, False, True]))
+        profiler.count("terminations", numpy.array([False, True]))
+
+        self.assertTrue(
+            profiler.getStatistics()["events"] == {"terminations": 3},
+            f"Events: {profiler.getStatistics()['events']}",
+        )
+
+    def test_reset(self) -> None:
+        profiler: PhaseProfiler = PhaseProfiler()
+
+        profiler.record("first", profiler.start())
+        profiler.count("terminations", numpy.array([True]))
+        profiler.reset()
+
+        self.assertTrue(
+            profiler.getStatistics() == {"phases": {}, "events": {}},
+            f"Statistics: {profiler.getStatistics()}",
+        )
+
+    def test_nullProfiler(self) -> None:
+        profiler: NullPhaseProfiler = NullPhaseProfiler()
+
+        profiler.record("first", profiler.start())
+        profiler.count("terminations", numpy.array([True]))
+
+        self.assertTrue(
+            profiler.getStatistics() == {"phases": {}, "events": {}},
+            f"Statistics: {profiler.getStatistics()}",
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,121 @@
+import unittest
+import numpy
+from environment import Environment
+from renderer import generateCellTypes, writeChannelObservation, writeImageObservation
+
+
+def equalNumpyArrays(array_1: numpy.ndarray, array_2: numpy.ndarray) -> bool:
+    equalInPlace: numpy.ndarray = array_1 == array_2
+    equal: bool = bool(equalInPlace.all())
+    return equal
+
+
+class TestRenderer(unittest.TestCase):
+    def setUp(self) -> None:
+        self.gameDimensions: list[int] = [6, 5]
+        self.numberOfGames: int = 2
+
+        self.environment: Environment = Environment(
+            self.gameDimensions, self.numberOfGames, renderMode="lazy"
+        )
+        snake = self.environment.snake
+        snake.snakeHeadIndex[:] = [29, 0]
+        snake.currentBodyEndIndex[:] = [1, 0]
+        snake.snakeBodyLocation[0, 29] = [1, 1]
+        snake.snakeBodyLocation[0, 0] = [1, 2]
+        snake.snakeBodyLocation[0, 1] = [2, 2]
+        snake.snakeBodyLocation[1, 0] = [3, 4]
+        snake.foodLocation[:] = [[3, 3], [1, 1]]
+        snake.rebuildOccupancyGrid()
+
+    def test_generateCellTypes(self) -> None:
+        cellTypes: numpy.ndarray = generateCellTypes(self.environment)
+
+        self.assertTrue(
+            equalNumpyArrays(
+                cellTypes[0],
+                numpy.array(
+                    [
+                        [1, 1, 1, 1, 1, 1],
+                        [1, 4, 2, 0, 0, 1],
+                        [1, 0, 2, 0, 0, 1],
+                        [1, 0, 0, 3, 0, 1],
+                        [1, 1, 1, 1, 1, 1],
+                    ]
+                ),
+            ),
+            f"Cell types of game 0: {cellTypes[0]}",
+        )
+
+    def test_writeChannelObservation(self) -> None:
+        out: numpy.ndarray = numpy.empty((2, 5, 5, 6), dtype=numpy.float32)
+        writeChannelObservation(self.environment, out, bodyAge=True)
+
+        self.assertTrue(
+            equalNumpyArrays(out[:, 0], self.environment.stateSpace == 1),
+            f"Wall channel: {out[:, 0]}",
+        )
+        self.assertTrue(
+            equalNumpyArrays(
+                numpy.argwhere(out[:, 1]), numpy.array([[0, 1, 2], [0, 2, 2]])
+            ),
+            f"Body channel: {out[:, 1]}",
+        )
+        self.assertTrue(
+            equalNumpyArrays(
+                numpy.argwhere(out[:, 2]), numpy.array([[0, 1, 1], [1, 3, 4]])
+            ),
+            f"Head channel: {out[:, 2]}",
+        )
+        self.assertTrue(
+            equalNumpyArrays(
+                numpy.argwhere(out[:, 3]), numpy.array([[0, 3, 3], [1, 1, 1]])
+            ),
+            f"Food channel: {out[:, 3]}",
+        )
+        self.assertTrue(
+            numpy.allclose(out[0, 4, [1, 1, 2], [1, 2, 2]], [1 / 3, 2 / 3, 1])
+            and out[1, 4, 3, 4] == 1
+            and numpy.count_nonzero(out[:, 4]) == 4,
+            f"Body age channel: {out[:, 4]}",
+        )
+
+        out = numpy.empty((2, 5, 5, 6), dtype=numpy.uint8)
+        writeChannelObservation(self.environment, out, bodyAge=True)
+
+        self.assertTrue(
+            equalNumpyArrays(out[0, 4, [1, 1, 2], [1, 2, 2]], numpy.array([1, 2, 3])),
+            f"Body age channel: {out[:, 4]}",
+        )
+
+        with self.assertRaises(Exception):
+            writeChannelObservation(self.environment, out)
+
+    def test_writeImageObservation(self) -> None:
+        out: numpy.ndarray = numpy.empty((2, 3, 10, 12), dtype=numpy.uint8)
+        writeImageObservation(self.environment, out, scale=2)
+        cellTypes: numpy.ndarray = generateCellTypes(self.environment)
+
+        self.assertTrue(
+            equalNumpyArrays(out[:, :, ::2, ::2], out[:, :, 1::2, 1::2]),
+            "Scaled blocks are not uniform",
+        )
+        self.assertTrue(
+            equalNumpyArrays(out[0, :, 6, 6], out[1, :, 2, 2])
+            and not equalNumpyArrays(out[0, :, 6, 6], out[0, :, 2, 2]),
+            f"Food and head colours: {out[0, :, 6, 6]}, {out[0, :, 2, 2]}",
+        )
+        self.assertTrue(
+            equalNumpyArrays(
+                (out[:, :, ::2, ::2] == out[:, :, :1, :1]).all(1),
+                cellTypes == cellTypes[:, :1, :1],
+            ),
+            "Image colours do not follow the cell types",
+        )
+
+        with self.assertRaises(Exception):
+            writeImageObservation(self.environment, out, scale=3)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,6 +1,12 @@
 import unittest
 import numpy
-from snake import Snake
+from snake import (
+    MapTemplate,
+    Snake,
+    generateCellCoordinates,
+    generateNextCellTable,
+    generateWallCells,
+)
 
 
 def makeFoodSameAsHead(snake: Snake):
@@ -41,6 +47,31 @@ class TestSnake(unittest.TestCase):
         self.assertTrue(snake_1.foodLocation.shape == (2, 2))
         self.assertTrue(snake_2.foodLocation.shape == (3, 2))
 
+    def test_seed(self) -> None:
+        snake_1: Snake = Snake(self.gameDimensions_2, 50, seed=7)
+        snake_2: Snake = Snake(self.gameDimensions_2, 50, seed=7)
+
+        self.assertTrue(
+            equalNumpyArrays(snake_1.foodLocation, snake_2.foodLocation),
+            f"Snake 1 food: {snake_1.foodLocation}\nSnake 2 food: {snake_2.foodLocation}",
+        )
+        self.assertTrue(
+            equalNumpyArrays(
+                snake_1.getSnakeHeadLocation(), snake_2.getSnakeHeadLocation()
+            ),
+            f"Snake 1 head: {snake_1.getSnakeHeadLocation()}\nSnake 2 head: {snake_2.getSnakeHeadLocation()}",
+        )
+
+        snake_1.seed(11)
+        snake_2.seed(11)
+        snake_1.generateCoordinatesFromMask(numpy.ones((50), dtype=bool))
+        snake_2.generateCoordinatesFromMask(numpy.ones((50), dtype=bool))
+
+        self.assertTrue(
+            equalNumpyArrays(snake_1.foodLocation, snake_2.foodLocation),
+            f"Snake 1 food: {snake_1.foodLocation}\nSnake 2 food: {snake_2.foodLocation}",
+        )
+
     def test_generateRandomLocation_exceptions(self) -> None:
         snake_1 = Snake(self.gameDimensions_1, self.numberOfGames_1)
         snake_2 = Snake(self.gameDimensions_2, self.numberOfGames_2)
@@ -122,6 +153,39 @@ class TestSnake(unittest.TestCase):
                 == False,
             )
 
+    def test_resetGameState_subset(self) -> None:
+        snake_2: Snake = Snake(self.gameDimensions_2, self.numberOfGames_2)
+
+        snake_2.snakeHeadIndex[:] = [35, 35, 35]
+        snake_2.currentBodyEndIndex[:] = [1, 1, 1]
+        snake_2.snakeBodyLocation[:, 35] = [1, 1]
+        snake_2.snakeBodyLocation[:, 0] = [1, 2]
+        snake_2.snakeBodyLocation[:, 1] = [1, 3]
+        snake_2.foodLocation[:] = [4, 4]
+        snake_2.rebuildOccupancyGrid()
+
+        snake_2.resetGameState(numpy.array([1]))
+
+        self.assertTrue(
+            equalNumpyArrays(snake_2.getSnakeLength(), numpy.array([3, 1, 3])),
+            f"Snake 2 length: {snake_2.getSnakeLength()}",
+        )
+        self.assertTrue(
+            equalNumpyArrays(
+                snake_2.occupancyGrid.sum(axis=(1, 2)), numpy.array([3, 1, 3])
+            ),
+            f"Snake 2 occupied cells per game: {snake_2.occupancyGrid.sum(axis=(1, 2))}",
+        )
+        self.assertTrue(
+            equalNumpyArrays(snake_2.foodLocation[[0, 2]], numpy.array([4, 4])),
+            f"Snake 2 food location: {snake_2.foodLocation}",
+        )
+        self.assertTrue(
+            equalNumpyArrays(snake_2.foodLocation[1], snake_2.getSnakeHeadLocation()[1])
+            == False,
+            f"Snake 2 food location: {snake_2.foodLocation[1]}",
+        )
+
     def test_generateRandomLocation_coordinatesFromMask(self) -> None:
         snake_1 = Snake(self.gameDimensions_1, self.numberOfGames_1)
         snake_2 = Snake(self.gameDimensions_2, self.numberOfGames_2)
@@ -176,19 +240,37 @@ class TestSnake(unittest.TestCase):
             == False
         )
 
+    def test_generateCoordinatesFromMask_lastFreeCell(self) -> None:
+        snake_1: Snake = Snake(self.gameDimensions_1, self.numberOfGames_1)
+
+        snake_1.occupancyGrid[:, 1:-1, 1:-1] = True
+        snake_1.occupancyGrid[0, 2, 3] = False
+        snake_1.occupancyGrid[1, 1, 1] = False
+        snake_1.foodLocation[:] = [0, 0]
+
+        snake_1.generateCoordinatesFromMask(numpy.array([True, True]))
+
+        self.assertTrue(
+            equalNumpyArrays(snake_1.foodLocation, numpy.array([[2, 3], [1, 1]])),
+            f"Snake 1 food location: {snake_1.foodLocation}",
+        )
+
     def test_findSnakeHitSelf(self) -> None:
         snake_1: Snake = Snake(self.gameDimensions_1, self.numberOfGames_1)
         snake_2: Snake = Snake(self.gameDimensions_2, self.numberOfGames_2)
 
-        snake_1.snakeBodyLocation[0, 1] = snake_1.snakeBodyLocation[0, 0]
-        snake_2.snakeBodyLocation[1, 1] = snake_2.snakeBodyLocation[1, 0]
-        snake_2.snakeBodyLocation[2, 1] = snake_2.snakeBodyLocation[2, 0]
+        snake_1.occupancyGrid[:] = False
+        snake_2.occupancyGrid[:] = False
+
+        snake_1.occupancyGrid[0, 2, 2] = True
+        snake_2.occupancyGrid[1, 3, 3] = True
+        snake_2.occupancyGrid[2, 1, 4] = True
 
         snakeHitSelfMask_1: numpy.ndarray = snake_1.findSnakeHitSelf(
-            snake_1.snakeBodyLocation[:, 0, :].reshape(snake_1.numberOfGames, 1, -1)
+            numpy.array([[[2, 2]], [[2, 2]]])
         )
         snakeHitSelfMask_2: numpy.ndarray = snake_2.findSnakeHitSelf(
-            snake_2.snakeBodyLocation[:, 0, :].reshape(snake_2.numberOfGames, 1, -1)
+            numpy.array([[[3, 3]], [[3, 3]], [[1, 4]]])
         )
 
         self.assertTrue(
@@ -230,6 +312,119 @@ class TestSnake(unittest.TestCase):
             f"Snake 2 HitFood: {snake_2_snakeHitFoodMask}",
         )
 
+    def test_generateNextCellTable(self) -> None:
+        nextCellTable: numpy.ndarray = generateNextCellTable(self.gameDimensions_1)
+        cellCoordinates: numpy.ndarray = generateCellCoordinates(self.gameDimensions_1)
+
+        self.assertTrue(
+            nextCellTable.shape == (20, 4),
+            f"Next cell table shape: {nextCellTable.shape}",
+        )
+        self.assertTrue(
+            equalNumpyArrays(
+                cellCoordinates[nextCellTable[8]], [[0, 3], [1, 4], [2, 3], [1, 2]]
+            ),
+            f"Next cells of cell 8: {cellCoordinates[nextCellTable[8]]}",
+        )
+        self.assertTrue(
+            equalNumpyArrays(
+                cellCoordinates[nextCellTable[0]], [[3, 0], [0, 1], [1, 0], [0, 4]]
+            ),
+            f"Next cells of cell 0: {cellCoordinates[nextCellTable[0]]}",
+        )
+        self.assertTrue(
+            equalNumpyArrays(
+                numpy.argwhere(~generateWallCells(self.gameDimensions_1).reshape(4, 5)),
+                numpy.array([[1, 1], [1, 2], [1, 3], [2, 1], [2, 2], [2, 3]]),
+            ),
+            f"Wall cells: {generateWallCells(self.gameDimensions_1)}",
+        )
+
+    def test_mapTemplate(self) -> None:
+        wallGrid: numpy.ndarray = MapTemplate.rectangle(self.gameDimensions_2).wallGrid
+        wallGrid[2, 1:4] = True
+        mapTemplate: MapTemplate = MapTemplate(wallGrid)
+
+        self.assertTrue(
+            mapTemplate.possibleCoordinates.shape == (13, 2)
+            and not mapTemplate.wallGrid[
+                mapTemplate.possibleCoordinates[:, 0],
+                mapTemplate.possibleCoordinates[:, 1],
+            ].any(),
+            f"Map possible coordinates: {mapTemplate.possibleCoordinates}",
+        )
+
+        snake_2: Snake = Snake(self.gameDimensions_2, 50, mapTemplate=mapTemplate)
+        snake_2.generateCoordinatesFromMask(numpy.ones((50), dtype=bool))
+
+        self.assertFalse(
+            wallGrid[snake_2.foodLocation[:, 0], snake_2.foodLocation[:, 1]].any(),
+            f"Snake 2 food location: {snake_2.foodLocation}",
+        )
+
+        snake_2.occupancyGrid[:] = False
+        snake_2.foodLocation[:] = [0, 0]
+        snake_2.snakeBodyLocation[:, 0] = [1, 2]
+        gameEndMask, _ = snake_2.generateMasks(snake_2.generateNextSnakePosition(2))
+
+        self.assertTrue(gameEndMask.all(), f"Snake 2 game end: {gameEndMask}")
+
+        with self.assertRaises(Exception):
+            MapTemplate(numpy.zeros((4, 4), dtype=bool))
+
+        with self.assertRaises(Exception):
+            Snake(self.gameDimensions_1, 2, mapTemplate=mapTemplate)
+
+    def test_mapTemplate_torus(self) -> None:
+        snake_1: Snake = Snake(
+            self.gameDimensions_1,
+            2,
+            mapTemplate=MapTemplate.torus(self.gameDimensions_1),
+        )
+
+        snake_1.occupancyGrid[:] = False
+        snake_1.foodLocation[:] = [2, 2]
+        snake_1.snakeBodyLocation[:, 0] = [[0, 1], [3, 4]]
+
+        nextSnakePosition: numpy.ndarray = snake_1.generateNextSnakePosition([0, 1])
+        gameEndMask, _ = snake_1.generateMasks(nextSnakePosition)
+
+        self.assertTrue(
+            equalNumpyArrays(nextSnakePosition, numpy.array([[[3, 1]], [[3, 0]]])),
+            f"Snake 1 next position: {nextSnakePosition}",
+        )
+        self.assertFalse(gameEndMask.any(), f"Snake 1 game end: {gameEndMask}")
+
+    def test_generateCoordinatesFromMask_mixedMapTemplates(self) -> None:
+        snake_2: Snake = Snake(
+            self.gameDimensions_2,
+            64,
+            seed=4,
+            mapTemplate=[
+                MapTemplate.rectangle([4, 4]),
+                MapTemplate.rectangle(self.gameDimensions_2),
+            ],
+            templateIndicies=numpy.arange(64) % 2,
+        )
+
+        for _ in range(20):
+            snake_2.generateCoordinatesFromMask(numpy.ones((64), dtype=bool))
+            foodCells: numpy.ndarray = snake_2.getWallGrid()[
+                numpy.arange(64), snake_2.foodLocation[:, 0], snake_2.foodLocation[:, 1]
+            ]
+
+            self.assertFalse(foodCells.any(), f"Snake 2 food: {snake_2.foodLocation}")
+            self.assertTrue(
+                (
+                    snake_2.foodLocation[::2, None]
+                    == numpy.array([[1, 1], [1, 2], [2, 1], [2, 2]])
+                )
+                .all(-1)
+                .any(-1)
+                .all(),
+                f"Snake 2 food on the small map: {snake_2.foodLocation[::2]}",
+            )
+
     def test_generateNextSnakePosition(self) -> None:
         snake_1: Snake = Snake(self.gameDimensions_1, self.numberOfGames_1)
         snake_2: Snake = Snake(self.gameDimensions_2, self.numberOfGames_2)
@@ -278,6 +473,9 @@ class TestSnake(unittest.TestCase):
             [[[5, 2]], [[1, 1]], [[2, 5]]]
         )
 
+        snake_1.occupancyGrid[:] = False
+        snake_2.occupancyGrid[:] = False
+
         snake_1.foodLocation[:] = [0, 0]
         snake_2.foodLocation[:] = [0, 0]
 
@@ -315,12 +513,15 @@ class TestSnake(unittest.TestCase):
         snake_2_nextSnakePosition: numpy.ndarray = numpy.array(
             [[[4, 2]], [[1, 1]], [[2, 4]]]
         )
-        snake_1.snakeBodyLocation[0, 1] = [3, 2]
-        snake_1.snakeBodyLocation[1, 1] = [1, 1]
+        snake_1.occupancyGrid[:] = False
+        snake_2.occupancyGrid[:] = False
 
-        snake_2.snakeBodyLocation[0, 1] = [3, 2]
-        snake_2.snakeBodyLocation[1, 1] = [1, 1]
-        snake_2.snakeBodyLocation[2, 1] = [2, 3]
+        snake_1.occupancyGrid[0, 3, 2] = True
+        snake_1.occupancyGrid[1, 1, 1] = True
+
+        snake_2.occupancyGrid[0, 3, 2] = True
+        snake_2.occupancyGrid[1, 1, 1] = True
+        snake_2.occupancyGrid[2, 2, 3] = True
 
         snake_1.foodLocation[:] = [0, 0]
         snake_2.foodLocation[:] = [0, 0]
@@ -359,12 +560,15 @@ class TestSnake(unittest.TestCase):
         snake_2_nextSnakePosition: numpy.ndarray = numpy.array(
             [[[4, 2]], [[1, 1]], [[2, 5]]]
         )
-        snake_1.snakeBodyLocation[0, 1] = [1, 2]
-        snake_1.snakeBodyLocation[1, 1] = [1, 1]
+        snake_1.occupancyGrid[:] = False
+        snake_2.occupancyGrid[:] = False
 
-        snake_2.snakeBodyLocation[0, 1] = [3, 2]
-        snake_2.snakeBodyLocation[1, 1] = [1, 1]
-        snake_2.snakeBodyLocation[2, 1] = [2, 3]
+        snake_1.occupancyGrid[0, 1, 2] = True
+        snake_1.occupancyGrid[1, 1, 1] = True
+
+        snake_2.occupancyGrid[0, 3, 2] = True
+        snake_2.occupancyGrid[1, 1, 1] = True
+        snake_2.occupancyGrid[2, 2, 3] = True
 
         snake_1.foodLocation[:] = [0, 0]
         snake_2.foodLocation[:] = [0, 0]
@@ -419,26 +623,31 @@ class TestSnake(unittest.TestCase):
         snake_1.currentBodyEndIndex[:] = [1, 1]
         snake_2.currentBodyEndIndex[:] = [1, 1, 1]
 
+        snake_1.rebuildOccupancyGrid()
+        snake_2.rebuildOccupancyGrid()
+
         snake_1_snakeBodyLocation: numpy.ndarray = numpy.zeros((2, 20, 2))
         snake_2_snakeBodyLocation: numpy.ndarray = numpy.zeros((3, 36, 2))
 
-        snake_1_snakeBodyLocation[0, 0] = [2, 2]
-        snake_1_snakeBodyLocation[0, 1] = [1, 2]
+        snake_1_snakeBodyLocation[0, 19] = [2, 2]
+        snake_1_snakeBodyLocation[0, 0] = [1, 2]
+        snake_1_snakeBodyLocation[0, 1] = [1, 1]
 
-        snake_1_snakeBodyLocation[1, 0] = [3, 1]
-        snake_1_snakeBodyLocation[1, 1] = [2, 1]
-        snake_1_snakeBodyLocation[1, 2] = [1, 1]
+        snake_1_snakeBodyLocation[1, 19] = [3, 1]
+        snake_1_snakeBodyLocation[1, 0] = [2, 1]
+        snake_1_snakeBodyLocation[1, 1] = [1, 1]
 
-        snake_2_snakeBodyLocation[0, 0] = [4, 2]
-        snake_2_snakeBodyLocation[0, 1] = [3, 2]
-        snake_2_snakeBodyLocation[0, 2] = [2, 2]
+        snake_2_snakeBodyLocation[0, 35] = [4, 2]
+        snake_2_snakeBodyLocation[0, 0] = [3, 2]
+        snake_2_snakeBodyLocation[0, 1] = [2, 2]
 
-        snake_2_snakeBodyLocation[1, 0] = [1, 1]
-        snake_2_snakeBodyLocation[1, 1] = [1, 2]
+        snake_2_snakeBodyLocation[1, 35] = [1, 1]
+        snake_2_snakeBodyLocation[1, 0] = [1, 2]
+        snake_2_snakeBodyLocation[1, 1] = [1, 3]
 
-        snake_2_snakeBodyLocation[2, 0] = [2, 4]
-        snake_2_snakeBodyLocation[2, 1] = [2, 3]
-        snake_2_snakeBodyLocation[2, 2] = [2, 2]
+        snake_2_snakeBodyLocation[2, 35] = [2, 4]
+        snake_2_snakeBodyLocation[2, 0] = [2, 3]
+        snake_2_snakeBodyLocation[2, 1] = [2, 2]
 
         snake_1_SnakeHitFoodMask: numpy.ndarray = numpy.array([False, True])
         snake_2_SnakeHitFoodMask: numpy.ndarray = numpy.array([True, False, True])
@@ -460,8 +669,8 @@ class TestSnake(unittest.TestCase):
             f"First 3 elements of Snake 2 snakeBodyLocation: {snake_2.snakeBodyLocation[:, :3]}\nFirst 3 elements of Snake 2 test snakeBodyLocation: {snake_2_snakeBodyLocation[:, :3]}",
         )
 
-        snake_1_currentBodyEndIndex: numpy.ndarray = numpy.array([1, 2], dtype=int)
-        snake_2_currentBodyEndIndex: numpy.ndarray = numpy.array([2, 1, 2], dtype=int)
+        snake_1_currentBodyEndIndex: numpy.ndarray = numpy.array([0, 1], dtype=int)
+        snake_2_currentBodyEndIndex: numpy.ndarray = numpy.array([1, 0, 1], dtype=int)
 
         self.assertTrue(
             equalNumpyArrays(snake_1.currentBodyEndIndex, snake_1_currentBodyEndIndex),
@@ -473,6 +682,160 @@ class TestSnake(unittest.TestCase):
             f"Snake 2 true currentBodyEndIndex: {snake_2.currentBodyEndIndex}\nSnake 2 test currentBodyEndIndex: {snake_2_currentBodyEndIndex}",
         )
 
+        self.assertTrue(
+            equalNumpyArrays(snake_1.snakeHeadIndex, numpy.array([19, 19])),
+            f"Snake 1 snakeHeadIndex: {snake_1.snakeHeadIndex}",
+        )
+        self.assertTrue(
+            equalNumpyArrays(snake_2.snakeHeadIndex, numpy.array([35, 35, 35])),
+            f"Snake 2 snakeHeadIndex: {snake_2.snakeHeadIndex}",
+        )
+
+        self.assertTrue(
+            equalNumpyArrays(snake_1.getSnakeLength(), numpy.array([2, 3])),
+            f"Snake 1 length: {snake_1.getSnakeLength()}",
+        )
+        self.assertTrue(
+            equalNumpyArrays(snake_2.getSnakeLength(), numpy.array([3, 2, 3])),
+            f"Snake 2 length: {snake_2.getSnakeLength()}",
+        )
+
+        self.assertTrue(
+            equalNumpyArrays(
+                snake_1.occupancyGrid[0, [2, 1, 1], [2, 2, 1]],
+                numpy.array([True, True, False]),
+            ),
+            f"Snake 1 occupancy grid of game 0: {snake_1.occupancyGrid[0]}",
+        )
+        self.assertTrue(
+            equalNumpyArrays(
+                snake_2.occupancyGrid[1, [1, 1, 1], [1, 2, 3]],
+                numpy.array([True, True, False]),
+            ),
+            f"Snake 2 occupancy grid of game 1: {snake_2.occupancyGrid[1]}",
+        )
+        self.assertTrue(
+            equalNumpyArrays(snake_2.occupancyGrid[2].sum(), numpy.array(3)),
+            f"Snake 2 occupancy grid of game 2: {snake_2.occupancyGrid[2]}",
+        )
+
+    def test_updateSnakeHeading(self) -> None:
+        snake_2: Snake = Snake(self.gameDimensions_2, self.numberOfGames_2)
+
+        snake_2.updateSnakeHeading([1, 2, 3])
+        snake_2.updateSnakeHeading([0, 0, 0], numpy.array([False, True, False]))
+
+        self.assertTrue(
+            equalNumpyArrays(snake_2.snakeHeading, numpy.array([1, 0, 3])),
+            f"Snake 2 heading: {snake_2.snakeHeading}",
+        )
+
+        snake_2.resetGameState(numpy.array([2]))
+
+        self.assertTrue(
+            equalNumpyArrays(snake_2.snakeHeading, numpy.array([1, 0, 0])),
+            f"Snake 2 heading: {snake_2.snakeHeading}",
+        )
+
+    def test_getLegalMoveMask(self) -> None:
+        snake_2: Snake = Snake(self.gameDimensions_2, self.numberOfGames_2)
+
+        snake_2.snakeHeadIndex[:] = 0
+        snake_2.currentBodyEndIndex[:] = [0, 2, 1]
+        snake_2.snakeBodyLocation[0, 0] = [1, 1]
+        snake_2.snakeBodyLocation[1, :3] = [[2, 2], [2, 3], [3, 3]]
+        snake_2.snakeBodyLocation[2, :2] = [[4, 4], [3, 4]]
+        snake_2.snakeHeading[:] = [0, 3, 2]
+        snake_2.rebuildOccupancyGrid()
+
+        legalMoveMask_test: numpy.ndarray = numpy.array(
+            [
+                [False, True, True, False],
+                [True, False, True, True],
+                [False, False, False, True],
+            ]
+        )
+
+        self.assertTrue(
+            equalNumpyArrays(snake_2.getLegalMoveMask(), legalMoveMask_test),
+            f"Snake 2 legal move mask: {snake_2.getLegalMoveMask()}",
+        )
+        self.assertTrue(
+            equalNumpyArrays(
+                snake_2.convertReverseMoves([2, 1, 0]), numpy.array([2, 3, 2])
+            ),
+            f"Snake 2 converted moves: {snake_2.convertReverseMoves([2, 1, 0])}",
+        )
+
+    def test_convertRelativeMoves(self) -> None:
+        snake_2: Snake = Snake(self.gameDimensions_2, self.numberOfGames_2)
+
+        snake_2.snakeHeading[:] = [0, 1, 3]
+
+        self.assertTrue(
+            equalNumpyArrays(
+                snake_2.convertRelativeMoves([0, 1, 2]), numpy.array([3, 1, 0])
+            ),
+            f"Snake 2 converted moves: {snake_2.convertRelativeMoves([0, 1, 2])}",
+        )
+
+    def test_placeLongSnakes(self) -> None:
+        snake_2: Snake = Snake(self.gameDimensions_2, self.numberOfGames_2)
+
+        snake_2.placeLongSnakes(0.5)
+
+        self.assertTrue(
+            equalNumpyArrays(snake_2.getSnakeLength(), numpy.array([8, 8, 8]))
+            and equalNumpyArrays(snake_2.occupancyGrid.sum(axis=(1, 2)), 8)
+            and equalNumpyArrays(snake_2.getSnakeHeadLocation(), numpy.array([2, 1])),
+            f"Snake 2 occupancy grid: {snake_2.occupancyGrid}",
+        )
+
+        wallGrid: numpy.ndarray = MapTemplate.rectangle(self.gameDimensions_2).wallGrid
+        wallGrid[2, 2] = True
+
+        with self.assertRaises(Exception):
+            Snake(
+                self.gameDimensions_2,
+                self.numberOfGames_2,
+                mapTemplate=MapTemplate(wallGrid),
+            ).placeLongSnakes(0.5)
+
+    def test_rebuildOccupancyGrid(self) -> None:
+        snake_1: Snake = Snake(self.gameDimensions_1, self.numberOfGames_1)
+
+        snake_1.snakeHeadIndex[:] = [19, 0]
+        snake_1.currentBodyEndIndex[:] = [0, 0]
+        snake_1.snakeBodyLocation[0, 19] = [1, 1]
+        snake_1.snakeBodyLocation[0, 0] = [1, 2]
+        snake_1.snakeBodyLocation[0, 1] = [1, 3]
+        snake_1.snakeBodyLocation[1, 0] = [2, 3]
+        snake_1.snakeBodyLocation[1, 1] = [2, 2]
+
+        snake_1.rebuildOccupancyGrid()
+
+        self.assertTrue(
+            equalNumpyArrays(
+                numpy.argwhere(snake_1.occupancyGrid),
+                numpy.array([[0, 1, 1], [0, 1, 2], [1, 2, 3]]),
+            ),
+            f"Snake 1 occupied cells: {numpy.argwhere(snake_1.occupancyGrid)}",
+        )
+
+    def test_getSnakeHeadLocation(self) -> None:
+        snake_1: Snake = Snake(self.gameDimensions_1, self.numberOfGames_1)
+
+        snake_1.snakeHeadIndex[:] = [3, 19]
+        snake_1.snakeBodyLocation[0, 3] = [2, 3]
+        snake_1.snakeBodyLocation[1, 19] = [1, 1]
+
+        self.assertTrue(
+            equalNumpyArrays(
+                snake_1.getSnakeHeadLocation(), numpy.array([[2, 3], [1, 1]])
+            ),
+            f"Snake 1 head location: {snake_1.getSnakeHeadLocation()}",
+        )
+
 
 if __name__ == "__main__":
     unittest.main()
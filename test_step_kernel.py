@@ -0,0 +1,168 @@
+import copy
+import unittest
+import numpy
+from environment import Environment
+from step_kernel import NUMBA_AVAILABLE, stepGames
+
+
+def equalNumpyArrays(array_1: numpy.ndarray, array_2: numpy.ndarray) -> bool:
+    equalInPlace: numpy.ndarray = array_1 == array_2
+    equal: bool = bool(equalInPlace.all())
+    return equal
+
+
+def equalEnvironments(environment_1: Environment, environment_2: Environment) -> bool:
+    return (
+        equalNumpyArrays(environment_1.stateSpace, environment_2.stateSpace)
+        and equalNumpyArrays(
+            environment_1.snake.occupancyGrid, environment_2.snake.occupancyGrid
+        )
+        and equalNumpyArrays(
+            environment_1.snake.getSnakeHeadLocation(),
+            environment_2.snake.getSnakeHeadLocation(),
+        )
+        and equalNumpyArrays(
+            environment_1.snake.getSnakeLength(), environment_2.snake.getSnakeLength()
+        )
+        and equalNumpyArrays(
+            environment_1.snake.foodLocation, environment_2.snake.foodLocation
+        )
+    )
+
+
+class TestStepKernel(unittest.TestCase):
+    def setUp(self) -> None:
+        self.gameDimensions: list[int] = [7, 6]
+        self.numberOfGames: int = 64
+
+    def test_stepGames_matchesNumpy(self) -> None:
+        randomGenerator: numpy.random.Generator = numpy.random.default_rng(0)
+        environment_1: Environment = Environment(
+            self.gameDimensions, self.numberOfGames, endedGameMode="mask", seed=1
+        )
+
+        for _ in range(30):
+            moves: numpy.ndarray = randomGenerator.integers(4, size=self.numberOfGames)
+            environment_2: Environment = copy.deepcopy(environment_1)
+
+            gameEndMask_1, snakeHitFoodMask_1 = environment_1.stepGames(moves)
+            gameEndMask_2: numpy.ndarray = numpy.empty((self.numberOfGames), bool)
+            snakeHitFoodMask_2: numpy.ndarray = numpy.empty((self.numberOfGames), bool)
+            stepGames(
+                environment_2.snake.snakeBodyLocation,
+                environment_2.snake.snakeHeadIndex,
+                environment_2.snake.currentBodyEndIndex,
+                environment_2.snake.occupancyGrid,
+                environment_2.snake.foodLocation,
+                environment_2.stateSpace,
+                True,
+                moves,
+                environment_2.activeGames,
+                environment_2.snake.templateIndicies,
+                environment_2.snake.nextCellTable,
+                environment_2.snake.wallCells,
+                gameEndMask_2,
+                snakeHitFoodMask_2,
+            )
+
+            self.assertTrue(
+                equalNumpyArrays(gameEndMask_1, gameEndMask_2),
+                f"Game End Mask 1: {gameEndMask_1}\nGame End Mask 2: {gameEndMask_2}",
+            )
+            self.assertTrue(
+                equalNumpyArrays(snakeHitFoodMask_1, snakeHitFoodMask_2),
+                f"Snake Hit Food Mask 1: {snakeHitFoodMask_1}\nSnake Hit Food Mask 2: {snakeHitFoodMask_2}",
+            )
+            self.assertTrue(
+                equalEnvironments(environment_1, environment_2),
+                "Environments differ after stepping",
+            )
+
+            environment_1.activeGames &= ~gameEndMask_1
+            if snakeHitFoodMask_1.any():
+                environment_1.snake.generateCoordinatesFromMask(snakeHitFoodMask_1)
+                environment_1.updateFoodLocation(snakeHitFoodMask_1)
+
+    def test_stepGames_skipRender(self) -> None:
+        environment: Environment = Environment(
+            self.gameDimensions, self.numberOfGames, endedGameMode="mask", seed=1
+        )
+        stateSpace: numpy.ndarray = environment.stateSpace.copy()
+        moves: numpy.ndarray = numpy.random.default_rng(0).integers(
+            4, size=self.numberOfGames
+        )
+        gameEndMask: numpy.ndarray = numpy.empty((self.numberOfGames), bool)
+        snakeHitFoodMask: numpy.ndarray = numpy.empty((self.numberOfGames), bool)
+
+        stepGames(
+            environment.snake.snakeBodyLocation,
+            environment.snake.snakeHeadIndex,
+            environment.snake.currentBodyEndIndex,
+            environment.snake.occupancyGrid,
+            environment.snake.foodLocation,
+            environment.renderedStateSpace,
+            False,
+            moves,
+            environment.activeGames,
+            environment.snake.templateIndicies,
+            environment.snake.nextCellTable,
+            environment.snake.wallCells,
+            gameEndMask,
+            snakeHitFoodMask,
+        )
+
+        self.assertTrue(
+            equalNumpyArrays(environment.renderedStateSpace, stateSpace)
+            and not equalNumpyArrays(environment.snake.occupancyGrid, stateSpace == 2),
+            "State space was written with rendering skipped",
+        )
+
+    @unittest.skipUnless(NUMBA_AVAILABLE, "numba is not installed")
+    def test_update_numbaBackend(self) -> None:
+        for endedGameMode in ("remove", "reset", "mask"):
+            randomGenerator: numpy.random.Generator = numpy.random.default_rng(0)
+            environment_1: Environment = Environment(
+                self.gameDimensions,
+                self.numberOfGames,
+                endedGameMode=endedGameMode,
+                seed=2,
+            )
+            environment_2: Environment = Environment(
+                self.gameDimensions,
+                self.numberOfGames,
+                endedGameMode=endedGameMode,
+                seed=2,
+                backend="numba",
+            )
+
+            for _ in range(50):
+                moves: numpy.ndarray = randomGenerator.integers(
+                    4, size=environment_1.stateSpace.shape[0]
+                )
+                gameEndMask_1, snakeHitFoodMask_1, allGamesEnded_1 = (
+                    environment_1.update(moves)
+                )
+                gameEndMask_2, snakeHitFoodMask_2, allGamesEnded_2 = (
+                    environment_2.update(moves)
+                )
+
+                self.assertTrue(
+                    equalNumpyArrays(gameEndMask_1, gameEndMask_2)
+                    and equalNumpyArrays(snakeHitFoodMask_1, snakeHitFoodMask_2)
+                    and allGamesEnded_1 == allGamesEnded_2,
+                    f"Masks differ in {endedGameMode} mode",
+                )
+                self.assertTrue(
+                    equalEnvironments(environment_1, environment_2),
+                    f"Environments differ in {endedGameMode} mode",
+                )
+                if allGamesEnded_1:
+                    break
+
+    def test_init_unknownBackend(self) -> None:
+        with self.assertRaises(Exception):
+            Environment(self.gameDimensions, self.numberOfGames, backend="cuda")
+
+
+if __name__ == "__main__":
+    unittest.main()
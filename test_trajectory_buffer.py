@@ -0,0 +1,210 @@
+import tempfile
+import unittest
+import numpy
+from trajectory_buffer import TrajectoryBuffer
+from vector_environment import VectorEnvironment
+
+
+def equalNumpyArrays(array_1: numpy.ndarray, array_2: numpy.ndarray) -> bool:
+    equalInPlace: numpy.ndarray = array_1 == array_2
+    equal: bool = bool(equalInPlace.all())
+    return equal
+
+
+def recordSteps(
+    trajectoryBuffer: TrajectoryBuffer, numberOfSteps: int
+) -> list[numpy.ndarray]:
+    observations: list[numpy.ndarray] = []
+    for step in range(numberOfSteps):
+        observation: numpy.ndarray = numpy.full((3, 2, 2), step, dtype=numpy.uint8)
+        observations.append(observation)
+        trajectoryBuffer.record(
+            observation,
+            numpy.full((3), step % 4),
+            numpy.full((3), step, dtype=numpy.float32),
+            numpy.array([step == 2, False, step % 3 == 0]),
+            numpy.array([False, step == 4, False]),
+        )
+    return observations
+
+
+class TestTrajectoryBuffer(unittest.TestCase):
+    def test_record(self) -> None:
+        trajectoryBuffer: TrajectoryBuffer = TrajectoryBuffer(3, 4, (2, 2))
+        recordSteps(trajectoryBuffer, 6)
+
+        self.assertTrue(
+            trajectoryBuffer.cursor == 2 and trajectoryBuffer.size == 4,
+            f"Cursor: {trajectoryBuffer.cursor}, size: {trajectoryBuffer.size}",
+        )
+        self.assertTrue(
+            equalNumpyArrays(trajectoryBuffer.rewards[:, 0], numpy.array([4, 5, 2, 3])),
+            f"Rewards: {trajectoryBuffer.rewards}",
+        )
+        self.assertTrue(
+            equalNumpyArrays(
+                trajectoryBuffer.isFirst,
+                numpy.array(
+                    [
+                        [False, False, True],
+                        [False, True, False],
+                        [False, False, False],
+                        [True, False, False],
+                    ]
+                ),
+            ),
+            f"Is first: {trajectoryBuffer.isFirst}",
+        )
+
+    def test_sample(self) -> None:
+        trajectoryBuffer: TrajectoryBuffer = TrajectoryBuffer(3, 4, (2, 2))
+        recordSteps(trajectoryBuffer, 6)
+
+        sequences: dict[str, numpy.ndarray] = trajectoryBuffer.sample(
+            64, 3, numpy.random.default_rng(0)
+        )
+
+        self.assertTrue(
+            sequences["observations"].shape == (64, 3, 2, 2)
+            and sequences["isFirst"].shape == (64, 3),
+            f"Observations shape: {sequences['observations'].shape}",
+        )
+        self.assertTrue(
+            equalNumpyArrays(
+                numpy.diff(sequences["rewards"], axis=1), numpy.ones((64, 2))
+            ),
+            f"Rewards: {sequences['rewards']}",
+        )
+        self.assertTrue(
+            equalNumpyArrays(
+                sequences["observations"][:, :, 0, 0], sequences["rewards"]
+            ),
+            "Observations and rewards come from different steps",
+        )
+        self.assertTrue(
+            sequences["rewards"].min() == 2,
+            f"Rewards: {sequences['rewards']}",
+        )
+
+        with self.assertRaises(Exception):
+            trajectoryBuffer.sample(1, 5)
+
+    def test_getFrameStack(self) -> None:
+        trajectoryBuffer: TrajectoryBuffer = TrajectoryBuffer(3, 8, (2, 2))
+        recordSteps(trajectoryBuffer, 2)
+
+        with self.assertRaises(Exception):
+            trajectoryBuffer.getFrameStack(4)
+
+        frameStack: numpy.ndarray = trajectoryBuffer.getFrameStack(
+            4, numpy.full((3, 2, 2), 2, dtype=numpy.uint8)
+        )
+
+        self.assertTrue(
+            equalNumpyArrays(
+                frameStack[:, :, 0, 0],
+                numpy.array([[0, 0, 1, 2], [0, 0, 1, 2], [1, 1, 1, 2]]),
+            ),
+            f"Frame stack: {frameStack[:, :, 0, 0]}",
+        )
+
+        recordSteps(trajectoryBuffer, 6)
+        trajectoryBuffer.setObservation(numpy.full((3, 2, 2), 6, dtype=numpy.uint8))
+        frameStack = trajectoryBuffer.getFrameStack(4)
+
+        self.assertTrue(
+            equalNumpyArrays(
+                frameStack[:, :, 0, 0],
+                numpy.array([[3, 4, 5, 6], [5, 5, 5, 6], [4, 4, 5, 6]]),
+            ),
+            f"Frame stack: {frameStack[:, :, 0, 0]}",
+        )
+
+    def test_vectorEnvironment(self) -> None:
+        vectorEnvironment: VectorEnvironment = VectorEnvironment(
+            [6, 6], 4, maxEpisodeLength=5, seed=0
+        )
+        observation, _ = vectorEnvironment.reset()
+
+        with tempfile.TemporaryDirectory() as directory:
+            trajectoryBuffer: TrajectoryBuffer = TrajectoryBuffer(
+                4, 16, observation.shape[1:], directory=directory
+            )
+            randomGenerator: numpy.random.Generator = numpy.random.default_rng(0)
+            for _ in range(20):
+                actions: numpy.ndarray = randomGenerator.integers(4, size=4)
+                previousObservation: numpy.ndarray = observation.copy()
+                observation, rewards, terminated, truncated, _ = vectorEnvironment.step(
+                    actions
+                )
+                trajectoryBuffer.record(
+                    previousObservation, actions, rewards, terminated, truncated
+                )
+            trajectoryBuffer.flush()
+
+            storedObservations: numpy.ndarray = numpy.load(
+                f"{directory}/observations.npy", mmap_mode="r"
+            )
+
+            self.assertTrue(
+                equalNumpyArrays(
+                    storedObservations[(trajectoryBuffer.cursor - 1) % 16],
+                    previousObservation,
+                ),
+                "Memory mapped observations differ from the recorded ones",
+            )
+            timeOrder: numpy.ndarray = (trajectoryBuffer.cursor + numpy.arange(16)) % 16
+            episodeEnded: numpy.ndarray = (
+                trajectoryBuffer.terminated | trajectoryBuffer.truncated
+            )
+            self.assertTrue(
+                equalNumpyArrays(
+                    trajectoryBuffer.isFirst[timeOrder[1:]],
+                    episodeEnded[timeOrder[:-1]],
+                )
+                and trajectoryBuffer.truncated.any(),
+                f"Is first: {trajectoryBuffer.isFirst}",
+            )
+            del storedObservations
+
+    def test_getFrameStack_vectorEnvironment(self) -> None:
+        vectorEnvironment: VectorEnvironment = VectorEnvironment(
+            [6, 6], 4, maxEpisodeLength=5, seed=1
+        )
+        observation, _ = vectorEnvironment.reset()
+        trajectoryBuffer: TrajectoryBuffer = TrajectoryBuffer(
+            4, 16, observation.shape[1:]
+        )
+        trajectoryBuffer.setObservation(observation)
+        randomGenerator: numpy.random.Generator = numpy.random.default_rng(1)
+
+        for _ in range(20):
+            previousFrameStack: numpy.ndarray = trajectoryBuffer.getFrameStack(3)
+            actions: numpy.ndarray = randomGenerator.integers(4, size=4)
+            observation, rewards, terminated, truncated, _ = vectorEnvironment.step(
+                actions
+            )
+            trajectoryBuffer.recordStep(
+                actions, rewards, terminated, truncated, observation
+            )
+            frameStack: numpy.ndarray = trajectoryBuffer.getFrameStack(3)
+            episodeEnded: numpy.ndarray = terminated | truncated
+
+            self.assertTrue(
+                equalNumpyArrays(frameStack[:, -1], observation),
+                "The last stacked frame should be the returned observation",
+            )
+            self.assertTrue(
+                equalNumpyArrays(
+                    frameStack[~episodeEnded, :-1],
+                    previousFrameStack[~episodeEnded, 1:],
+                )
+                and equalNumpyArrays(
+                    frameStack[episodeEnded], observation[episodeEnded, None]
+                ),
+                "Frames should shift within an episode and restart after it ends",
+            )
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,176 @@
+import copy
+import unittest
+import numpy
+from environment import Environment
+from vector_environment import VectorEnvironment
+
+
+def equalNumpyArrays(array_1: numpy.ndarray, array_2: numpy.ndarray) -> bool:
+    equalInPlace: numpy.ndarray = array_1 == array_2
+    equal: bool = bool(equalInPlace.all())
+    return equal
+
+
+def placeSnakes(
+    vectorEnvironment: VectorEnvironment,
+    headLocations: list[list[int]],
+    foodLocations: list[list[int]],
+) -> None:
+    environment = vectorEnvironment.environment
+    environment.snake.snakeBodyLocation[:, 0] = headLocations
+    environment.snake.foodLocation[:] = foodLocations
+    environment.snake.rebuildOccupancyGrid()
+    environment.stateSpace[:, 1:-1, 1:-1] = 0
+    environment.drawInitialSnake()
+    environment.updateFoodLocation()
+
+
+class TestVectorEnvironment(unittest.TestCase):
+    def setUp(self) -> None:
+        self.gameDimensions: list[int] = [6, 6]
+        self.numberOfGames: int = 3
+
+    def test_reset(self) -> None:
+        vectorEnvironment_1: VectorEnvironment = VectorEnvironment(
+            self.gameDimensions, self.numberOfGames
+        )
+        vectorEnvironment_2: VectorEnvironment = VectorEnvironment(
+            self.gameDimensions, self.numberOfGames
+        )
+
+        observation_1, info_1 = vectorEnvironment_1.reset(seed=3)
+        observation_2, _ = vectorEnvironment_2.reset(seed=3)
+
+        self.assertTrue(
+            observation_1.shape == (3, 6, 6),
+            f"Observation 1 shape: {observation_1.shape}",
+        )
+        self.assertTrue(
+            list(info_1) == ["legalMoveMask"]
+            and info_1["legalMoveMask"].shape == (3, 4),
+            f"Info 1: {info_1}",
+        )
+        self.assertTrue(
+            equalNumpyArrays(observation_1, observation_2),
+            f"Observation 1: {observation_1}\nObservation 2: {observation_2}",
+        )
+
+    def test_step_rewards(self) -> None:
+        vectorEnvironment: VectorEnvironment = VectorEnvironment(
+            self.gameDimensions,
+            self.numberOfGames,
+            foodReward=2.0,
+            deathReward=-5.0,
+            stepReward=-0.5,
+        )
+        vectorEnvironment.reset()
+        placeSnakes(
+            vectorEnvironment, [[1, 1], [2, 2], [4, 4]], [[3, 3], [2, 3], [1, 1]]
+        )
+
+        observation, rewards, terminated, truncated, info = vectorEnvironment.step(
+            numpy.array([0, 1, 0])
+        )
+
+        self.assertTrue(
+            equalNumpyArrays(rewards, numpy.array([-5.5, 1.5, -0.5])),
+            f"Rewards: {rewards}",
+        )
+        self.assertTrue(
+            equalNumpyArrays(terminated, numpy.array([True, False, False])),
+            f"Terminated: {terminated}",
+        )
+        self.assertTrue(
+            equalNumpyArrays(truncated, numpy.array([False, False, False])),
+            f"Truncated: {truncated}",
+        )
+        self.assertTrue(
+            equalNumpyArrays(info["snakeHitFood"], numpy.array([False, True, False])),
+            f"Info snakeHitFood: {info['snakeHitFood']}",
+        )
+        self.assertTrue(
+            equalNumpyArrays(observation, vectorEnvironment.environment.stateSpace),
+            f"Observation: {observation}",
+        )
+        self.assertTrue(
+            equalNumpyArrays(vectorEnvironment.episodeLength, numpy.array([0, 1, 1])),
+            f"Episode length: {vectorEnvironment.episodeLength}",
+        )
+
+    def test_step_truncation(self) -> None:
+        vectorEnvironment: VectorEnvironment = VectorEnvironment(
+            self.gameDimensions, self.numberOfGames, maxEpisodeLength=2
+        )
+        vectorEnvironment.reset()
+        placeSnakes(
+            vectorEnvironment, [[1, 1], [1, 2], [4, 4]], [[4, 1], [4, 4], [1, 4]]
+        )
+
+        vectorEnvironment.step(numpy.array([1, 1, 0]))
+        _, _, terminated, truncated, info = vectorEnvironment.step(
+            numpy.array([1, 0, 0])
+        )
+
+        self.assertTrue(
+            equalNumpyArrays(terminated, numpy.array([False, True, False])),
+            f"Terminated: {terminated}",
+        )
+        self.assertTrue(
+            equalNumpyArrays(truncated, numpy.array([True, False, True])),
+            f"Truncated: {truncated}",
+        )
+        self.assertTrue(
+            equalNumpyArrays(info["episodeLength"], numpy.array([2, 2, 2])),
+            f"Info episodeLength: {info['episodeLength']}",
+        )
+        self.assertTrue(
+            equalNumpyArrays(vectorEnvironment.episodeLength, numpy.array([0, 0, 0])),
+            f"Episode length: {vectorEnvironment.episodeLength}",
+        )
+        self.assertTrue(
+            equalNumpyArrays(
+                vectorEnvironment.environment.snake.getSnakeLength(),
+                numpy.array([1, 1, 1]),
+            ),
+            f"Snake length: {vectorEnvironment.environment.snake.getSnakeLength()}",
+        )
+
+    def test_step_finalObservation(self) -> None:
+        vectorEnvironment: VectorEnvironment = VectorEnvironment(
+            self.gameDimensions, self.numberOfGames, maxEpisodeLength=2
+        )
+        vectorEnvironment.reset()
+        placeSnakes(
+            vectorEnvironment, [[1, 1], [1, 2], [4, 4]], [[4, 1], [4, 4], [1, 4]]
+        )
+        vectorEnvironment.step(numpy.array([1, 1, 0]))
+        # The same step without auto-reset leaves every game on its final board.
+        environment: Environment = copy.deepcopy(vectorEnvironment.environment)
+        environment.endedGameMode = "mask"
+        environment.update(numpy.array([1, 0, 0]))
+
+        observation, _, _, _, info = vectorEnvironment.step(numpy.array([1, 0, 0]))
+
+        self.assertTrue(
+            equalNumpyArrays(info["finalObservationMask"], numpy.array([True] * 3))
+            and equalNumpyArrays(info["finalObservation"], environment.stateSpace),
+            f"Final observation: {info['finalObservation']}",
+        )
+        self.assertTrue(
+            not equalNumpyArrays(observation, environment.stateSpace)
+            and equalNumpyArrays(observation, vectorEnvironment.environment.stateSpace),
+            f"Observation: {observation}",
+        )
+
+        _, _, terminated, truncated, info = vectorEnvironment.step(
+            numpy.array([1, 1, 1])
+        )
+
+        self.assertTrue(
+            equalNumpyArrays(info["finalObservationMask"], terminated | truncated),
+            f"Final observation mask: {info['finalObservationMask']}",
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
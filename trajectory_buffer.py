@@ -0,0 +1,203 @@
+import os
+import numpy
+
+
+class TrajectoryBuffer:
+    def __init__(
+        self,
+        numberOfGames: int,
+        capacity: int,
+        observationShape: tuple[int, ...],
+        observationDtype: numpy.dtype = numpy.uint8,
+        directory: str | None = None,
+    ) -> None:
+        self.numberOfGames: int = numberOfGames
+        self.capacity: int = capacity
+        self.directory: str | None = directory
+
+        # Time major, so recording a step writes one contiguous slab per array.
+        self.observations: numpy.ndarray = self.createArray(
+            "observations",
+            (capacity, numberOfGames, *observationShape),
+            observationDtype,
+        )
+        self.actions: numpy.ndarray = self.createArray(
+            "actions", (capacity, numberOfGames), numpy.int8
+        )
+        self.rewards: numpy.ndarray = self.createArray(
+            "rewards", (capacity, numberOfGames), numpy.float32
+        )
+        self.terminated: numpy.ndarray = self.createArray(
+            "terminated", (capacity, numberOfGames), bool
+        )
+        self.truncated: numpy.ndarray = self.createArray(
+            "truncated", (capacity, numberOfGames), bool
+        )
+        self.isFirst: numpy.ndarray = self.createArray(
+            "isFirst", (capacity, numberOfGames), bool
+        )
+        # The observation the next actions are taken from, not yet recorded.
+        self.currentObservation: numpy.ndarray = numpy.zeros(
+            (numberOfGames, *observationShape), dtype=observationDtype
+        )
+
+        self.clear()
+
+    def createArray(
+        self, name: str, shape: tuple[int, ...], dtype: numpy.dtype
+    ) -> numpy.ndarray:
+        if self.directory is None:
+            return numpy.zeros(shape, dtype=dtype)
+
+        os.makedirs(self.directory, exist_ok=True)
+        return numpy.lib.format.open_memmap(
+            os.path.join(self.directory, f"{name}.npy"),
+            mode="w+",
+            dtype=dtype,
+            shape=shape,
+        )
+
+    def clear(self) -> None:
+        self.cursor: int = 0
+        self.size: int = 0
+        self.episodeEnded: numpy.ndarray = numpy.ones((self.numberOfGames), dtype=bool)
+        self.hasCurrentObservation: bool = False
+
+    def setObservation(self, observation: numpy.ndarray) -> None:
+        numpy.copyto(self.currentObservation, observation)
+        self.hasCurrentObservation = True
+
+    def record(
+        self,
+        observation: numpy.ndarray,
+        actions: numpy.ndarray,
+        rewards: numpy.ndarray,
+        terminated: numpy.ndarray,
+        truncated: numpy.ndarray | None = None,
+        nextObservation: numpy.ndarray | None = None,
+    ) -> None:
+        # The observation is the one the actions were taken from, rewards and
+        # terminations are the outcome of those actions.
+        if truncated is None:
+            truncated = numpy.zeros((self.numberOfGames), dtype=bool)
+
+        self.observations[self.cursor] = observation
+        self.actions[self.cursor] = actions
+        self.rewards[self.cursor] = rewards
+        self.terminated[self.cursor] = terminated
+        self.truncated[self.cursor] = truncated
+        self.isFirst[self.cursor] = self.episodeEnded
+
+        numpy.logical_or(terminated, truncated, out=self.episodeEnded)
+        self.cursor = (self.cursor + 1) % self.capacity
+        self.size = min(self.size + 1, self.capacity)
+        if nextObservation is not None:
+            self.setObservation(nextObservation)
+
+    def recordStep(
+        self,
+        actions: numpy.ndarray,
+        rewards: numpy.ndarray,
+        terminated: numpy.ndarray,
+        truncated: numpy.ndarray | None,
+        nextObservation: numpy.ndarray,
+    ) -> None:
+        # Takes the outputs of VectorEnvironment.step as they are returned, the
+        # observation from the previous step or reset is the one recorded.
+        if not self.hasCurrentObservation:
+            raise Exception("Call setObservation with the reset observation first!")
+        self.record(
+            self.currentObservation,
+            actions,
+            rewards,
+            terminated,
+            truncated,
+            nextObservation,
+        )
+
+    def sample(
+        self,
+        batchSize: int,
+        sequenceLength: int,
+        randomGenerator: numpy.random.Generator | None = None,
+    ) -> dict[str, numpy.ndarray]:
+        if sequenceLength > self.size:
+            raise Exception(
+                f"Cannot sample sequences of length {sequenceLength} from {self.size} recorded steps!"
+            )
+        if randomGenerator is None:
+            randomGenerator = numpy.random.default_rng()
+
+        # Windows may span episode boundaries, isFirst marks where a new one starts.
+        gameIndicies: numpy.ndarray = randomGenerator.integers(
+            self.numberOfGames, size=batchSize
+        )
+        sequenceStarts: numpy.ndarray = randomGenerator.integers(
+            self.size - sequenceLength + 1, size=batchSize
+        )
+        timeIndicies: numpy.ndarray = (
+            self.cursor
+            - self.size
+            + sequenceStarts[:, None]
+            + numpy.arange(sequenceLength)[None, :]
+        ) % self.capacity
+
+        return {
+            name: array[timeIndicies, gameIndicies[:, None]]
+            for name, array in (
+                ("observations", self.observations),
+                ("actions", self.actions),
+                ("rewards", self.rewards),
+                ("terminated", self.terminated),
+                ("truncated", self.truncated),
+                ("isFirst", self.isFirst),
+            )
+        }
+
+    def getFrameStack(
+        self, numberOfFrames: int, observation: numpy.ndarray | None = None
+    ) -> numpy.ndarray:
+        if observation is None:
+            if not self.hasCurrentObservation:
+                raise Exception("Cannot stack frames without the current observation!")
+            observation = self.currentObservation
+
+        # The last recorded frames followed by the current observation. Frames from
+        # before the start of the current episode, or before the oldest recorded
+        # step, repeat the first frame the episode has.
+        numberOfRecordedFrames: int = numberOfFrames - 1
+        frameOffsets: numpy.ndarray = numpy.arange(numberOfFrames)
+        timeIndicies: numpy.ndarray = (
+            self.cursor - numberOfRecordedFrames + frameOffsets[:-1]
+        ) % self.capacity
+        frameIsFirst: numpy.ndarray = numpy.empty(
+            (numberOfFrames, self.numberOfGames), dtype=bool
+        )
+        frameIsFirst[:-1] = self.isFirst[timeIndicies]
+        frameIsFirst[-1] = self.episodeEnded
+        frameIsFirst[: max(numberOfRecordedFrames - self.size, 0) + 1] = True
+        firstFrames: numpy.ndarray = (
+            numberOfFrames - 1 - frameIsFirst[::-1].argmax(axis=0)
+        )
+
+        frames: numpy.ndarray = numpy.concatenate(
+            (self.observations[timeIndicies], observation[None])
+        )
+        frameIndicies: numpy.ndarray = numpy.maximum(
+            frameOffsets[:, None], firstFrames[None, :]
+        )
+        return frames[
+            frameIndicies, numpy.arange(self.numberOfGames)[None, :]
+        ].swapaxes(0, 1)
+
+    def flush(self) -> None:
+        for array in (
+            self.observations,
+            self.actions,
+            self.rewards,
+            self.terminated,
+            self.truncated,
+            self.isFirst,
+        ):
+            if isinstance(array, numpy.memmap):
+                array.flush()
@@ -0,0 +1,115 @@
+import numpy
+from environment import Environment
+from snake import MapTemplate
+
+
+class VectorEnvironment:
+    def __init__(
+        self,
+        gameDimensions: list[int],
+        numberOfGames: int,
+        foodReward: float = 1.0,
+        deathReward: float = -1.0,
+        stepReward: float = 0.0,
+        maxEpisodeLength: int | None = None,
+        observationDtype: numpy.dtype = numpy.uint8,
+        seed: int | numpy.random.SeedSequence | None = None,
+        mapTemplate: MapTemplate | list[MapTemplate] | None = None,
+        templateIndicies: numpy.ndarray | None = None,
+        reverseMoveMode: str = "allow",
+        actionSpace: str = "absolute",
+    ) -> None:
+        self.gameDimensions: list[int] = gameDimensions
+        self.numberOfGames: int = numberOfGames
+        self.foodReward: float = foodReward
+        self.deathReward: float = deathReward
+        self.stepReward: float = stepReward
+        self.maxEpisodeLength: int | None = maxEpisodeLength
+
+        self.environment: Environment = Environment(
+            self.gameDimensions,
+            self.numberOfGames,
+            endedGameMode="reset",
+            observationDtype=observationDtype,
+            seed=seed,
+            mapTemplate=mapTemplate,
+            templateIndicies=templateIndicies,
+            reverseMoveMode=reverseMoveMode,
+            actionSpace=actionSpace,
+        )
+
+        self.observation: numpy.ndarray = numpy.zeros_like(self.environment.stateSpace)
+        self.finalObservation: numpy.ndarray = numpy.zeros_like(self.observation)
+        self.finalObservationMask: numpy.ndarray = numpy.zeros(
+            (self.numberOfGames), dtype=bool
+        )
+        self.foodLocation: numpy.ndarray = numpy.zeros(
+            (self.numberOfGames, 2), dtype=numpy.int16
+        )
+        self.legalMoveMask: numpy.ndarray = numpy.zeros(
+            (self.numberOfGames, self.environment.numberOfActions), dtype=bool
+        )
+        self.rewards: numpy.ndarray = numpy.zeros(
+            (self.numberOfGames), dtype=numpy.float32
+        )
+        self.truncated: numpy.ndarray = numpy.zeros((self.numberOfGames), dtype=bool)
+        self.episodeLength: numpy.ndarray = numpy.zeros((self.numberOfGames), dtype=int)
+
+    def reset(
+        self, seed: int | numpy.random.SeedSequence | None = None
+    ) -> tuple[numpy.ndarray, dict]:
+        if seed is not None:
+            self.environment.snake.seed(seed)
+
+        self.environment.reset()
+        self.episodeLength[:] = 0
+        self.environment.writeObservation(self.observation)
+        self.environment.getLegalMoveMask(self.legalMoveMask)
+        return self.observation, {"legalMoveMask": self.legalMoveMask}
+
+    def step(
+        self, actions: numpy.ndarray
+    ) -> tuple[numpy.ndarray, numpy.ndarray, numpy.ndarray, numpy.ndarray, dict]:
+        # Food of every game at the end of this step, taken before ended games are
+        # reset. Terminated games ate nothing, so they keep the food from before.
+        numpy.copyto(self.foodLocation, self.environment.snake.foodLocation)
+        terminated, snakeHitFoodMask, _ = self.environment.update(
+            actions, finalOut=self.finalObservation
+        )
+        numpy.copyto(
+            self.foodLocation,
+            self.environment.snake.foodLocation,
+            where=~terminated[:, None],
+        )
+
+        numpy.multiply(snakeHitFoodMask, self.foodReward, out=self.rewards)
+        numpy.add(self.rewards, self.deathReward, out=self.rewards, where=terminated)
+        self.rewards += self.stepReward
+
+        self.episodeLength += 1
+        if self.maxEpisodeLength is not None:
+            numpy.greater_equal(
+                self.episodeLength, self.maxEpisodeLength, out=self.truncated
+            )
+            self.truncated &= ~terminated
+            if self.truncated.any():
+                truncatedIndicies: numpy.ndarray = numpy.where(self.truncated)[0]
+                self.finalObservation[truncatedIndicies] = self.environment.stateSpace[
+                    truncatedIndicies
+                ]
+                self.environment.resetGames(truncatedIndicies)
+        numpy.logical_or(terminated, self.truncated, out=self.finalObservationMask)
+
+        info: dict = {
+            "snakeHitFood": snakeHitFoodMask,
+            "episodeLength": self.episodeLength.copy(),
+            "foodLocation": self.foodLocation,
+            "legalMoveMask": self.legalMoveMask,
+            "finalObservation": self.finalObservation,
+            "finalObservationMask": self.finalObservationMask,
+        }
+        self.episodeLength[self.finalObservationMask] = 0
+
+        self.environment.writeObservation(self.observation)
+        self.environment.getLegalMoveMask(self.legalMoveMask)
+        return self.observation, self.rewards, terminated, self.truncated, info